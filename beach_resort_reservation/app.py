@@ -1,34 +1,96 @@
+import argparse
+import csv
 import dataclasses
 import getpass
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Callable, List, Optional
 import json
 
 import requests
 import typeguard
-from dateutil.parser import parse
 from requests import Response
 from termcolor import colored
 from valid8 import ValidationError
 
 from beach_resort_reservation import app_utils, domain_utils
+from beach_resort_reservation.bulk_operations import import_reservations, iter_reservation_rows, \
+    ReservationFilter, select_reservation_ids, delete_reservations
+from beach_resort_reservation.decoding import ValidationLevel, reservation_decoder
 from beach_resort_reservation.domain import Username, Email, Password, NewReservation, ReservationID, NumberOfSeats, \
-    ReservedUmbrellaID, Price, ReservationFromServer
-from beach_resort_reservation.exceptions import IntegerInputException, DateInputException
+    ReservedUmbrellaID, ReservationFromServer
+from beach_resort_reservation.exceptions import IntegerInputException, DateInputException, ServerResponseException
+from beach_resort_reservation.instrumentation import Instrumentation
+from beach_resort_reservation.json_stream import iter_json_array, iter_response_chunks
+from beach_resort_reservation.local_storage import account_file, user_cache_directory
 from beach_resort_reservation.menu import Menu, Entry, Description
+from beach_resort_reservation.offline_store import OfflineStore, replay_pending_mutations, may_have_been_sent, \
+    CREATE_MUTATION
+from beach_resort_reservation.pagination import ReservationPager, ReservationPage, decode_reservation_page
+from beach_resort_reservation.profiling import ActionProfiler
+from beach_resort_reservation.reservation_cache import ReservationCache
+from beach_resort_reservation.reservation_printer import ReservationListPrinter
+from beach_resort_reservation.snapshot import ReservationSnapshot, read_snapshot, write_snapshot
+from beach_resort_reservation.single_flight import SingleFlight, SingleFlightStatistics
+from beach_resort_reservation.token_store import TokenStore, StoredToken
+from beach_resort_reservation.tracing import Tracer
+from beach_resort_reservation.transport import Transport, release_response
 
 
 @typeguard.typechecked
 class App:
     __delimiter: str = '\t'
+    __RESERVATION_LIST_KEY = ('GET', app_utils.RESERVATIONS_END_POINT)
 
     __logged: bool = False
     __api_key: Optional[str] = None
     __user_reservation: List[NewReservation] = dataclasses.field(default_factory=list)
 
-    def __init__(self):
-        self.__login_menu = Menu.Builder(Description(app_utils.APP_NAME_LOGIN)) \
+    def __init__(self, transport: Optional[Transport] = None,
+                 reservation_cache_ttl_seconds: float = app_utils.RESERVATION_CACHE_TTL_SECONDS,
+                 page_size: Optional[int] = app_utils.RESERVATION_PAGE_SIZE,
+                 instrumentation: Optional[Instrumentation] = None,
+                 offline_directory: Optional[Path] = None,
+                 snapshot_directory: Optional[Path] = None,
+                 token_store: Optional[TokenStore] = None,
+                 metrics_output: Optional[Path] = None,
+                 metrics_format: str = app_utils.METRICS_FORMATS[0],
+                 profile_directory: Optional[Path] = None,
+                 tracer: Optional[Tracer] = None,
+                 validation_level: ValidationLevel = ValidationLevel.STRICT):
+        if transport is None:
+            transport = Transport(timeout=app_utils.OFFLINE_REQUEST_TIMEOUT_SECONDS) \
+                if offline_directory is not None else Transport()
+        self.__transport = transport
+        self.__offline_directory = offline_directory
+        self.__offline_store: Optional[OfflineStore] = None
+        self.__next_offline_replay_at = 0.0
+        self.__snapshot_directory = snapshot_directory
+        self.__snapshot_path: Optional[Path] = None
+        self.__is_snapshot_shown = False
+        self.__token_store = token_store
+        self.__instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self.__transport.add_observer(self.__instrumentation.observe_request)
+        self.__tracer = tracer if tracer is not None else Tracer()
+        self.__decode_reservation = reservation_decoder(validation_level)
+        if self.__tracer.is_enabled:
+            self.__transport.add_observer(self.__tracer.observe_request)
+        self.__metrics_output = metrics_output
+        self.__metrics_format = metrics_format
+        self.__warm_up_executor = ThreadPoolExecutor(max_workers=1)
+        self.__warm_up: Optional[Future] = None
+        self.__authorized_at: Optional[float] = None
+        self.__reservation_cache = ReservationCache(ttl_seconds=reservation_cache_ttl_seconds)
+        self.__single_flight = SingleFlight()
+        self.__pager = ReservationPager(self.__fetch_reservation_page, page_size) if page_size is not None else None
+        self.__profiler = ActionProfiler(profile_directory) if profile_directory is not None else None
+        around_action = self.__profiler.around if self.__profiler is not None else lambda name, action: action()
+        if self.__tracer.is_enabled:
+            around_action = self.__traced(around_action)
+        self.__login_menu = Menu.Builder(Description(app_utils.APP_NAME_LOGIN), around_action=around_action) \
             .with_entry(Entry.create('1', 'Login', on_selected=lambda: self.__do_login())) \
             .with_entry(Entry.create('2', 'Register', on_selected=lambda: self.__do_registration())) \
             .with_entry(
@@ -37,17 +99,42 @@ class App:
                          is_exit=True)) \
             .build()
 
-        self.__menu = Menu.Builder(description=Description(app_utils.APP_NAME_MENU),
-                                   auto_select=lambda: self.__show_reservations()) \
+        menu_builder = Menu.Builder(description=Description(app_utils.APP_NAME_MENU),
+                                    auto_select=lambda: self.__show_reservations(),
+                                    around_action=around_action) \
             .with_entry(Entry.create('1', 'Make a new reservation', on_selected=lambda: self.__make_new_reservation())) \
             .with_entry(Entry.create('2', 'Delete a reservation', on_selected=lambda: self.__delete_reservation())) \
+            .with_entry(Entry.create('3', 'Import reservations from file',
+                                     on_selected=lambda: self.__import_reservations())) \
             .with_entry(Entry.create('4', 'Logout', on_selected=lambda: self.__do_logout())) \
+            .with_entry(Entry.create('5', 'Delete reservations in bulk',
+                                     on_selected=lambda: self.__bulk_delete_menu.run())) \
+            .with_entry(Entry.create('6', 'Refresh reservations',
+                                     on_selected=lambda: self.__refresh_reservations())) \
+            .with_entry(Entry.create('m', 'Export metrics', on_selected=lambda: self.__export_metrics(),
+                                     is_hidden=True))
+        if self.__pager is not None:
+            menu_builder.with_entry(Entry.create('7', 'Show more reservations',
+                                                 on_selected=lambda: self.__show_more_reservations()))
+        self.__menu = menu_builder \
             .with_entry(
             Entry.create('0', 'Exit',
                          on_selected=lambda: print(colored(app_utils.APP_EXIT_MESSAGE, app_utils.SUCCESS_ACTION_COLOR)),
                          is_exit=True)) \
             .build()
 
+        self.__bulk_delete_menu = Menu.Builder(description=Description(app_utils.APP_NAME_BULK_DELETE),
+                                               around_action=around_action) \
+            .with_entry(Entry.create('1', 'By id list', on_selected=lambda: self.__bulk_delete_by_id_list())) \
+            .with_entry(Entry.create('2', 'By id range', on_selected=lambda: self.__bulk_delete_by_id_range())) \
+            .with_entry(Entry.create('3', 'By umbrella and dates', on_selected=lambda: self.__bulk_delete_by_filter())) \
+            .with_entry(Entry.create('0', 'Back', is_exit=True)) \
+            .build()
+
+    def __traced(self, around_action: Callable[[str, Callable[[], None]], None]) \
+            -> Callable[[str, Callable[[], None]], None]:
+        return lambda name, action: self.__tracer.around(name, lambda: around_action(name, action))
+
     def __do_login(self):
 
         username: str = input('Username: ')
@@ -58,22 +145,159 @@ class App:
         if login_response.status_code != 200 or login_response.json()['key'] is None:
             print(colored(app_utils.LOGIN_FAILED, app_utils.FAIL_ACTION_COLOR))
         else:
+            self.__start_session(login_response.json()['key'], username)
             print(colored(app_utils.LOGIN_OK_WELCOME, app_utils.SUCCESS_ACTION_COLOR))
-            self.__api_key = login_response.json()['key']
             self.__login_menu.stop()
             self.__menu.run()
 
-    @staticmethod
-    def do_login_request(username: str, password: str):
-        login_response = requests.post(url=f'{app_utils.API_SERVER}{app_utils.LOGIN_END_POINT}',
-                                       data={'username': username, 'password': password})
+    def __start_session(self, api_key: str, account: str):
+        self.__api_key = api_key
+        self.__transport.authorize(api_key)
+        if self.__token_store is not None:
+            self.__token_store.save(StoredToken(account=account, key=api_key))
+        if self.__offline_directory is not None:
+            self.__open_offline_store(account)
+        if self.__snapshot_directory is not None:
+            self.__load_snapshot(account)
+        self.__authorized_at = time.perf_counter()
+        self.__warm_up = self.__warm_up_executor.submit(self.__warm_up_reservations)
+
+    def __warm_up_reservations(self):
+        try:
+            if self.__pager is not None:
+                generation = self.__reservation_cache.generation
+                self.__pager.reset()
+                self.__reservation_cache.store(self.__pager.next_page().reservations, generation=generation)
+            else:
+                self.__single_flight.do(self.__RESERVATION_LIST_KEY, lambda: self.__fetch_reservation_list(
+                    lambda reservation: None))
+        except (requests.RequestException, ServerResponseException, ValidationError, KeyError, TypeError,
+                ValueError) as error:
+            self.__count_warm_up_failure(error, expected=True)
+        except Exception as error:
+            self.__count_warm_up_failure(error, expected=False)
+
+    def __count_warm_up_failure(self, error: Exception, expected: bool):
+        self.__instrumentation.increment(app_utils.METRIC_WARM_UP_FAILURES,
+                                         {'error': type(error).__name__, 'expected': str(expected).lower()})
+
+    def __refresh_in_background(self):
+        if self.__warm_up is None or self.__warm_up.done():
+            self.__warm_up = self.__warm_up_executor.submit(self.__warm_up_reservations)
+
+    def __resume_session(self) -> bool:
+        stored_token = self.__token_store.load() if self.__token_store is not None else None
+        if stored_token is None:
+            return False
+        self.__transport.authorize(stored_token.key)
+        try:
+            validation_response = self.do_token_validation_request()
+            release_response(validation_response)
+        except requests.RequestException:
+            self.__transport.deauthorize()
+            return False
+        if validation_response.status_code != 200:
+            self.__transport.deauthorize()
+            if validation_response.status_code in (401, 403):
+                self.__token_store.clear()
+            return False
+        self.__start_session(stored_token.key, stored_token.account)
+        print(colored(app_utils.SESSION_RESUMED_WELCOME, app_utils.SUCCESS_ACTION_COLOR))
+        return True
+
+    def do_token_validation_request(self):
+        validation_response = self.__transport.head(app_utils.RESERVATIONS_END_POINT)
+        return validation_response
+
+    def __open_offline_store(self, account: str):
+        self.__offline_store = OfflineStore(str(account_file(self.__offline_directory, account,
+                                                             app_utils.OFFLINE_STORE_SUFFIX)))
+        self.__reservation_cache.persist_to(self.__offline_store)
+
+    def __load_snapshot(self, account: str):
+        self.__snapshot_path = account_file(self.__snapshot_directory, account, app_utils.SNAPSHOT_SUFFIX)
+        snapshot = read_snapshot(self.__snapshot_path)
+        if snapshot is not None:
+            self.__reservation_cache.store(snapshot.reservations, etag=snapshot.etag,
+                                           last_modified=snapshot.last_modified)
+            self.__reservation_cache.invalidate()
+            self.__is_snapshot_shown = True
+
+    def __save_snapshot(self):
+        reservations = self.__reservation_cache.reservations
+        if self.__snapshot_path is not None and reservations is not None:
+            snapshot = ReservationSnapshot(reservations, etag=self.__reservation_cache.etag,
+                                           last_modified=self.__reservation_cache.last_modified)
+            write_snapshot(self.__snapshot_path, snapshot)
+        self.__snapshot_path = None
+        self.__is_snapshot_shown = False
+
+    def __close_offline_store(self):
+        self.__reservation_cache.persist_to(None)
+        if self.__offline_store is not None:
+            self.__offline_store.close()
+            self.__offline_store = None
+        self.__next_offline_replay_at = 0.0
+
+    def __send_or_queue(self, send: Callable[[], Response], queue: Callable[[], None],
+                        is_repeatable: bool = True) -> Optional[Response]:
+        try:
+            return send()
+        except (requests.ConnectionError, requests.Timeout) as error:
+            if self.__offline_store is None:
+                raise
+            if not is_repeatable and may_have_been_sent(error):
+                self.__reservation_cache.invalidate()
+                print(colored(app_utils.NEW_RESERVATION_OUTCOME_UNKNOWN, app_utils.FAIL_ACTION_COLOR))
+                return None
+            queue()
+            print(colored(app_utils.OFFLINE_CHANGE_QUEUED, app_utils.SUCCESS_ACTION_COLOR))
+            return None
+
+    def __synchronize_offline_changes(self):
+        if self.__offline_store is None or time.monotonic() < self.__next_offline_replay_at or \
+                not self.__offline_store.pending_mutations(1):
+            return
+        self.__wait_for_warm_up()
+        report = replay_pending_mutations(self.__offline_store, self.do_new_reservation_request,
+                                          self.do_reservation_delete_request)
+        self.__next_offline_replay_at = 0.0 if report.is_complete \
+            else time.monotonic() + app_utils.OFFLINE_REPLAY_RETRY_SECONDS
+        for mutation, response in report.applied:
+            if mutation.kind == CREATE_MUTATION:
+                self.__cache_created_reservation(response)
+        for mutation, response in report.conflicts:
+            if mutation.kind == CREATE_MUTATION:
+                self.__validate_new_reservation_response(response)
+            else:
+                self.__validate_delete_response(response, mutation.reservation_id)
+        if report.applied or report.conflicts:
+            print(colored(app_utils.OFFLINE_SYNC_SUMMARY.format(applied=len(report.applied),
+                                                                conflicts=len(report.conflicts)),
+                          app_utils.SUCCESS_ACTION_COLOR if not report.conflicts else app_utils.FAIL_ACTION_COLOR))
+        if report.unknown:
+            self.__reservation_cache.invalidate()
+            print(colored(app_utils.OFFLINE_SYNC_OUTCOME_UNKNOWN.format(unknown=len(report.unknown)),
+                          app_utils.FAIL_ACTION_COLOR))
+        if not report.is_complete:
+            print(colored(app_utils.OFFLINE_PENDING_CHANGES.format(
+                pending=len(self.__offline_store.pending_mutations())), app_utils.FAIL_ACTION_COLOR))
+
+    def __wait_for_warm_up(self):
+        warm_up, self.__warm_up = self.__warm_up, None
+        if warm_up is not None:
+            warm_up.result()
+
+    def do_login_request(self, username: str, password: str):
+        login_response = self.__transport.post(app_utils.LOGIN_END_POINT,
+                                               data={'username': username, 'password': password})
         return login_response
 
     def __do_registration(self):
         email, password, repeated_password, username = self.__read_registration_fields_from_user_input()
         if password is not None and repeated_password is not None:
             registration_response = self.do_registration_request(username, password, repeated_password, email)
-            self.__validate_registration_response(registration_response)
+            self.__validate_registration_response(registration_response, username)
 
     def __read_registration_fields_from_user_input(self):
 
@@ -96,15 +320,15 @@ class App:
 
         return email, password, repeated_password, username
 
-    @staticmethod
-    def do_registration_request(username: Username, password: Password, repeated_password: Password,
+    def do_registration_request(self, username: Username, password: Password, repeated_password: Password,
                                 email: Email):
-        registration_response = requests.post(url=f'{app_utils.API_SERVER}{app_utils.REGISTRATION_END_POINT}',
-                                              data={'username': username.value, 'password1': password.value,
-                                                    'password2': repeated_password.value, 'email': email.value})
+        registration_response = self.__transport.post(app_utils.REGISTRATION_END_POINT,
+                                                      data={'username': username.value, 'password1': password.value,
+                                                            'password2': repeated_password.value,
+                                                            'email': email.value})
         return registration_response
 
-    def __validate_registration_response(self, registration_response: Response):
+    def __validate_registration_response(self, registration_response: Response, username: Username):
 
         response_json: json = registration_response.json()
         if registration_response.status_code != 201 or registration_response.json()['key'] is None:
@@ -114,8 +338,8 @@ class App:
                 self.__show_registration_tips_to_fix_errors_to_user(response_json)
 
         else:
+            self.__start_session(response_json['key'], username.value)
             print(colored(app_utils.REGISTRATION_OK_WELCOME, app_utils.SUCCESS_ACTION_COLOR))
-            self.__api_key = response_json['key']
             self.__login_menu.stop()
             self.__menu.run()
 
@@ -139,20 +363,34 @@ class App:
                 print('\t' + colored(elem, app_utils.FAIL_ACTION_COLOR))
 
     def __make_new_reservation(self):
-        new_reservation: NewReservation = self.__read_new_reservation_from_user_input()
-        if new_reservation is not None:
-            new_reservation_response = self.do_new_reservation_request(new_reservation)
-            self.__validate_new_reservation_response(new_reservation_response)
+        with self.__tracer.span('read new reservation', 'input'):
+            new_reservation: NewReservation = self.__read_new_reservation_from_user_input()
+        if new_reservation is not None and not self.__is_overlapping(new_reservation):
+            new_reservation_response = self.__send_or_queue(
+                lambda: self.do_new_reservation_request(new_reservation),
+                lambda: self.__offline_store.enqueue_create(new_reservation), is_repeatable=False)
+            if new_reservation_response is not None:
+                with self.__tracer.span('handle response', 'render', {'status': new_reservation_response.status_code}):
+                    self.__validate_new_reservation_response(new_reservation_response)
+
+    def __is_overlapping(self, new_reservation: NewReservation) -> bool:
+        with self.__tracer.span('check overlaps', 'cache'):
+            overlapping_ids = self.__reservation_cache.overlapping(new_reservation)
+        if overlapping_ids:
+            print(colored(app_utils.NEW_RESERVATION_OVERLAPS.format(ids=', '.join(map(str, overlapping_ids))),
+                          app_utils.FAIL_ACTION_COLOR))
+        return len(overlapping_ids) > 0
 
     def __read_new_reservation_from_user_input(self) -> NewReservation:
-        reserved_umbrella_id: ReservedUmbrellaID = self.__ask_until_provided_field(ReservedUmbrellaID,
+        reserved_umbrella_id: ReservedUmbrellaID = self.__ask_until_provided_field(ReservedUmbrellaID.of,
                                                                                    'Choose the umbrella id: ',
                                                                                    'umbrella_id')
         number_of_seats: NumberOfSeats = \
-            self.__ask_until_provided_field(NumberOfSeats, f'How many seats you want to have in your umbrella? '
-                                                           f'Take in mind that the minimum is '
-                                                           f'{domain_utils.MIN_NUMBER_OF_SEATS} and the maximum is '
-                                                           f'{domain_utils.MAX_NUMBER_OF_SEATS}: ', 'number_of_seats')
+            self.__ask_until_provided_field(NumberOfSeats.of, f'How many seats you want to have in your umbrella? '
+                                                              f'Take in mind that the minimum is '
+                                                              f'{domain_utils.MIN_NUMBER_OF_SEATS} and the maximum is '
+                                                              f'{domain_utils.MAX_NUMBER_OF_SEATS}: ',
+                                            'number_of_seats')
         reservation_start_date: datetime.date = \
             self.__ask_until_provided_field(self.__read_date_from_user, f'Insert the start date of the reservation '
                                                                         f'(in the format yyyy-mm-dd ): ',
@@ -171,9 +409,8 @@ class App:
             print(colored(e.help_msg, app_utils.FAIL_ACTION_COLOR))
 
     def do_new_reservation_request(self, new_reservation: NewReservation):
-        new_reservation_response = requests.post(
-            url=f'{app_utils.API_SERVER}{app_utils.RESERVATIONS_END_POINT}',
-            headers={'Authorization': f'Token {self.__api_key}'},
+        new_reservation_response = self.__transport.post(
+            app_utils.RESERVATIONS_END_POINT,
             data={'number_of_seats': new_reservation.number_of_seats.value,
                   'reservation_start_date': new_reservation.start_date,
                   'reservation_end_date': new_reservation.end_date,
@@ -187,100 +424,372 @@ class App:
             self.__show_new_reservation_tips_to_fix_errors_to_user(new_reservation_response_json)
         else:
             print(colored(app_utils.NEW_RESERVATION_CORRECTLY_ADDED, app_utils.SUCCESS_ACTION_COLOR))
+            self.__cache_created_reservation(new_reservation_response)
+
+    def __cache_created_reservation(self, new_reservation_response: Response):
+        try:
+            with self.__tracer.span('decode json', 'decode'):
+                reservation_json = new_reservation_response.json()
+            with self.__tracer.span('build reservation', 'domain'):
+                reservation = self.__decode_reservation(reservation_json)
+            self.__reservation_cache.add(reservation)
+        except (ValueError, KeyError, TypeError):
+            self.__reservation_cache.invalidate()
 
     @staticmethod
     def __show_new_reservation_tips_to_fix_errors_to_user(response_json: json):
         print(colored('This could help you:', app_utils.FAIL_ACTION_COLOR))
-        if 'number_of_seats' in response_json:
-            print(colored('\tThere is a problem with the number of seats:', app_utils.FAIL_ACTION_COLOR))
-            for elem in response_json['number_of_seats']:
-                print('\t\t' + colored(elem, app_utils.FAIL_ACTION_COLOR))
-        if 'reservation_start_date' in response_json:
-            print(colored('\tThere is a problem with the reservation start date:', app_utils.FAIL_ACTION_COLOR))
-            for elem in response_json['reservation_start_date']:
-                print('\t\t' + colored(elem, app_utils.FAIL_ACTION_COLOR))
-        if 'reservation_end_date' in response_json:
-            print(colored('\tThere is a problem with the reservation end date:', app_utils.FAIL_ACTION_COLOR))
-            for elem in response_json['reservation_end_date']:
-                print('\t\t' + colored(elem, app_utils.FAIL_ACTION_COLOR))
-        if 'reserved_umbrella_id' in response_json:
-            print(colored('\tThere is a problem with the umbrella you choose:', app_utils.FAIL_ACTION_COLOR))
-            for elem in response_json['reserved_umbrella_id']:
-                print('\t\t' + colored(elem, app_utils.FAIL_ACTION_COLOR))
+        for error_field, error_title in app_utils.NEW_RESERVATION_ERROR_FIELDS.items():
+            if error_field in response_json:
+                print(colored(f'\t{error_title}', app_utils.FAIL_ACTION_COLOR))
+                for elem in response_json[error_field]:
+                    print('\t\t' + colored(elem, app_utils.FAIL_ACTION_COLOR))
+
+    def __import_reservations(self):
+        path: str = input('Insert the path of the CSV or JSONL file to import: ').strip()
+        try:
+            rows = iter_reservation_rows(path)
+        except OSError:
+            print(colored(app_utils.BULK_IMPORT_FILE_NOT_FOUND, app_utils.FAIL_ACTION_COLOR))
+            return
+        created: int = 0
+        total: int = 0
+        try:
+            for result in import_reservations(rows, self.do_new_reservation_request):
+                total += 1
+                if result.is_created:
+                    created += 1
+                    print(colored(f'Row {result.row_number}: {app_utils.BULK_IMPORT_ROW_CREATED}',
+                                  app_utils.SUCCESS_ACTION_COLOR))
+                else:
+                    print(colored(f'Row {result.row_number}: {app_utils.NEW_RESERVATION_FAILED}',
+                                  app_utils.FAIL_ACTION_COLOR))
+                    self.__show_new_reservation_tips_to_fix_errors_to_user(result.errors)
+        except (OSError, UnicodeDecodeError):
+            print(colored(app_utils.BULK_IMPORT_INTERRUPTED.format(processed=total), app_utils.FAIL_ACTION_COLOR))
+        except csv.Error:
+            print(colored(app_utils.BULK_IMPORT_MALFORMED_FILE.format(processed=total), app_utils.FAIL_ACTION_COLOR))
+        if created > 0:
+            self.__reservation_cache.invalidate()
+        print(colored(app_utils.BULK_IMPORT_SUMMARY.format(created=created, total=total),
+                      app_utils.SUCCESS_ACTION_COLOR if created == total else app_utils.FAIL_ACTION_COLOR))
 
     def __delete_reservation(self):
         reservation_id = self.__ask_until_provided_field(ReservationID,
                                                          'Insert the id of the reservation you want to delete: ',
                                                          'reservation_id')
 
-        reservation_delete_response = self.do_reservation_delete_request(reservation_id)
-        self.__validate_delete_response(reservation_delete_response=reservation_delete_response,
-                                        reservation_id=reservation_id)
+        reservation_delete_response = self.__send_or_queue(
+            lambda: self.do_reservation_delete_request(reservation_id),
+            lambda: self.__queue_delete(reservation_id))
+        if reservation_delete_response is not None:
+            with self.__tracer.span('handle response', 'render', {'status': reservation_delete_response.status_code}):
+                self.__validate_delete_response(reservation_delete_response=reservation_delete_response,
+                                                reservation_id=reservation_id)
+
+    def __queue_delete(self, reservation_id: ReservationID):
+        self.__offline_store.enqueue_delete(reservation_id)
+        self.__reservation_cache.remove(reservation_id)
 
     def do_reservation_delete_request(self, reservation_id_to_delete: ReservationID):
-        reservation_delete_response = requests.delete(
-            url=f'{app_utils.API_SERVER}{app_utils.RESERVATIONS_END_POINT}{reservation_id_to_delete.value}/',
-            headers={'Authorization': f'Token {self.__api_key}'})
+        reservation_delete_response = self.__transport.delete(
+            f'{app_utils.RESERVATIONS_END_POINT}{reservation_id_to_delete.value}/')
         return reservation_delete_response
 
-    @staticmethod
-    def __validate_delete_response(reservation_delete_response: Response, reservation_id: ReservationID):
-        if reservation_delete_response.status_code != 200 and reservation_delete_response.status_code != 204 and \
-                reservation_delete_response.status_code != 202:
+    def __validate_delete_response(self, reservation_delete_response: Response, reservation_id: ReservationID):
+        if reservation_delete_response.status_code not in app_utils.DELETE_OK_STATUS_CODES:
             if reservation_delete_response.status_code == 404:
                 print(colored(app_utils.DELETE_FAILED_ID_NOT_FOUND, app_utils.FAIL_ACTION_COLOR))
+                self.__reservation_cache.remove(reservation_id)
             else:
                 print(colored(app_utils.DELETE_FAILED, app_utils.FAIL_ACTION_COLOR))
         else:
             print(colored(f'Reservation with id: {reservation_id.value}{app_utils.DELETE_OK}',
                           app_utils.SUCCESS_ACTION_COLOR))
+            self.__reservation_cache.remove(reservation_id)
+
+    def __bulk_delete_by_id_list(self):
+        self.__bulk_delete_menu.stop()
+        ids_str: str = input('Insert the ids of the reservations you want to delete, separated by commas: ')
+        try:
+            reservation_ids = [ReservationID(int(id_str)) for id_str in ids_str.split(',') if id_str.strip()]
+        except ValueError:
+            print(colored(app_utils.INT_FIELD_ERROR, app_utils.FAIL_ACTION_COLOR))
+            return
+        except ValidationError as validation_error:
+            print(colored(validation_error.help_msg, app_utils.FAIL_ACTION_COLOR))
+            return
+        self.__bulk_delete(reservation_ids)
+
+    def __bulk_delete_by_id_range(self):
+        self.__bulk_delete_menu.stop()
+        first_id: ReservationID = self.__ask_until_provided_field(ReservationID, 'Insert the first id of the range: ',
+                                                                  'reservation_id')
+        last_id: ReservationID = self.__ask_until_provided_field(ReservationID, 'Insert the last id of the range: ',
+                                                                 'reservation_id')
+        reservations = self.__retrieve_reservations()
+        if reservations is not None:
+            self.__bulk_delete(select_reservation_ids(reservations, first_id=first_id, last_id=last_id))
+
+    def __bulk_delete_by_filter(self):
+        self.__bulk_delete_menu.stop()
+        try:
+            umbrella_id_str: str = input('Insert the umbrella id (leave it empty for any umbrella): ').strip()
+            umbrella_id = ReservedUmbrellaID.of(int(umbrella_id_str)) if umbrella_id_str else None
+        except ValueError:
+            print(colored(app_utils.INT_FIELD_ERROR, app_utils.FAIL_ACTION_COLOR))
+            return
+        except ValidationError as validation_error:
+            print(colored(validation_error.help_msg, app_utils.FAIL_ACTION_COLOR))
+            return
+        dates = []
+        for prompt in ('Insert the first date of the window (in the format yyyy-mm-dd, leave it empty for none): ',
+                       'Insert the last date of the window (in the format yyyy-mm-dd, leave it empty for none): '):
+            date_str: str = input(prompt).strip()
+            date = self.__read_date_from_user(date_str) if date_str else None
+            if date_str and date is None:
+                print(colored(app_utils.DATE_CREATION_ERROR, app_utils.FAIL_ACTION_COLOR))
+                return
+            dates.append(date.date() if date is not None else None)
+        reservations = self.__retrieve_reservations()
+        if reservations is not None:
+            reservation_filter = ReservationFilter(umbrella_id=umbrella_id, from_date=dates[0], to_date=dates[1])
+            self.__bulk_delete(select_reservation_ids(reservations, reservation_filter=reservation_filter))
+
+    def __bulk_delete(self, reservation_ids: List[ReservationID]):
+        if not reservation_ids:
+            print(colored(app_utils.BULK_DELETE_NOTHING_SELECTED, app_utils.FAIL_ACTION_COLOR))
+            return
+        answer: str = input(app_utils.BULK_DELETE_CONFIRMATION.format(count=len(reservation_ids)))
+        if answer.strip().lower() not in app_utils.CONFIRMATION_ANSWERS:
+            print(colored(app_utils.BULK_DELETE_CANCELLED, app_utils.FAIL_ACTION_COLOR))
+            return
+        summary = delete_reservations(reservation_ids, self.do_reservation_delete_request)
+        for reservation_id in summary.deleted + summary.not_found:
+            self.__reservation_cache.remove(reservation_id)
+        print(colored(app_utils.BULK_DELETE_SUMMARY.format(deleted=len(summary.deleted),
+                                                           not_found=len(summary.not_found),
+                                                           failed=len(summary.failed)),
+                      app_utils.SUCCESS_ACTION_COLOR if len(summary.deleted) == len(reservation_ids)
+                      else app_utils.FAIL_ACTION_COLOR))
+        if summary.not_found:
+            print(colored(app_utils.BULK_DELETE_NOT_FOUND_IDS.format(ids=', '.join(map(str, summary.not_found))),
+                          app_utils.FAIL_ACTION_COLOR))
+        if summary.failed:
+            print(colored(app_utils.BULK_DELETE_FAILED_IDS.format(ids=', '.join(map(str, summary.failed))),
+                          app_utils.FAIL_ACTION_COLOR))
 
     def __show_reservations(self):
-        reservation_list_response = self.do_retrieve_reservation_list_request()
-        self.__validate_reservation_list_response(reservation_list_response)
+        self.__synchronize_offline_changes()
+        printer = ReservationListPrinter()
+        if self.__load_reservations(printer.print_reservation):
+            printer.finish()
+            if self.__authorized_at is not None:
+                self.__instrumentation.observe(app_utils.METRIC_TIME_TO_FIRST_TABLE,
+                                               time.perf_counter() - self.__authorized_at)
+                self.__authorized_at = None
+            if self.__pager is not None and self.__pager.has_next:
+                print(colored(app_utils.MORE_RESERVATIONS_AVAILABLE.format(
+                    shown=len(self.__reservation_cache.reservations),
+                    total=self.__pager.total if self.__pager.total is not None else '?'),
+                    app_utils.SUCCESS_ACTION_COLOR))
+
+    def __show_more_reservations(self):
+        if not self.__pager.has_next:
+            print(colored(app_utils.NO_MORE_RESERVATIONS, app_utils.FAIL_ACTION_COLOR))
+            return
+        page = self.__next_reservation_page()
+        if page is not None:
+            for reservation in page.reservations:
+                self.__reservation_cache.add(reservation)
+
+    def __retrieve_reservations(self) -> Optional[List[ReservationFromServer]]:
+        reservations: List[ReservationFromServer] = []
+        if not self.__load_reservations(reservations.append):
+            return None
+        while self.__pager is not None and self.__pager.has_next:
+            page = self.__next_reservation_page()
+            if page is None:
+                return None
+            for reservation in page.reservations:
+                self.__reservation_cache.add(reservation)
+            reservations.extend(page.reservations)
+        return reservations
+
+    def __load_reservations(self, on_reservation: Callable[[ReservationFromServer], None]) -> bool:
+        try:
+            reservations = self.__cached_reservations()
+            if reservations is None and self.__pager is not None:
+                reservations = self.__first_reservation_page()
+            elif reservations is None:
+                reservations, is_shared = self.__single_flight.do(
+                    self.__RESERVATION_LIST_KEY, lambda: self.__fetch_reservation_list(on_reservation))
+                if not is_shared:
+                    return True
+        except ServerResponseException as server_exception:
+            print(colored(server_exception.help_msg, app_utils.FAIL_ACTION_COLOR))
+            return False
+        except (requests.ConnectionError, requests.Timeout):
+            if self.__offline_store is None:
+                raise
+            print(colored(app_utils.OFFLINE_SHOWING_STORED_RESERVATIONS, app_utils.FAIL_ACTION_COLOR))
+            reservations = self.__offline_store.reservations()
+        if reservations is None:
+            return False
+        for reservation in reservations:
+            on_reservation(reservation)
+        return True
+
+    def __cached_reservations(self) -> Optional[List[ReservationFromServer]]:
+        if self.__reservation_cache.is_fresh():
+            self.__is_snapshot_shown = False
+            return self.__reservation_cache.reservations
+        stale_reservations = self.__stale_reservations()
+        if stale_reservations is not None:
+            self.__refresh_in_background()
+            print(colored(app_utils.STALE_RESERVATIONS, app_utils.FAIL_ACTION_COLOR))
+            return stale_reservations
+        self.__wait_for_warm_up()
+        return self.__reservation_cache.reservations if self.__reservation_cache.is_fresh() else None
+
+    def __stale_reservations(self) -> Optional[List[ReservationFromServer]]:
+        if self.__offline_store is not None:
+            return self.__offline_store.reservations() or None
+        if self.__is_snapshot_shown:
+            return self.__reservation_cache.reservations
+        return None
+
+    def __refresh_reservations(self):
+        self.__next_offline_replay_at = 0.0
+        self.__is_snapshot_shown = False
+        self.__reservation_cache.invalidate()
+
+    def __first_reservation_page(self) -> Optional[List[ReservationFromServer]]:
+        generation = self.__reservation_cache.generation
+        self.__pager.reset()
+        page = self.__next_reservation_page()
+        if page is None:
+            return None
+        self.__reservation_cache.store(page.reservations, generation=generation)
+        return page.reservations
 
-    def do_retrieve_reservation_list_request(self):
+    def __next_reservation_page(self) -> Optional[ReservationPage]:
+        self.__wait_for_warm_up()
+        try:
+            return self.__pager.next_page()
+        except ServerResponseException as server_exception:
+            print(colored(server_exception.help_msg, app_utils.FAIL_ACTION_COLOR))
+            return None
 
-        reservation_response = requests.get(url=f'{app_utils.API_SERVER}{app_utils.RESERVATIONS_END_POINT}',
-                                            headers={'Authorization': f'Token {self.__api_key}'})
+    def __fetch_reservation_page(self, offset: int, limit: int) -> ReservationPage:
+        page, _ = self.__single_flight.do((*self.__RESERVATION_LIST_KEY, offset, limit),
+                                          lambda: self.__retrieve_reservation_page(offset, limit))
+        return page
+
+    def __retrieve_reservation_page(self, offset: int, limit: int) -> ReservationPage:
+        reservation_page_response = self.do_retrieve_reservation_list_request(offset=offset, limit=limit)
+        if reservation_page_response.status_code != 200:
+            release_response(reservation_page_response)
+            raise ServerResponseException(reservation_page_response.status_code,
+                                          app_utils.RESERVATION_LIST_RETRIEVE_FAILED)
+        with self.__instrumentation.histogram_timer(app_utils.METRIC_PARSE_SECONDS,
+                                                    {'route': app_utils.RESERVATIONS_END_POINT}):
+            with self.__tracer.span('decode json', 'decode'):
+                page_json = reservation_page_response.json()
+            with self.__tracer.span('build reservations', 'domain', {'offset': offset}):
+                return decode_reservation_page(page_json, offset, self.__decode_reservation)
+
+    def do_retrieve_reservation_list_request(self, offset: Optional[int] = None, limit: Optional[int] = None):
+
+        if limit is not None:
+            return self.__transport.get(app_utils.RESERVATIONS_END_POINT,
+                                        params={'offset': offset if offset is not None else 0, 'limit': limit})
+        reservation_response = self.__transport.get(app_utils.RESERVATIONS_END_POINT,
+                                                    headers=self.__reservation_cache.validators(), stream=True)
         return reservation_response
 
-    def __validate_reservation_list_response(self, reservation_list_response: Response):
-
+    def __fetch_reservation_list(self, on_reservation: Callable[[ReservationFromServer], None]) \
+            -> List[ReservationFromServer]:
+        generation = self.__reservation_cache.generation
+        reservation_list_response = self.do_retrieve_reservation_list_request()
+        return self.__validate_reservation_list_response(reservation_list_response, on_reservation, generation)
+
+    def __validate_reservation_list_response(self, reservation_list_response: Response,
+                                             on_reservation: Callable[[ReservationFromServer], None],
+                                             generation: Optional[int] = None) -> List[ReservationFromServer]:
+
+        if reservation_list_response.status_code == 304 and self.__reservation_cache.reservations is not None:
+            release_response(reservation_list_response)
+            self.__reservation_cache.revalidated()
+            reservations = self.__reservation_cache.reservations
+            for reservation in reservations:
+                on_reservation(reservation)
+            return reservations
         if reservation_list_response.status_code != 200:
-            print(colored(app_utils.RESERVATION_LIST_RETRIEVE_FAILED, app_utils.FAIL_ACTION_COLOR))
-        else:
-            response_json: json = reservation_list_response.json()
-            self.__print_reservation_list(response_json)
-
-    def __print_reservation_list(self, response_json: json):
-        if len(response_json) > 0:
-            print_separator: () = lambda: print('-' * 150)
-            print_separator()
-
-            print(app_utils.RESERVATION_FORMATTER % (
-                'Reservation ID', 'Reserved umbrella ID', 'Number of seats', 'From', 'To', 'Reservation price'))
-            print_separator()
-            for elem in response_json:
-                reservation: ReservationFromServer = self.__create_reservation_from_json_object(elem)
-                print(app_utils.RESERVATION_FORMATTER % (
-                    reservation.id.value, reservation.umbrella_id.value,
-                    reservation.number_of_seats.value,
-                    reservation.start_date, reservation.end_date,
-                    reservation.price))
-            print_separator()
-        else:
-            print()
-            print(app_utils.NO_RESERVATION_FOUND_FOR_USER)
-            print()
+            release_response(reservation_list_response)
+            raise ServerResponseException(reservation_list_response.status_code,
+                                          app_utils.RESERVATION_LIST_RETRIEVE_FAILED)
+        return self.__decode_reservation_list(reservation_list_response, on_reservation, generation)
+
+    def __decode_reservation_list(self, reservation_list_response: Response,
+                                  on_reservation: Callable[[ReservationFromServer], None],
+                                  generation: Optional[int] = None) -> List[ReservationFromServer]:
+        reservations: List[ReservationFromServer] = []
+        build_seconds = render_seconds = 0.0
+        try:
+            with self.__tracer.span('decode reservation list', 'decode') as span_args, \
+                    self.__instrumentation.histogram_timer(app_utils.METRIC_PARSE_SECONDS,
+                                                           {'route': app_utils.RESERVATIONS_END_POINT}):
+                decode_started_at = time.perf_counter()
+                for elem in iter_json_array(iter_response_chunks(reservation_list_response)):
+                    started_at = time.perf_counter()
+                    reservation: ReservationFromServer = self.__decode_reservation(elem)
+                    built_at = time.perf_counter()
+                    reservations.append(reservation)
+                    on_reservation(reservation)
+                    build_seconds += built_at - started_at
+                    render_seconds += time.perf_counter() - built_at
+                span_args.update(rows=len(reservations), build_ms=build_seconds * 1000,
+                                 render_ms=render_seconds * 1000,
+                                 json_decode_ms=(time.perf_counter() - decode_started_at - build_seconds
+                                                 - render_seconds) * 1000)
+        finally:
+            reservation_list_response.close()
+        self.__reservation_cache.store(reservations, etag=reservation_list_response.headers.get('ETag'),
+                                       last_modified=reservation_list_response.headers.get('Last-Modified'),
+                                       generation=generation)
+        return reservations
+
+    @property
+    def single_flight_statistics(self) -> SingleFlightStatistics:
+        return self.__single_flight.statistics
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self.__instrumentation
+
+    def __export_metrics(self):
+        path = self.__metrics_output if self.__metrics_output is not None \
+            else Path(app_utils.METRICS_DEFAULT_PATHS[self.__metrics_format])
+        self.__update_counters()
+        try:
+            self.__instrumentation.write(str(path), self.__metrics_format)
+        except OSError as error:
+            print(colored(str(error), app_utils.FAIL_ACTION_COLOR))
+            return
+        print(colored(app_utils.METRICS_EXPORTED.format(path=path), app_utils.SUCCESS_ACTION_COLOR))
+
+    def __update_counters(self):
+        statistics = self.__single_flight.statistics
+        self.__instrumentation.set_counter(app_utils.METRIC_SINGLE_FLIGHT_CALLS, statistics.calls)
+        self.__instrumentation.set_counter(app_utils.METRIC_SINGLE_FLIGHT_SAVED, statistics.saved)
 
     def __do_logout(self):
         logout_response = self.do_logout_request()
         self.__validate_logout_response(logout_response)
 
     def do_logout_request(self):
-        logout_response = requests.post(url=f'{app_utils.API_SERVER}/auth/logout/',
-                                        headers={'Authorization': f'Token {self.__api_key}'})
+        logout_response = self.__transport.post(app_utils.LOGOUT_END_POINT)
         return logout_response
 
     def __validate_logout_response(self, logout_response: Response):
@@ -289,27 +798,20 @@ class App:
         else:
             print(colored(app_utils.LOGGED_OUT_MESSAGE, app_utils.SUCCESS_ACTION_COLOR))
             self.__menu.stop()
+            self.__wait_for_warm_up()
+            self.__authorized_at = None
+            self.__transport.deauthorize()
+            if self.__token_store is not None:
+                self.__token_store.clear()
+            self.__save_snapshot()
+            self.__close_offline_store()
+            self.__reservation_cache.clear()
+            if self.__pager is not None:
+                self.__pager.reset()
             self.__login_menu.run()
             # optional
             self.__api_key = None
 
-    @staticmethod
-    def __create_reservation_from_json_object(elem: json):
-        reservation_id: ReservationID = ReservationID(elem['id'])
-        number_of_seats: NumberOfSeats = NumberOfSeats(elem['number_of_seats'])
-        reservation_start_date: datetime.date = parse(elem['reservation_start_date']).date()
-        reservation_end_date: datetime.date = parse(elem['reservation_end_date']).date()
-        reserved_umbrella_id: ReservedUmbrellaID = ReservedUmbrellaID(elem['reserved_umbrella_id'])
-        reservation_price: Price = Price.parse("{0:.2f}".format(elem['reservation_price']))
-        reservation: ReservationFromServer = ReservationFromServer(id=reservation_id,
-                                                                   number_of_seats=number_of_seats,
-                                                                   price=reservation_price,
-                                                                   umbrella_id=reserved_umbrella_id,
-                                                                   start_date=reservation_start_date,
-                                                                   end_date=reservation_end_date)
-
-        return reservation
-
     def __ask_until_provided_field(self, constructor: Callable[[str], Any], prompt: str, type_: str):
         is_invalid_input = True
         while is_invalid_input:
@@ -365,14 +867,75 @@ class App:
         except Exception as e:
             print('Internal error, it seems that we have a trouble!', file=sys.stderr)
             print(e)
+        finally:
+            if self.__pager is not None:
+                self.__pager.close()
+            self.__warm_up_executor.shutdown(wait=True)
+            self.__save_snapshot()
+            self.__close_offline_store()
+            self.__update_counters()
+            if self.__metrics_output is not None:
+                self.__instrumentation.write(str(self.__metrics_output), self.__metrics_format)
+            if self.__profiler is not None:
+                self.__write_profiles()
+            self.__tracer.close()
+
+    def __write_profiles(self):
+        try:
+            summary_path = self.__profiler.write()
+        except OSError as error:
+            print(colored(str(error), app_utils.FAIL_ACTION_COLOR))
+            return
+        print(colored(app_utils.PROFILE_WRITTEN.format(directory=summary_path.parent, summary=summary_path),
+                      app_utils.SUCCESS_ACTION_COLOR))
 
     def __run(self) -> None:
-        self.__login_menu.run()
+        if self.__resume_session():
+            self.__menu.run()
+        else:
+            self.__login_menu.run()
 
 
-def main(name: str):
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=app_utils.APP_NAME_MENU, allow_abbrev=False)
+    parser.add_argument('--page-size', type=int, default=app_utils.RESERVATION_PAGE_SIZE,
+                        help='show the reservations in pages of this size, fetched on demand')
+    parser.add_argument('--offline', action='store_true',
+                        help='keep the reservations and the changes made without connection on this device')
+    parser.add_argument('--snapshot', action='store_true',
+                        help='show the reservations saved at the end of the last session while they are updated')
+    parser.add_argument('--remember-token', action='store_true',
+                        help='keep the session token on this device and skip the login on the next start')
+    parser.add_argument('--metrics-output', default=None,
+                        help='write the collected timings, counters and request histograms to this file on exit')
+    parser.add_argument('--metrics-format', choices=app_utils.METRICS_FORMATS, default=app_utils.METRICS_FORMATS[0],
+                        help='format of the metrics file: JSON or Prometheus text')
+    parser.add_argument('--profile', nargs='?', const=app_utils.PROFILE_DEFAULT_DIRECTORY, default=None,
+                        metavar='DIRECTORY',
+                        help='profile every menu action separately and write the profiles to this directory on exit')
+    parser.add_argument('--trace', default=None, metavar='FILE',
+                        help='write a span for every menu action, request, decode and render step to this file')
+    parser.add_argument('--validation', choices=[level.value for level in ValidationLevel],
+                        default=ValidationLevel.STRICT.value,
+                        help='checks on the reservations received from the server: every layer (strict), one plain '
+                             'range check per row (boundary) or none (off); user input is always fully validated')
+    return parser.parse_args(argv)
+
+
+def main(name: str, argv: Optional[List[str]] = None):
     if name == '__main__':
-        App().run()
+        arguments = parse_arguments(argv if argv is not None else sys.argv[1:])
+        app = App(page_size=arguments.page_size,
+                  offline_directory=user_cache_directory() if arguments.offline else None,
+                  snapshot_directory=user_cache_directory() if arguments.snapshot else None,
+                  token_store=TokenStore(user_cache_directory() / app_utils.TOKEN_FILE_NAME)
+                  if arguments.remember_token else None,
+                  metrics_output=Path(arguments.metrics_output) if arguments.metrics_output is not None else None,
+                  metrics_format=arguments.metrics_format,
+                  profile_directory=Path(arguments.profile) if arguments.profile is not None else None,
+                  tracer=Tracer(Path(arguments.trace)) if arguments.trace is not None else None,
+                  validation_level=ValidationLevel(arguments.validation))
+        app.run()
 
 
 main(__name__)
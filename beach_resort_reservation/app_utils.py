@@ -2,14 +2,17 @@ import datetime
 
 APP_NAME_LOGIN = 'Umbrella Reservation Login'
 APP_NAME_MENU = 'Umbrella Reservation'
+APP_NAME_BULK_DELETE = 'Delete reservations in bulk'
 APP_EXIT_MESSAGE = 'Thank you for using our app, see you soon'
 
 LOGIN_END_POINT = '/auth/login/'
 REGISTRATION_END_POINT = '/auth/registration/'
 RESERVATIONS_END_POINT = '/beachreservation/'
+LOGOUT_END_POINT = '/auth/logout/'
 
 LOGIN_FAILED = 'Login failed, please provide correct credential to continue...'
 LOGIN_OK_WELCOME = 'You are logged in now, welcome to our application :)'
+SESSION_RESUMED_WELCOME = 'Welcome back, you are still logged in :)'
 LOGGED_OUT_MESSAGE = 'You are logged out now :)'
 LOGOUT_FAILED = 'There is a problem with the logout, please try later. If it does not work, ' \
                 'you can close directly the application'
@@ -19,9 +22,12 @@ REGISTRATION_OK_WELCOME = 'Registration done, now you can start use our applicat
 
 RESERVATION_LIST_RETRIEVE_FAILED = 'Is not possible retrieve your reservation list'
 NO_RESERVATION_FOUND_FOR_USER = 'You have not reservations yet, but you can create one if you want'
+MORE_RESERVATIONS_AVAILABLE = 'Showing {shown} of {total} reservations, choose 7 to show more'
+NO_MORE_RESERVATIONS = 'All your reservations are already shown'
 RESERVATION_FORMATTER = '%-20s %-30s %-20s %-20s %-20s %-20s'
 
 DELETE_FAILED = 'Is not possible to delete this reservation'
+NEW_RESERVATION_OVERLAPS = 'You already have this umbrella in some of these days, see the reservations: {ids}'
 NEW_RESERVATION_FAILED = 'Is not possible to add this reservation'
 
 DATE_CREATION_ERROR = f'Please remember that the correct date format is: yyyy-mm-dd, in addition remember to put the ' \
@@ -29,10 +35,45 @@ DATE_CREATION_ERROR = f'Please remember that the correct date format is: yyyy-mm
                       f'max = 12), and days in according to the month'
 
 DELETE_OK = ' correctly deleted '
+DELETE_OK_STATUS_CODES = (200, 202, 204)
 DELETE_FAILED_ID_NOT_FOUND = 'There is not a reservation with the id chosen, please check it and try another time '
 
+BULK_DELETE_SUMMARY = 'Deleted: {deleted}, not found: {not_found}, failed: {failed}'
+BULK_DELETE_NOTHING_SELECTED = 'There are no reservations matching your choice'
+BULK_DELETE_NOT_FOUND_IDS = 'These ids were not found: {ids}'
+BULK_DELETE_FAILED_IDS = 'Is not possible to delete these ids: {ids}'
+BULK_DELETE_CONFIRMATION = 'You are going to delete {count} reservations, do you want to continue? [y/N]: '
+BULK_DELETE_CANCELLED = 'No reservation has been deleted'
+CONFIRMATION_ANSWERS = ('y', 'yes')
+
 INT_FIELD_ERROR = 'The value you insert is not in the right format, remember that it has to be a number'
 
+NEW_RESERVATION_ERROR_FIELDS = {
+    'non_field_errors': 'There is a problem with the reservation:',
+    'number_of_seats': 'There is a problem with the number of seats:',
+    'reservation_start_date': 'There is a problem with the reservation start date:',
+    'reservation_end_date': 'There is a problem with the reservation end date:',
+    'reserved_umbrella_id': 'There is a problem with the umbrella you choose:',
+}
+
+BULK_IMPORT_MISSING_FIELD = 'This field is missing in the row'
+BULK_IMPORT_MALFORMED_ROW = 'The row is not well formed'
+BULK_IMPORT_FILE_NOT_FOUND = 'Is not possible to read the file, please check the path and try another time'
+BULK_IMPORT_INTERRUPTED = 'The file stopped being readable after {processed} rows, the rest was not imported'
+BULK_IMPORT_MALFORMED_FILE = 'The file is not a well formed CSV after {processed} rows, the rest was not imported'
+BULK_IMPORT_ROW_CREATED = 'reservation correctly added'
+BULK_IMPORT_SUMMARY = '{created} of {total} reservations imported'
+
+STALE_RESERVATIONS = 'These reservations were saved earlier and may be out of date, they are being updated'
+OFFLINE_SHOWING_STORED_RESERVATIONS = 'The server is not reachable, these are the reservations saved on this device'
+OFFLINE_CHANGE_QUEUED = 'The server is not reachable, your change is saved and will be sent as soon as possible'
+OFFLINE_SYNC_SUMMARY = '{applied} saved changes sent to the server, {conflicts} refused'
+OFFLINE_PENDING_CHANGES = '{pending} saved changes are still waiting to be sent to the server'
+OFFLINE_SYNC_OUTCOME_UNKNOWN = '{unknown} saved reservations got no answer in time and may have been created, ' \
+                               'check the list before making them again'
+NEW_RESERVATION_OUTCOME_UNKNOWN = 'The server did not answer in time and the reservation may have been created, ' \
+                                  'check the list before making it again'
+
 NEW_RESERVATION_CORRECTLY_ADDED = 'The reservation is added correctly, you can see it with other ones on the screen :)'
 
 PASSWORDS_DIFFERENT_ON_REGISTRATION_ERROR_MESSAGE = 'Passwords are different, please write them another time: '
@@ -40,3 +81,39 @@ DATE_PATTERN = '%Y-%m-%d'
 SUCCESS_ACTION_COLOR = 'green'
 FAIL_ACTION_COLOR = 'red'
 API_SERVER = 'http://127.0.0.1:8000/api/v1'
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = 10
+ASYNC_CONCURRENCY_LIMIT = 64
+BULK_MAX_IN_FLIGHT = 8
+BULK_DELETE_WORKERS = 8
+RESERVATION_CACHE_TTL_SECONDS = 30
+STREAM_CHUNK_SIZE = 64 * 1024
+RESERVATION_PAGE_SIZE = None
+METRIC_TIME_TO_FIRST_TABLE = 'time_to_first_table'
+METRIC_SINGLE_FLIGHT_CALLS = 'single_flight_calls'
+METRIC_SINGLE_FLIGHT_SAVED = 'single_flight_saved'
+METRIC_HTTP_REQUEST_SECONDS = 'http_request_seconds'
+METRIC_HTTP_RESPONSE_BYTES = 'http_response_bytes'
+METRIC_HTTP_RESPONSES = 'http_responses'
+METRIC_PARSE_SECONDS = 'parse_seconds'
+METRIC_WARM_UP_FAILURES = 'warm_up_failures'
+METRICS_PREFIX = 'beach_resort_'
+METRICS_FORMATS = ('json', 'prometheus')
+METRICS_DEFAULT_PATHS = {'json': 'beach_resort_metrics.json', 'prometheus': 'beach_resort_metrics.prom'}
+METRICS_EXPORTED = 'Metrics written to {path}'
+HISTOGRAM_SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+HISTOGRAM_BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+HISTOGRAM_WINDOW = 1024
+PROFILE_DEFAULT_DIRECTORY = 'profiles'
+PROFILE_SUFFIX = '.prof'
+PROFILE_SUMMARY_FILE_NAME = 'summary.txt'
+PROFILE_TOP_FUNCTIONS = 15
+PROFILE_WRITTEN = 'Profiles of each menu action written to {directory}, summary in {summary}'
+CACHE_DIRECTORY_NAME = 'beach_resort_reservation'
+OFFLINE_STORE_SUFFIX = '.sqlite3'
+OFFLINE_REQUEST_TIMEOUT_SECONDS = 3
+OFFLINE_SYNC_BATCH_SIZE = 16
+OFFLINE_REPLAY_RETRY_SECONDS = 60
+SYNC_OK_STATUS_CODES = (200, 201, 202, 204)
+SNAPSHOT_SUFFIX = '.snapshot'
+TOKEN_FILE_NAME = 'session_token.json'
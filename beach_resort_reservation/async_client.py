@@ -0,0 +1,99 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, TypeVar
+
+import typeguard
+from requests import Response
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.decoding import reservation_from_json
+from beach_resort_reservation.domain import NewReservation, ReservationID, ReservationFromServer
+from beach_resort_reservation.exceptions import ServerResponseException
+from beach_resort_reservation.single_flight import SingleFlight, SingleFlightStatistics
+from beach_resort_reservation.transport import Transport
+
+T = TypeVar('T')
+
+
+@typeguard.typechecked
+class AsyncReservationClient:
+
+    def __init__(self, base_url: str = app_utils.API_SERVER,
+                 concurrency_limit: int = app_utils.ASYNC_CONCURRENCY_LIMIT):
+        self.__transport = Transport(base_url=base_url, pool_maxsize=concurrency_limit)
+        self.__executor = ThreadPoolExecutor(max_workers=concurrency_limit)
+        self.__semaphore = asyncio.Semaphore(concurrency_limit)
+        self.__single_flight = SingleFlight()
+
+    @property
+    def single_flight_statistics(self) -> SingleFlightStatistics:
+        return self.__single_flight.statistics
+
+    async def __aenter__(self) -> 'AsyncReservationClient':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __run(self, blocking_call: Callable[[], T]) -> T:
+        async with self.__semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self.__executor, blocking_call)
+
+    async def login(self, username: str, password: str) -> None:
+        response = await self.__run(lambda: self.__transport.post(app_utils.LOGIN_END_POINT,
+                                                                  data={'username': username, 'password': password}))
+        if response.status_code != 200 or response.json().get('key') is None:
+            raise ServerResponseException(response.status_code, app_utils.LOGIN_FAILED, self.__json_or_none(response))
+        self.__transport.authorize(response.json()['key'])
+
+    async def list_reservations(self) -> List[ReservationFromServer]:
+        return await self.__run(self.__retrieve_reservation_list)
+
+    def __retrieve_reservation_list(self) -> List[ReservationFromServer]:
+        reservations, _ = self.__single_flight.do(('GET', app_utils.RESERVATIONS_END_POINT),
+                                                  self.__fetch_reservation_list)
+        return list(reservations)
+
+    def __fetch_reservation_list(self) -> List[ReservationFromServer]:
+        response = self.__transport.get(app_utils.RESERVATIONS_END_POINT)
+        if response.status_code != 200:
+            raise ServerResponseException(response.status_code, app_utils.RESERVATION_LIST_RETRIEVE_FAILED,
+                                          self.__json_or_none(response))
+        return [reservation_from_json(elem) for elem in response.json()]
+
+    async def create_reservation(self, new_reservation: NewReservation) -> None:
+        response = await self.__run(lambda: self.__transport.post(
+            app_utils.RESERVATIONS_END_POINT,
+            data={'number_of_seats': new_reservation.number_of_seats.value,
+                  'reservation_start_date': new_reservation.start_date,
+                  'reservation_end_date': new_reservation.end_date,
+                  'reserved_umbrella_id': new_reservation.umbrella_id.value}))
+        if response.status_code != 201:
+            raise ServerResponseException(response.status_code, app_utils.NEW_RESERVATION_FAILED,
+                                          self.__json_or_none(response))
+
+    async def delete_reservation(self, reservation_id: ReservationID) -> None:
+        response = await self.__run(lambda: self.__transport.delete(
+            f'{app_utils.RESERVATIONS_END_POINT}{reservation_id.value}/'))
+        if response.status_code == 404:
+            raise ServerResponseException(response.status_code, app_utils.DELETE_FAILED_ID_NOT_FOUND)
+        if response.status_code not in app_utils.DELETE_OK_STATUS_CODES:
+            raise ServerResponseException(response.status_code, app_utils.DELETE_FAILED,
+                                          self.__json_or_none(response))
+
+    async def logout(self) -> None:
+        response = await self.__run(lambda: self.__transport.post(app_utils.LOGOUT_END_POINT))
+        if response.status_code != 200:
+            raise ServerResponseException(response.status_code, app_utils.LOGOUT_FAILED)
+        self.__transport.deauthorize()
+
+    def close(self) -> None:
+        self.__executor.shutdown(wait=True)
+        self.__transport.close()
+
+    @staticmethod
+    def __json_or_none(response: Response) -> Any:
+        try:
+            return response.json()
+        except ValueError:
+            return None
@@ -0,0 +1,186 @@
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from datetime import datetime, date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from requests import RequestException, Response
+from typeguard import typechecked
+from valid8 import ValidationError
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.domain import NewReservation, NumberOfSeats, ReservedUmbrellaID, ReservationID, \
+    ReservationFromServer
+
+
+@typechecked
+@dataclass(frozen=True)
+class ImportRowResult:
+    row_number: int
+    is_created: bool
+    status_code: Optional[int] = None
+    errors: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@typechecked
+@dataclass(frozen=True)
+class ReservationFilter:
+    umbrella_id: Optional[ReservedUmbrellaID] = None
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+
+    def matches(self, reservation: ReservationFromServer) -> bool:
+        return (self.umbrella_id is None or reservation.umbrella_id == self.umbrella_id) and \
+               (self.from_date is None or reservation.start_date >= self.from_date) and \
+               (self.to_date is None or reservation.end_date <= self.to_date)
+
+
+@typechecked
+@dataclass(frozen=True)
+class BulkDeleteSummary:
+    deleted: List[ReservationID] = field(default_factory=list)
+    not_found: List[ReservationID] = field(default_factory=list)
+    failed: List[ReservationID] = field(default_factory=list)
+    status_codes: Dict[int, int] = field(default_factory=dict)
+
+
+@typechecked
+def iter_reservation_rows(path: str) -> Iterator[Tuple[int, Any]]:
+    return _iter_rows(open(path, newline='', encoding='utf-8'), path.endswith('.jsonl'))
+
+
+def _iter_rows(file: TextIO, is_jsonl: bool) -> Iterator[Tuple[int, Any]]:
+    with file:
+        if is_jsonl:
+            for row_number, line in enumerate(file, start=1):
+                if line.strip():
+                    try:
+                        yield row_number, json.loads(line)
+                    except ValueError:
+                        yield row_number, None
+        else:
+            for row_number, row in enumerate(csv.DictReader(file), start=1):
+                yield row_number, row
+
+
+@typechecked
+def new_reservation_from_row(row: Any) -> Tuple[Optional[NewReservation], Dict[str, List[str]]]:
+    if not isinstance(row, dict):
+        return None, {'non_field_errors': [app_utils.BULK_IMPORT_MALFORMED_ROW]}
+    errors: Dict[str, List[str]] = {}
+
+    def read(error_field: str, constructor: Callable[[Any], Any], help_msg: str) -> Any:
+        if row.get(error_field) in (None, ''):
+            errors[error_field] = [app_utils.BULK_IMPORT_MISSING_FIELD]
+            return None
+        try:
+            return constructor(row[error_field])
+        except ValidationError as validation_error:
+            errors[error_field] = [validation_error.help_msg or help_msg]
+        except (TypeError, ValueError):
+            errors[error_field] = [help_msg]
+        return None
+
+    umbrella_id = read('reserved_umbrella_id', lambda v: ReservedUmbrellaID.of(int(v)), app_utils.INT_FIELD_ERROR)
+    number_of_seats = read('number_of_seats', lambda v: NumberOfSeats.of(int(v)), app_utils.INT_FIELD_ERROR)
+    start_date = read('reservation_start_date', lambda v: datetime.strptime(v, app_utils.DATE_PATTERN).date(),
+                      app_utils.DATE_CREATION_ERROR)
+    end_date = read('reservation_end_date', lambda v: datetime.strptime(v, app_utils.DATE_PATTERN).date(),
+                    app_utils.DATE_CREATION_ERROR)
+    if errors:
+        return None, errors
+    try:
+        return NewReservation(number_of_seats=number_of_seats, umbrella_id=umbrella_id, start_date=start_date,
+                              end_date=end_date), errors
+    except ValidationError as validation_error:
+        return None, {'reservation_end_date': [validation_error.help_msg]}
+
+
+def _errors_from_json(response_json: Any) -> Dict[str, List[str]]:
+    errors: Dict[str, List[str]] = {}
+    if not isinstance(response_json, dict):
+        return {'non_field_errors': [app_utils.NEW_RESERVATION_FAILED]}
+    for error_field, messages in response_json.items():
+        messages = [str(message) for message in messages] if isinstance(messages, list) else [str(messages)]
+        if error_field not in app_utils.NEW_RESERVATION_ERROR_FIELDS:
+            error_field = 'non_field_errors'
+        errors.setdefault(error_field, []).extend(messages)
+    return errors
+
+
+def _result_of(row_number: int, future: Future) -> ImportRowResult:
+    try:
+        response: Response = future.result()
+    except RequestException as request_exception:
+        return ImportRowResult(row_number, False, None, {'non_field_errors': [str(request_exception)]})
+    if response.status_code == 201:
+        return ImportRowResult(row_number, True, response.status_code)
+    try:
+        response_json = response.json()
+    except ValueError:
+        response_json = None
+    return ImportRowResult(row_number, False, response.status_code, _errors_from_json(response_json))
+
+
+@typechecked
+def import_reservations(rows: Iterator[Tuple[int, Any]],
+                        submit: Callable[[NewReservation], Response],
+                        max_in_flight: int = app_utils.BULK_MAX_IN_FLIGHT) -> Iterator[ImportRowResult]:
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        pending: Dict[Future, int] = {}
+        try:
+            for row_number, row in rows:
+                new_reservation, errors = new_reservation_from_row(row)
+                if new_reservation is None:
+                    yield ImportRowResult(row_number, False, None, errors)
+                    continue
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield _result_of(pending.pop(future), future)
+                pending[executor.submit(submit, new_reservation)] = row_number
+        except Exception:
+            yield from _drain(pending)
+            raise
+        yield from _drain(pending)
+
+
+def _drain(pending: Dict[Future, int]) -> Iterator[ImportRowResult]:
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield _result_of(pending.pop(future), future)
+
+
+@typechecked
+def select_reservation_ids(reservations: Iterable[ReservationFromServer], first_id: Optional[ReservationID] = None,
+                           last_id: Optional[ReservationID] = None,
+                           reservation_filter: ReservationFilter = ReservationFilter()) -> List[ReservationID]:
+    return [reservation.id for reservation in reservations
+            if (first_id is None or reservation.id >= first_id) and (last_id is None or reservation.id <= last_id)
+            and reservation_filter.matches(reservation)]
+
+
+@typechecked
+def delete_reservations(reservation_ids: Iterable[ReservationID], delete: Callable[[ReservationID], Response],
+                        workers: int = app_utils.BULK_DELETE_WORKERS) -> BulkDeleteSummary:
+    summary = BulkDeleteSummary()
+
+    def delete_one(reservation_id: ReservationID) -> Tuple[ReservationID, Optional[int]]:
+        try:
+            return reservation_id, delete(reservation_id).status_code
+        except RequestException:
+            return reservation_id, None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for reservation_id, status_code in executor.map(delete_one, reservation_ids):
+            if status_code in app_utils.DELETE_OK_STATUS_CODES:
+                summary.deleted.append(reservation_id)
+            elif status_code == 404:
+                summary.not_found.append(reservation_id)
+            else:
+                summary.failed.append(reservation_id)
+            if status_code is not None:
+                summary.status_codes[status_code] = summary.status_codes.get(status_code, 0) + 1
+    return summary
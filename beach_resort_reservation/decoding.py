@@ -0,0 +1,104 @@
+import datetime
+import functools
+import math
+from enum import Enum
+from typing import Any, Callable, Dict
+
+from dateutil.parser import parse
+from dateutil.relativedelta import relativedelta
+from typeguard import typechecked
+
+from beach_resort_reservation import domain_utils
+from beach_resort_reservation.domain import ReservationID, NumberOfSeats, ReservedUmbrellaID, Price, \
+    ReservationFromServer, construct_interned, construct_trusted, json_number_in_cents
+
+
+class ValidationLevel(Enum):
+    STRICT = 'strict'
+    BOUNDARY = 'boundary'
+    OFF = 'off'
+
+
+def parse_iso_date(value: str) -> datetime.date:
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse(value).date()
+
+
+_cached_date = functools.lru_cache(maxsize=domain_utils.DATE_CACHE_SIZE)(parse_iso_date)
+
+
+def parse_date(value: Any) -> datetime.date:
+    if type(value) is not str:
+        return parse(value).date()
+    return _cached_date(value)
+
+
+@typechecked
+def reservation_from_json(elem: Dict[str, Any]) -> ReservationFromServer:
+    reservation_id: ReservationID = ReservationID(elem['id'])
+    number_of_seats: NumberOfSeats = NumberOfSeats.of(elem['number_of_seats'])
+    reservation_start_date: datetime.date = parse_date(elem['reservation_start_date'])
+    reservation_end_date: datetime.date = parse_date(elem['reservation_end_date'])
+    reserved_umbrella_id: ReservedUmbrellaID = ReservedUmbrellaID.of(elem['reserved_umbrella_id'])
+    reservation_price: Price = Price.from_json(elem['reservation_price'])
+    return ReservationFromServer(id=reservation_id,
+                                 number_of_seats=number_of_seats,
+                                 price=reservation_price,
+                                 umbrella_id=reserved_umbrella_id,
+                                 start_date=reservation_start_date,
+                                 end_date=reservation_end_date)
+
+
+def _is_valid_int(value: Any, min_value: int, max_value: float) -> bool:
+    return type(value) is int and min_value <= value <= max_value
+
+
+def _trusted_reservation(reservation_id: Any, number_of_seats: Any, umbrella_id: Any, start_date: datetime.date,
+                          end_date: datetime.date, value_in_cents: Any) -> ReservationFromServer:
+    return construct_trusted(ReservationFromServer,
+                             number_of_seats=construct_interned(NumberOfSeats, number_of_seats),
+                             umbrella_id=construct_interned(ReservedUmbrellaID, umbrella_id),
+                             start_date=start_date,
+                             end_date=end_date,
+                             price=construct_trusted(Price, value_in_cents=value_in_cents),
+                             id=construct_trusted(ReservationID, value=reservation_id))
+
+
+def reservation_from_trusted_json(elem: Dict[str, Any]) -> ReservationFromServer:
+    start_date = parse_date(elem['reservation_start_date'])
+    end_date = parse_date(elem['reservation_end_date'])
+    value_in_cents = json_number_in_cents(elem['reservation_price'])
+    if value_in_cents is None:
+        return reservation_from_json(elem)
+    return _trusted_reservation(elem['id'], elem['number_of_seats'], elem['reserved_umbrella_id'], start_date,
+                                 end_date, value_in_cents)
+
+
+def reservation_from_server_json(elem: Dict[str, Any]) -> ReservationFromServer:
+    reservation_id = elem['id']
+    number_of_seats = elem['number_of_seats']
+    umbrella_id = elem['reserved_umbrella_id']
+    start_date = parse_date(elem['reservation_start_date'])
+    end_date = parse_date(elem['reservation_end_date'])
+    value_in_cents = json_number_in_cents(elem['reservation_price'])
+    if not (_is_valid_int(reservation_id, 0, math.inf)
+            and _is_valid_int(number_of_seats, domain_utils.MIN_NUMBER_OF_SEATS, domain_utils.MAX_NUMBER_OF_SEATS)
+            and _is_valid_int(umbrella_id, domain_utils.MIN_NUMBER_UMBRELLA_ID, domain_utils.MAX_NUMBER_UMBRELLA_ID)
+            and value_in_cents is not None and 0 <= value_in_cents <= domain_utils.MAX_PRICE_IN_CENTS
+            and start_date <= end_date
+            <= start_date + relativedelta(months=domain_utils.MAX_DATE_DELTA_MONTHS_END_DATE)):
+        return reservation_from_json(elem)
+    return _trusted_reservation(reservation_id, number_of_seats, umbrella_id, start_date, end_date, value_in_cents)
+
+
+@typechecked
+def reservation_decoder(level: ValidationLevel) -> Callable[[Dict[str, Any]], ReservationFromServer]:
+    if level is ValidationLevel.BOUNDARY:
+        return reservation_from_server_json
+    if level is ValidationLevel.OFF:
+        return reservation_from_trusted_json
+    return reservation_from_json
@@ -1,7 +1,9 @@
 import datetime
+import math
 import re
 from dataclasses import dataclass, InitVar, field
-from typing import Any
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, Optional, Type, TypeVar, Union
 
 import valid8
 from dateutil.relativedelta import relativedelta
@@ -10,9 +12,11 @@ from typeguard import typechecked
 from beach_resort_reservation import domain_utils
 from validation.regex import pattern
 
+T = TypeVar('T')
+
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class NumberOfSeats:
     value: int
 
@@ -23,9 +27,14 @@ class NumberOfSeats:
     def __str__(self):
         return f'{self.value}'
 
+    @staticmethod
+    def of(value: int) -> 'NumberOfSeats':
+        instance = _INTERNED[NumberOfSeats].get(value)
+        return instance if instance is not None else NumberOfSeats(value)
+
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ReservedUmbrellaID:
     value: int
 
@@ -36,15 +45,20 @@ class ReservedUmbrellaID:
     def __str__(self):
         return f'{self.value}'
 
+    @staticmethod
+    def of(value: int) -> 'ReservedUmbrellaID':
+        instance = _INTERNED[ReservedUmbrellaID].get(value)
+        return instance if instance is not None else ReservedUmbrellaID(value)
+
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Price:
     __parse_pattern = re.compile(r'(?P<euro>\d{0,11})(?:\.(?P<cents>\d{1,2}))?')
     value_in_cents: int
     private_key: InitVar[Any] = field(default='')
 
-    __max_value = 10_000_000_000 - 1
+    __max_value = domain_utils.MAX_PRICE_IN_CENTS
     __private_key = object()
 
     def __post_init__(self, private_key):
@@ -77,9 +91,16 @@ class Price:
         cents = m.group('cents') if m.group('cents') else 0
         return Price.create_price(int(euro), int(cents))
 
+    @staticmethod
+    def from_json(value: Union[int, float, Decimal]) -> 'Price':
+        value_in_cents = json_number_in_cents(value)
+        valid8.validate('price', value_in_cents, instance_of=int, min_value=0, max_value=Price.__max_value,
+                        help_msg='The price must be a finite, non negative number')
+        return construct_trusted(Price, value_in_cents=value_in_cents)
+
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ReservationID:
     value: int
 
@@ -91,7 +112,7 @@ class ReservationID:
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ReservationFromServer:
     number_of_seats: NumberOfSeats
     umbrella_id: ReservedUmbrellaID
@@ -108,7 +129,7 @@ class ReservationFromServer:
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class NewReservation:
     number_of_seats: NumberOfSeats
     umbrella_id: ReservedUmbrellaID
@@ -123,7 +144,7 @@ class NewReservation:
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Username:
     value: str
 
@@ -136,7 +157,7 @@ class Username:
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Password:
     value: str
 
@@ -146,7 +167,7 @@ class Password:
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Email:
     value: str
 
@@ -157,3 +178,36 @@ class Email:
 
     def __str__(self):
         return f'email: {self.value}'
+
+
+def json_number_in_cents(value: Any) -> Optional[int]:
+    if type(value) not in (int, float, Decimal):
+        return None
+    if type(value) is float and 0 <= value < math.inf:
+        scaled = value * 100
+        if abs(scaled - round(scaled)) <= domain_utils.PRICE_CENTS_TOLERANCE:
+            return round(scaled)
+    number = Decimal(repr(value)) if type(value) is float else Decimal(value)
+    if not number.is_finite() or number < 0:
+        return None
+    return int((number * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def construct_trusted(cls: Type[T], **values: Any) -> T:
+    instance = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def construct_interned(cls: Type[T], value: Any) -> T:
+    instance = _INTERNED[cls].get(value)
+    return instance if instance is not None else construct_trusted(cls, value=value)
+
+
+_INTERNED: Dict[type, Dict[int, Any]] = {
+    NumberOfSeats: {value: NumberOfSeats(value) for value in range(domain_utils.MIN_NUMBER_OF_SEATS,
+                                                                  domain_utils.MAX_NUMBER_OF_SEATS + 1)},
+    ReservedUmbrellaID: {value: ReservedUmbrellaID(value) for value in range(domain_utils.MIN_NUMBER_UMBRELLA_ID,
+                                                                            domain_utils.MAX_NUMBER_UMBRELLA_ID + 1)},
+}
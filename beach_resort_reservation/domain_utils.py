@@ -6,6 +6,11 @@ MAX_NUMBER_UMBRELLA_ID = 50
 
 MAX_DATE_DELTA_MONTHS_END_DATE = 1
 
+MAX_PRICE_IN_CENTS = 10_000_000_000 - 1
+PRICE_CENTS_TOLERANCE = 1e-3
+
+DATE_CACHE_SIZE = 4096
+
 END_DATE_RESERVATION_ERROR = 'Is not possible to put as End date a date before the Start date'
 
 PASSWORD_REGEX = r'[A-Za-z\d@$!%*?&]+'
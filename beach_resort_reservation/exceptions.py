@@ -1,3 +1,5 @@
+from typing import Any
+
 import typeguard
 
 from beach_resort_reservation import app_utils
@@ -15,3 +17,12 @@ class DateInputException(Exception):
     def __init__(self, help_msg: str = app_utils.DATE_CREATION_ERROR):
         self.help_msg = help_msg
         super().__init__(self.help_msg)
+
+
+@typeguard.typechecked
+class ServerResponseException(Exception):
+    def __init__(self, status_code: int, help_msg: str, response_json: Any = None):
+        self.status_code = status_code
+        self.help_msg = help_msg
+        self.response_json = response_json
+        super().__init__(self.help_msg)
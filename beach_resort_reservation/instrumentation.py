@@ -0,0 +1,182 @@
+import bisect
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import typeguard
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.transport import RequestTiming
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_bound(bound: float) -> str:
+    return str(int(bound)) if float(bound).is_integer() else repr(float(bound))
+
+
+@typeguard.typechecked
+class RollingHistogram:
+
+    def __init__(self, buckets: Sequence[float] = app_utils.HISTOGRAM_SECONDS_BUCKETS,
+                 window: int = app_utils.HISTOGRAM_WINDOW):
+        self.__buckets = tuple(buckets)
+        self.__counts = [0] * (len(self.__buckets) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__recent: deque = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.__counts[bisect.bisect_left(self.__buckets, value)] += 1
+        self.__count += 1
+        self.__sum += value
+        self.__recent.append(value)
+
+    def quantile(self, rank: float) -> Optional[float]:
+        if not self.__recent:
+            return None
+        ordered = sorted(self.__recent)
+        return ordered[max(0, math.ceil(rank * len(ordered)) - 1)]
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        bounds = [_format_bound(bound) for bound in self.__buckets] + ['+Inf']
+        cumulative, total = [], 0
+        for bound, count in zip(bounds, self.__counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def summary(self) -> Dict[str, Any]:
+        return {'count': self.__count, 'sum': self.__sum, 'buckets': dict(self.cumulative_buckets()),
+                'p50': self.quantile(0.5), 'p95': self.quantile(0.95), 'p99': self.quantile(0.99)}
+
+
+@typeguard.typechecked
+class Instrumentation:
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__timings: Dict[str, List[float]] = {}
+        self.__counters: Dict[str, int] = {}
+        self.__histograms: Dict[str, Dict[Labels, RollingHistogram]] = {}
+        self.__labeled_counters: Dict[str, Dict[Labels, int]] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self.__lock:
+            self.__timings.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started_at)
+
+    def set_counter(self, name: str, value: int) -> None:
+        with self.__lock:
+            self.__counters[name] = value
+
+    def observe_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None,
+                          buckets: Sequence[float] = app_utils.HISTOGRAM_SECONDS_BUCKETS) -> None:
+        with self.__lock:
+            by_labels = self.__histograms.setdefault(name, {})
+            key = self.__labels_key(labels)
+            if key not in by_labels:
+                by_labels[key] = RollingHistogram(buckets)
+            by_labels[key].observe(value)
+
+    @contextmanager
+    def histogram_timer(self, name: str, labels: Optional[Dict[str, str]] = None):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_histogram(name, time.perf_counter() - started_at, labels)
+
+    def increment(self, name: str, labels: Optional[Dict[str, str]] = None, amount: int = 1) -> None:
+        with self.__lock:
+            by_labels = self.__labeled_counters.setdefault(name, {})
+            key = self.__labels_key(labels)
+            by_labels[key] = by_labels.get(key, 0) + amount
+
+    def observe_request(self, timing: RequestTiming) -> None:
+        labels = {'method': timing.method, 'route': timing.route}
+        for phase, seconds in (('dns', timing.dns_seconds), ('connect', timing.connect_seconds),
+                               ('ttfb', timing.ttfb_seconds), ('total', timing.total_seconds)):
+            self.observe_histogram(app_utils.METRIC_HTTP_REQUEST_SECONDS, seconds, {**labels, 'phase': phase})
+        if timing.payload_bytes is not None:
+            self.observe_histogram(app_utils.METRIC_HTTP_RESPONSE_BYTES, timing.payload_bytes, labels,
+                                   app_utils.HISTOGRAM_BYTES_BUCKETS)
+        status = str(timing.status_code) if timing.status_code is not None else 'error'
+        self.increment(app_utils.METRIC_HTTP_RESPONSES, {**labels, 'status': status})
+
+    def summary(self) -> Dict[str, Any]:
+        with self.__lock:
+            timings = {name: {'count': len(samples),
+                              'total_seconds': sum(samples),
+                              'min_seconds': min(samples),
+                              'max_seconds': max(samples),
+                              'last_seconds': samples[-1]}
+                       for name, samples in self.__timings.items()}
+            histograms = {name: [{'labels': dict(labels), **histogram.summary()}
+                                 for labels, histogram in by_labels.items()]
+                          for name, by_labels in self.__histograms.items()}
+            labeled_counters = {name: [{'labels': dict(labels), 'value': value}
+                                       for labels, value in by_labels.items()]
+                                for name, by_labels in self.__labeled_counters.items()}
+            return {'timings': timings, 'counters': dict(self.__counters), 'histograms': histograms,
+                    'labeled_counters': labeled_counters}
+
+    def prometheus_text(self) -> str:
+        lines: List[str] = []
+        with self.__lock:
+            for name, samples in sorted(self.__timings.items()):
+                metric = f'{app_utils.METRICS_PREFIX}{name}_seconds'
+                lines += [f'# TYPE {metric} summary', f'{metric}_count {len(samples)}', f'{metric}_sum {sum(samples)}']
+            for name, value in sorted(self.__counters.items()):
+                lines += [f'# TYPE {app_utils.METRICS_PREFIX}{name} gauge', f'{app_utils.METRICS_PREFIX}{name} {value}']
+            for name, by_labels in sorted(self.__labeled_counters.items()):
+                metric = f'{app_utils.METRICS_PREFIX}{name}_total'
+                lines.append(f'# TYPE {metric} counter')
+                lines += [f'{metric}{self.__format_labels(labels)} {value}'
+                          for labels, value in sorted(by_labels.items())]
+            for name, by_labels in sorted(self.__histograms.items()):
+                metric = f'{app_utils.METRICS_PREFIX}{name}'
+                lines.append(f'# TYPE {metric} histogram')
+                for labels, histogram in sorted(by_labels.items()):
+                    for bound, count in histogram.cumulative_buckets():
+                        lines.append(f'{metric}_bucket{self.__format_labels(labels + (("le", bound),))} {count}')
+                    summary = histogram.summary()
+                    lines.append(f'{metric}_sum{self.__format_labels(labels)} {summary["sum"]}')
+                    lines.append(f'{metric}_count{self.__format_labels(labels)} {summary["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.summary(), file, indent=2, sort_keys=True)
+
+    def write_prometheus(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.prometheus_text())
+
+    def write(self, path: str, metrics_format: str = 'json') -> None:
+        if metrics_format == 'prometheus':
+            self.write_prometheus(path)
+        else:
+            self.write_json(path)
+
+    @staticmethod
+    def __labels_key(labels: Optional[Dict[str, str]]) -> Labels:
+        return tuple(sorted(labels.items())) if labels else ()
+
+    @staticmethod
+    def __format_labels(labels: Labels) -> str:
+        if not labels:
+            return ''
+        escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+        return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + '}'
@@ -0,0 +1,72 @@
+import bisect
+import datetime
+from typing import Dict, Iterable, List, Tuple
+
+import typeguard
+
+from beach_resort_reservation import domain_utils
+from beach_resort_reservation.domain import ReservationFromServer, ReservationID, ReservedUmbrellaID
+
+
+class _UmbrellaIntervals:
+
+    def __init__(self):
+        self.keys: List[Tuple[int, int]] = []
+        self.ends: Dict[int, int] = {}
+        self.longest = 0
+
+    def add(self, reservation_id: int, start: int, end: int) -> None:
+        bisect.insort(self.keys, (start, reservation_id))
+        self.ends[reservation_id] = end
+        self.longest = max(self.longest, end - start)
+
+    def remove(self, reservation_id: int, start: int) -> None:
+        position = bisect.bisect_left(self.keys, (start, reservation_id))
+        del self.keys[position]
+        del self.ends[reservation_id]
+
+    def overlapping(self, start: int, end: int) -> List[int]:
+        first = bisect.bisect_left(self.keys, (start - self.longest, -1))
+        last = bisect.bisect_right(self.keys, (end, float('inf')))
+        return [reservation_id for _, reservation_id in self.keys[first:last] if self.ends[reservation_id] >= start]
+
+
+@typeguard.typechecked
+class ReservationIntervalIndex:
+
+    def __init__(self, reservations: Iterable[ReservationFromServer] = ()):
+        self.__umbrellas: List[_UmbrellaIntervals] = []
+        self.__positions: Dict[int, Tuple[int, int]] = {}
+        self.rebuild(reservations)
+
+    def rebuild(self, reservations: Iterable[ReservationFromServer]) -> None:
+        umbrellas = [_UmbrellaIntervals()
+                     for _ in range(domain_utils.MIN_NUMBER_UMBRELLA_ID, domain_utils.MAX_NUMBER_UMBRELLA_ID + 1)]
+        positions: Dict[int, Tuple[int, int]] = {}
+        for reservation in reservations:
+            _insert(umbrellas, positions, reservation)
+        self.__umbrellas, self.__positions = umbrellas, positions
+
+    def add(self, reservation: ReservationFromServer) -> None:
+        self.remove(reservation.id)
+        _insert(self.__umbrellas, self.__positions, reservation)
+
+    def remove(self, reservation_id: ReservationID) -> None:
+        position = self.__positions.pop(reservation_id.value, None)
+        if position is not None:
+            umbrella_index, start = position
+            self.__umbrellas[umbrella_index].remove(reservation_id.value, start)
+
+    def overlapping(self, umbrella_id: ReservedUmbrellaID, start_date: datetime.date,
+                    end_date: datetime.date) -> List[ReservationID]:
+        umbrella = self.__umbrellas[umbrella_id.value - domain_utils.MIN_NUMBER_UMBRELLA_ID]
+        return [ReservationID(reservation_id)
+                for reservation_id in umbrella.overlapping(start_date.toordinal(), end_date.toordinal())]
+
+
+def _insert(umbrellas: List[_UmbrellaIntervals], positions: Dict[int, Tuple[int, int]],
+            reservation: ReservationFromServer) -> None:
+    umbrella_index = reservation.umbrella_id.value - domain_utils.MIN_NUMBER_UMBRELLA_ID
+    start = reservation.start_date.toordinal()
+    umbrellas[umbrella_index].add(reservation.id.value, start, reservation.end_date.toordinal())
+    positions[reservation.id.value] = (umbrella_index, start)
@@ -0,0 +1,73 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+from requests import Response
+from typeguard import typechecked
+
+from beach_resort_reservation import app_utils
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARACTERS = '0123456789+-.eE'
+
+
+@typechecked
+def iter_response_chunks(response: Response, chunk_size: int = app_utils.STREAM_CHUNK_SIZE) -> Iterable[bytes]:
+    if response.raw is None:
+        return (response.content,)
+    return response.iter_content(chunk_size=chunk_size)
+
+
+@typechecked
+def iter_json_array(chunks: Iterable[bytes], decoder: json.JSONDecoder = json.JSONDecoder()) -> Iterator[Any]:
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    position = 0
+    expecting = '['
+    for chunk, is_final in _with_final_marker(chunks):
+        buffer = buffer[position:] + text_decoder.decode(chunk, final=is_final)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            if expecting == '[':
+                if buffer[position] != '[':
+                    raise ValueError(f'Expected a JSON array at position {position}')
+                expecting = 'item or ]'
+                position += 1
+            elif expecting == ', or ]' or (expecting == 'item or ]' and buffer[position] == ']'):
+                if buffer[position] == ']':
+                    expecting = 'end'
+                elif buffer[position] == ',' and expecting == ', or ]':
+                    expecting = 'item'
+                else:
+                    raise ValueError(f'Unexpected {buffer[position]!r} in JSON array')
+                position += 1
+            elif expecting == 'end':
+                raise ValueError('Unexpected data after the end of the JSON array')
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if is_final:
+                        raise
+                    break
+                if not is_final and (end == len(buffer) or (not isinstance(item, (dict, list, str)) and
+                                                            buffer[end] in _NUMBER_CHARACTERS)):
+                    break
+                yield item
+                position = end
+                expecting = ', or ]'
+    if expecting != 'end':
+        raise ValueError('The JSON array is not complete')
+
+
+def _with_final_marker(chunks: Iterable[bytes]) -> Iterator[tuple]:
+    previous = None
+    for chunk in chunks:
+        if previous is not None:
+            yield previous, False
+        previous = chunk
+    yield (previous if previous is not None else b''), True
@@ -0,0 +1,22 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Mapping, Optional
+
+import typeguard
+
+from beach_resort_reservation import app_utils
+
+
+@typeguard.typechecked
+def user_cache_directory(environment: Optional[Mapping[str, str]] = None) -> Path:
+    environment = environment if environment is not None else os.environ
+    base_directory = environment.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base_directory) / app_utils.CACHE_DIRECTORY_NAME
+
+
+@typeguard.typechecked
+def account_file(directory: Path, account: str, suffix: str) -> Path:
+    account_key = hashlib.sha256(f'{app_utils.API_SERVER}\n{account}'.encode('utf-8')).hexdigest()
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return directory / f'{account_key}{suffix}'
@@ -40,11 +40,12 @@ class Entry:
     description: Description
     on_selected: Callable[[], None] = field(default=lambda: None)
     is_exit: bool = field(default=False)
+    is_hidden: bool = field(default=False)
 
     @staticmethod
     def create(key: str, description: str, on_selected: Callable[[], None] = lambda: None,
-               is_exit: bool = False) -> 'Entry':
-        return Entry(Key(key), Description(description), on_selected, is_exit)
+               is_exit: bool = False, is_hidden: bool = False) -> 'Entry':
+        return Entry(Key(key), Description(description), on_selected, is_exit, is_hidden)
 
 
 @typechecked
@@ -56,6 +57,7 @@ class Menu:
     __is_running: List[bool] = dataclasses.field(default_factory=lambda: [True], init=False)
     create_key: InitVar[Any] = field(default='')
     auto_select: Callable[[], None] = field(default=lambda: None)
+    around_action: Callable[[str, Callable[[], None]], None] = field(default=lambda name, action: action())
 
     def __post_init__(self, create_key: Any):
         validate('create_key', create_key, custom=Menu.Builder.is_valid_key)
@@ -75,8 +77,10 @@ class Menu:
         print(fmt.format('*', '*' * length, '*'))
         print(fmt.format(' ', self.description.value, ' '))
         print(fmt.format('*', '*' * length, '*'))
-        self.auto_select()
+        self.around_action(f'{self.description} - auto select', self.auto_select)
         for entry in self.__entries:
+            if entry.is_hidden:
+                continue
             print(f'{entry.key}:\t{entry.description}')
 
     def __select_from_input(self) -> bool:
@@ -85,7 +89,7 @@ class Menu:
                 line = input(" ? ")
                 key = Key(line.strip())
                 entry = self.__key2entry[key]
-                entry.on_selected()
+                self.around_action(f'{self.description} - {entry.description}', entry.on_selected)
                 return entry.is_exit
             except (KeyError, TypeError, ValueError):
                 print(menu_utils.MENU_INVALID_KEY_SELECTION)
@@ -107,8 +111,10 @@ class Menu:
         __menu: Optional['Menu']
         __create_key = object()
 
-        def __init__(self, description: Description, auto_select: Callable[[], None] = lambda: None):
-            self.__menu = Menu(description=description, auto_select=auto_select, create_key=self.__create_key)
+        def __init__(self, description: Description, auto_select: Callable[[], None] = lambda: None,
+                     around_action: Callable[[str, Callable[[], None]], None] = lambda name, action: action()):
+            self.__menu = Menu(description=description, auto_select=auto_select, around_action=around_action,
+                               create_key=self.__create_key)
 
         @staticmethod
         def is_valid_key(key: Any) -> bool:
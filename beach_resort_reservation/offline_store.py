@@ -0,0 +1,188 @@
+import datetime
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+import typeguard
+from requests import Response
+from urllib3.exceptions import ProtocolError
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.domain import NewReservation, ReservationFromServer, ReservationID, NumberOfSeats, \
+    ReservedUmbrellaID, Price
+
+CREATE_MUTATION = 'create'
+DELETE_MUTATION = 'delete'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS reservations (
+    id INTEGER PRIMARY KEY,
+    umbrella_id INTEGER NOT NULL,
+    number_of_seats INTEGER NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    price_in_cents INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending_mutations (
+    mutation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+'''
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class PendingMutation:
+    mutation_id: int
+    kind: str
+    payload: Dict[str, Any]
+
+    @property
+    def new_reservation(self) -> NewReservation:
+        return NewReservation(number_of_seats=NumberOfSeats.of(self.payload['number_of_seats']),
+                              umbrella_id=ReservedUmbrellaID.of(self.payload['umbrella_id']),
+                              start_date=datetime.date.fromisoformat(self.payload['start_date']),
+                              end_date=datetime.date.fromisoformat(self.payload['end_date']))
+
+    @property
+    def reservation_id(self) -> ReservationID:
+        return ReservationID(self.payload['reservation_id'])
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class SyncReport:
+    applied: List[Tuple[PendingMutation, Response]]
+    conflicts: List[Tuple[PendingMutation, Response]]
+    is_complete: bool
+    unknown: List[PendingMutation] = field(default_factory=list)
+
+
+@typeguard.typechecked
+class OfflineStore:
+
+    def __init__(self, path: str):
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.executescript(_SCHEMA)
+
+    def reservations(self) -> List[ReservationFromServer]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT id, umbrella_id, number_of_seats, start_date, end_date, price_in_cents '
+                'FROM reservations ORDER BY id').fetchall()
+        return [ReservationFromServer(id=ReservationID(row[0]),
+                                      umbrella_id=ReservedUmbrellaID.of(row[1]),
+                                      number_of_seats=NumberOfSeats.of(row[2]),
+                                      start_date=datetime.date.fromisoformat(row[3]),
+                                      end_date=datetime.date.fromisoformat(row[4]),
+                                      price=Price.create_price(row[5] // 100, row[5] % 100))
+                for row in rows]
+
+    def replace_reservations(self, reservations: List[ReservationFromServer]) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM reservations')
+            self.__connection.executemany('INSERT INTO reservations VALUES (?, ?, ?, ?, ?, ?)',
+                                          [self.__row_of(reservation) for reservation in reservations])
+
+    def add_reservation(self, reservation: ReservationFromServer) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute('INSERT OR REPLACE INTO reservations VALUES (?, ?, ?, ?, ?, ?)',
+                                      self.__row_of(reservation))
+
+    def remove_reservation(self, reservation_id: ReservationID) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM reservations WHERE id = ?', (reservation_id.value,))
+
+    def enqueue_create(self, new_reservation: NewReservation) -> None:
+        payload = {'number_of_seats': new_reservation.number_of_seats.value,
+                   'umbrella_id': new_reservation.umbrella_id.value,
+                   'start_date': new_reservation.start_date.isoformat(),
+                   'end_date': new_reservation.end_date.isoformat()}
+        with self.__lock, self.__connection:
+            self.__connection.execute('INSERT INTO pending_mutations (kind, payload) VALUES (?, ?)',
+                                      (CREATE_MUTATION, json.dumps(payload)))
+
+    def enqueue_delete(self, reservation_id: ReservationID) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM reservations WHERE id = ?', (reservation_id.value,))
+            self.__connection.execute('INSERT INTO pending_mutations (kind, payload) VALUES (?, ?)',
+                                      (DELETE_MUTATION, json.dumps({'reservation_id': reservation_id.value})))
+
+    def pending_mutations(self, limit: int = -1) -> List[PendingMutation]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT mutation_id, kind, payload FROM pending_mutations ORDER BY mutation_id LIMIT ?',
+                (limit,)).fetchall()
+        return [PendingMutation(row[0], row[1], json.loads(row[2])) for row in rows]
+
+    def complete(self, mutations: List[PendingMutation]) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.executemany('DELETE FROM pending_mutations WHERE mutation_id = ?',
+                                          [(mutation.mutation_id,) for mutation in mutations])
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    @staticmethod
+    def __row_of(reservation: ReservationFromServer) -> Tuple[int, int, int, str, str, int]:
+        return (reservation.id.value, reservation.umbrella_id.value, reservation.number_of_seats.value,
+                reservation.start_date.isoformat(), reservation.end_date.isoformat(), reservation.price.value_in_cents)
+
+
+@typeguard.typechecked
+def replay_pending_mutations(store: OfflineStore,
+                             create: Callable[[NewReservation], Response],
+                             delete: Callable[[ReservationID], Response],
+                             batch_size: int = app_utils.OFFLINE_SYNC_BATCH_SIZE) -> SyncReport:
+    applied: List[Tuple[PendingMutation, Response]] = []
+    conflicts: List[Tuple[PendingMutation, Response]] = []
+    unknown: List[PendingMutation] = []
+
+    def submit(mutation: PendingMutation) -> Union[Response, requests.RequestException]:
+        try:
+            if mutation.kind == CREATE_MUTATION:
+                return create(mutation.new_reservation)
+            return delete(mutation.reservation_id)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=batch_size) as executor:
+        is_complete = True
+        while is_complete:
+            batch = store.pending_mutations(batch_size)
+            if not batch:
+                break
+            done: List[PendingMutation] = []
+            for mutation, response in zip(batch, executor.map(submit, batch)):
+                if isinstance(response, requests.RequestException):
+                    if mutation.kind == CREATE_MUTATION and may_have_been_sent(response):
+                        unknown.append(mutation)
+                        done.append(mutation)
+                    else:
+                        is_complete = False
+                    continue
+                if response.status_code >= 500:
+                    is_complete = False
+                    continue
+                if response.status_code in app_utils.SYNC_OK_STATUS_CODES:
+                    applied.append((mutation, response))
+                else:
+                    conflicts.append((mutation, response))
+                done.append(mutation)
+            store.complete(done)
+    return SyncReport(applied=applied, conflicts=conflicts, is_complete=is_complete, unknown=unknown)
+
+
+def may_have_been_sent(error: requests.RequestException) -> bool:
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    if isinstance(error, requests.Timeout):
+        return True
+    return bool(error.args) and isinstance(error.args[0], (ProtocolError, OSError))
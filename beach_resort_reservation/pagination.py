@@ -0,0 +1,90 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import typeguard
+
+from beach_resort_reservation.decoding import reservation_from_json
+from beach_resort_reservation.domain import ReservationFromServer
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class ReservationPage:
+    reservations: List[ReservationFromServer]
+    offset: int
+    total: Optional[int]
+    has_next: bool
+
+
+@typeguard.typechecked
+def decode_reservation_page(response_json: Any, offset: int,
+                            decode: Callable[[Dict[str, Any]], ReservationFromServer] = reservation_from_json) \
+        -> ReservationPage:
+    if isinstance(response_json, list):
+        reservations = [decode(elem) for elem in response_json]
+        return ReservationPage(reservations, offset, offset + len(reservations), False)
+    reservations = [decode(elem) for elem in response_json['results']]
+    return ReservationPage(reservations, offset, response_json.get('count'), response_json.get('next') is not None)
+
+
+@typeguard.typechecked
+class ReservationPager:
+
+    def __init__(self, fetch_page: Callable[[int, int], ReservationPage], page_size: int):
+        self.__fetch_page = fetch_page
+        self.__page_size = page_size
+        self.__next_offset = 0
+        self.__has_next = True
+        self.__total: Optional[int] = None
+        self.__prefetched: Optional[Tuple[int, Future]] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.__has_next
+
+    @property
+    def total(self) -> Optional[int]:
+        return self.__total
+
+    def reset(self) -> None:
+        if self.__prefetched is not None:
+            self.__prefetched[1].cancel()
+        self.__prefetched = None
+        self.__next_offset = 0
+        self.__has_next = True
+        self.__total = None
+
+    def next_page(self) -> Optional[ReservationPage]:
+        if not self.__has_next:
+            return None
+        offset = self.__next_offset
+        prefetched, self.__prefetched = self.__prefetched, None
+        if prefetched is not None and prefetched[0] == offset:
+            page = prefetched[1].result()
+        else:
+            page = self.__fetch_page(offset, self.__page_size)
+        self.__next_offset = offset + len(page.reservations)
+        self.__has_next = page.has_next and len(page.reservations) > 0
+        self.__total = page.total
+        if self.__has_next:
+            self.__prefetched = (self.__next_offset, self.__prefetch(self.__next_offset))
+        return page
+
+    def close(self) -> None:
+        self.reset()
+
+    def __prefetch(self, offset: int) -> Future:
+        future = Future()
+
+        def fetch() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.__fetch_page(offset, self.__page_size))
+            except BaseException as error:
+                future.set_exception(error)
+
+        threading.Thread(target=fetch, name='reservation-page-prefetch', daemon=True).start()
+        return future
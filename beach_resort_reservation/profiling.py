@@ -0,0 +1,73 @@
+import cProfile
+import io
+import pstats
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import typeguard
+
+from beach_resort_reservation import app_utils
+
+
+@typeguard.typechecked
+class ActionProfiler:
+
+    def __init__(self, directory: Path, top: int = app_utils.PROFILE_TOP_FUNCTIONS):
+        self.__directory = directory
+        self.__top = top
+        self.__active: List[cProfile.Profile] = []
+        self.__nested_seconds: List[float] = []
+        self.__stats: Dict[str, pstats.Stats] = {}
+        self.__calls: Dict[str, int] = {}
+        self.__seconds: Dict[str, float] = {}
+
+    def around(self, name: str, action: Callable[[], None]) -> None:
+        if self.__active:
+            self.__active[-1].disable()
+        profile = cProfile.Profile()
+        self.__active.append(profile)
+        self.__nested_seconds.append(0.0)
+        started_at = time.perf_counter()
+        profile.enable()
+        try:
+            action()
+        finally:
+            profile.disable()
+            seconds = time.perf_counter() - started_at
+            self.__active.pop()
+            self.__record(name, profile, seconds - self.__nested_seconds.pop())
+            if self.__active:
+                self.__nested_seconds[-1] += seconds
+                self.__active[-1].enable()
+
+    def __record(self, name: str, profile: cProfile.Profile, seconds: float) -> None:
+        if name in self.__stats:
+            self.__stats[name].add(profile)
+        else:
+            self.__stats[name] = pstats.Stats(profile)
+        self.__calls[name] = self.__calls.get(name, 0) + 1
+        self.__seconds[name] = self.__seconds.get(name, 0.0) + seconds
+
+    def summary(self) -> str:
+        output = io.StringIO()
+        for name in sorted(self.__stats, key=lambda action: self.__seconds[action], reverse=True):
+            output.write(f'== {name}: {self.__calls[name]} calls, {self.__seconds[name]:.3f} s '
+                         f'(nested actions excluded) ==\n')
+            stats = pstats.Stats(stream=output).add(self.__stats[name])
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.__top)
+        return output.getvalue()
+
+    def write(self) -> Path:
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        for name, stats in self.__stats.items():
+            stats.dump_stats(str(self.__directory / f'{action_file_name(name)}{app_utils.PROFILE_SUFFIX}'))
+        summary_path = self.__directory / app_utils.PROFILE_SUMMARY_FILE_NAME
+        summary_path.write_text(self.summary(), encoding='utf-8')
+        return summary_path
+
+
+@typeguard.typechecked
+def action_file_name(name: str) -> str:
+    return re.sub(r'[^0-9a-z]+', '_', name.lower()).strip('_')
@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import typeguard
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.domain import ReservationFromServer, ReservationID, NewReservation
+from beach_resort_reservation.interval_index import ReservationIntervalIndex
+from beach_resort_reservation.offline_store import OfflineStore
+
+
+@typeguard.typechecked
+class ReservationCache:
+
+    def __init__(self, ttl_seconds: float = app_utils.RESERVATION_CACHE_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.__ttl_seconds = ttl_seconds
+        self.__clock = clock
+        self.__reservations: Optional[Dict[ReservationID, ReservationFromServer]] = None
+        self.__fetched_at: Optional[float] = None
+        self.__etag: Optional[str] = None
+        self.__last_modified: Optional[str] = None
+        self.__offline_store: Optional[OfflineStore] = None
+        self.__interval_index = ReservationIntervalIndex()
+        self.__lock = threading.RLock()
+        self.__generation = 0
+
+    @property
+    def reservations(self) -> Optional[List[ReservationFromServer]]:
+        with self.__lock:
+            return list(self.__reservations.values()) if self.__reservations is not None else None
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.__etag
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.__last_modified
+
+    def is_fresh(self) -> bool:
+        return self.__reservations is not None and self.__fetched_at is not None and \
+            self.__clock() - self.__fetched_at < self.__ttl_seconds
+
+    def validators(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.__reservations is not None:
+            if self.__etag is not None:
+                headers['If-None-Match'] = self.__etag
+            if self.__last_modified is not None:
+                headers['If-Modified-Since'] = self.__last_modified
+        return headers
+
+    def persist_to(self, offline_store: Optional[OfflineStore]) -> None:
+        with self.__lock:
+            self.__offline_store = offline_store
+
+    def store(self, reservations: List[ReservationFromServer], etag: Optional[str] = None,
+              last_modified: Optional[str] = None, generation: Optional[int] = None) -> bool:
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return False
+            self.__interval_index.rebuild(reservations)
+            self.__reservations = {reservation.id: reservation for reservation in reservations}
+            self.__etag = etag
+            self.__last_modified = last_modified
+            self.__fetched_at = self.__clock()
+            if self.__offline_store is not None:
+                self.__offline_store.replace_reservations(reservations)
+            return True
+
+    def revalidated(self) -> None:
+        self.__fetched_at = self.__clock()
+
+    def add(self, reservation: ReservationFromServer) -> None:
+        with self.__lock:
+            self.__generation += 1
+            if self.__reservations is not None:
+                self.__reservations[reservation.id] = reservation
+                self.__interval_index.add(reservation)
+            if self.__offline_store is not None:
+                self.__offline_store.add_reservation(reservation)
+
+    def remove(self, reservation_id: ReservationID) -> None:
+        with self.__lock:
+            self.__generation += 1
+            if self.__reservations is not None:
+                self.__reservations.pop(reservation_id, None)
+                self.__interval_index.remove(reservation_id)
+            if self.__offline_store is not None:
+                self.__offline_store.remove_reservation(reservation_id)
+
+    def overlapping(self, new_reservation: NewReservation) -> List[ReservationID]:
+        with self.__lock:
+            return self.__interval_index.overlapping(new_reservation.umbrella_id, new_reservation.start_date,
+                                                     new_reservation.end_date)
+
+    def invalidate(self) -> None:
+        self.__fetched_at = None
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__reservations = None
+            self.__interval_index.rebuild(())
+            self.__fetched_at = None
+            self.__etag = None
+            self.__last_modified = None
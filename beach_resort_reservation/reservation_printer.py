@@ -0,0 +1,36 @@
+import typeguard
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.domain import ReservationFromServer
+
+
+@typeguard.typechecked
+class ReservationListPrinter:
+
+    def __init__(self):
+        self.__is_empty = True
+
+    @staticmethod
+    def __print_separator() -> None:
+        print('-' * 150)
+
+    def print_reservation(self, reservation: ReservationFromServer) -> None:
+        if self.__is_empty:
+            self.__is_empty = False
+            self.__print_separator()
+            print(app_utils.RESERVATION_FORMATTER % (
+                'Reservation ID', 'Reserved umbrella ID', 'Number of seats', 'From', 'To', 'Reservation price'))
+            self.__print_separator()
+        print(app_utils.RESERVATION_FORMATTER % (
+            reservation.id.value, reservation.umbrella_id.value,
+            reservation.number_of_seats.value,
+            reservation.start_date, reservation.end_date,
+            reservation.price))
+
+    def finish(self) -> None:
+        if self.__is_empty:
+            print()
+            print(app_utils.NO_RESERVATION_FOUND_FOR_USER)
+            print()
+        else:
+            self.__print_separator()
@@ -0,0 +1,210 @@
+import datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List, Union
+
+import numpy as np
+import typeguard
+import valid8
+
+from beach_resort_reservation import domain_utils
+from beach_resort_reservation.decoding import parse_date
+from beach_resort_reservation.domain import ReservationFromServer, ReservationID, NumberOfSeats, ReservedUmbrellaID, \
+    Price, construct_interned, construct_trusted, json_number_in_cents
+
+
+def _trusted_reservation(reservation_id: int, umbrella_id: int, number_of_seats: int, start_date: datetime.date,
+                         end_date: datetime.date, price_cents: int) -> ReservationFromServer:
+    return construct_trusted(ReservationFromServer,
+                             number_of_seats=construct_interned(NumberOfSeats, number_of_seats),
+                             umbrella_id=construct_interned(ReservedUmbrellaID, umbrella_id),
+                             start_date=start_date,
+                             end_date=end_date,
+                             price=construct_trusted(Price, value_in_cents=price_cents),
+                             id=construct_trusted(ReservationID, value=reservation_id))
+
+
+_PRICE_TYPES = frozenset((int, float, Decimal))
+
+
+def _validate_types(name: str, values: List[Any], types: frozenset) -> None:
+    if not set(map(type, values)) <= types:
+        invalid = [index for index, value in enumerate(values) if type(value) not in types][:10]
+        valid8.validate(name, invalid, max_len=0, help_msg=f'Positions of the values that are not JSON numbers of the '
+                                                             f'right kind: {invalid}')
+
+
+def _integer_column(name: str, values: List[Any]) -> np.ndarray:
+    _validate_types(name, values, frozenset((int,)))
+    return np.fromiter(values, dtype=np.int64, count=len(values))
+
+
+@typeguard.typechecked
+def prices_in_cents(values: List[Any]) -> np.ndarray:
+    _validate_types('prices', values, _PRICE_TYPES)
+    prices = np.fromiter(values, dtype=np.float64, count=len(values))
+    scaled = prices * 100
+    cents = np.rint(scaled)
+    with np.errstate(invalid='ignore'):
+        inexact = ~(np.abs(scaled - cents) <= domain_utils.PRICE_CENTS_TOLERANCE) | (prices < 0)
+    invalid = []
+    for index in np.flatnonzero(inexact).tolist():
+        value_in_cents = json_number_in_cents(values[index])
+        if value_in_cents is None:
+            invalid.append(index)
+        else:
+            cents[index] = value_in_cents
+    valid8.validate('invalid prices', len(invalid), equals=0,
+                    help_msg=f'Prices that are not finite, non negative numbers: {invalid[:10]}')
+    return cents.astype(np.int64)
+
+
+class ReservationRow:
+    __slots__ = ('__table', '__index')
+
+    def __init__(self, table: 'ReservationTable', index: int):
+        self.__table = table
+        self.__index = index
+
+    @property
+    def id(self) -> int:
+        return int(self.__table.ids[self.__index])
+
+    @property
+    def umbrella_id(self) -> int:
+        return int(self.__table.umbrella_ids[self.__index])
+
+    @property
+    def number_of_seats(self) -> int:
+        return int(self.__table.seats[self.__index])
+
+    @property
+    def start_date(self) -> datetime.date:
+        return self.__table.start_dates[self.__index].item()
+
+    @property
+    def end_date(self) -> datetime.date:
+        return self.__table.end_dates[self.__index].item()
+
+    @property
+    def price_in_cents(self) -> int:
+        return int(self.__table.price_cents[self.__index])
+
+    def to_reservation(self) -> ReservationFromServer:
+        return self.__table.reservation_at(self.__index)
+
+
+@typeguard.typechecked
+class ReservationTable:
+
+    def __init__(self, ids: Any, umbrella_ids: Any, seats: Any, start_dates: Any, end_dates: Any, price_cents: Any):
+        columns = [np.asarray(ids, dtype=np.int64), np.asarray(umbrella_ids, dtype=np.int64),
+                   np.asarray(seats, dtype=np.int64), np.asarray(start_dates, dtype='datetime64[D]'),
+                   np.asarray(end_dates, dtype='datetime64[D]'), np.asarray(price_cents, dtype=np.int64)]
+        valid8.validate('column lengths', len({len(column) for column in columns}), max_value=1)
+        invalid = ReservationTable.__invalid_rows(*columns)
+        valid8.validate('invalid reservation rows', int(invalid.sum()), equals=0,
+                        help_msg=f'Rows out of the domain limits: {np.flatnonzero(invalid)[:10].tolist()}')
+        self.__ids = columns[0]
+        self.__umbrella_ids = columns[1].astype(np.uint8)
+        self.__seats = columns[2].astype(np.uint8)
+        self.__start_dates, self.__end_dates, self.__price_cents = columns[3:]
+        for column in self.__columns():
+            column.flags.writeable = False
+
+    @staticmethod
+    def from_json(rows: List[Any]) -> 'ReservationTable':
+        return ReservationTable(
+            ids=_integer_column('ids', [row['id'] for row in rows]),
+            umbrella_ids=_integer_column('umbrella ids', [row['reserved_umbrella_id'] for row in rows]),
+            seats=_integer_column('numbers of seats', [row['number_of_seats'] for row in rows]),
+            start_dates=ReservationTable.__parse_dates([row['reservation_start_date'] for row in rows]),
+            end_dates=ReservationTable.__parse_dates([row['reservation_end_date'] for row in rows]),
+            price_cents=prices_in_cents([row['reservation_price'] for row in rows]))
+
+    @staticmethod
+    def from_reservations(reservations: Iterable[ReservationFromServer]) -> 'ReservationTable':
+        reservations = list(reservations)
+        return ReservationTable(ids=[reservation.id.value for reservation in reservations],
+                                umbrella_ids=[reservation.umbrella_id.value for reservation in reservations],
+                                seats=[reservation.number_of_seats.value for reservation in reservations],
+                                start_dates=[reservation.start_date for reservation in reservations],
+                                end_dates=[reservation.end_date for reservation in reservations],
+                                price_cents=[reservation.price.value_in_cents for reservation in reservations])
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.__ids
+
+    @property
+    def umbrella_ids(self) -> np.ndarray:
+        return self.__umbrella_ids
+
+    @property
+    def seats(self) -> np.ndarray:
+        return self.__seats
+
+    @property
+    def start_dates(self) -> np.ndarray:
+        return self.__start_dates
+
+    @property
+    def end_dates(self) -> np.ndarray:
+        return self.__end_dates
+
+    @property
+    def price_cents(self) -> np.ndarray:
+        return self.__price_cents
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.__columns())
+
+    def __len__(self) -> int:
+        return len(self.__ids)
+
+    def __getitem__(self, key: Any) -> Union[ReservationRow, 'ReservationTable']:
+        if isinstance(key, (int, np.integer)):
+            index = int(key) + len(self) if key < 0 else int(key)
+            if not 0 <= index < len(self):
+                raise IndexError(key)
+            return ReservationRow(self, index)
+        return ReservationTable(*(column[key] for column in self.__columns()))
+
+    def __iter__(self) -> Iterator[ReservationRow]:
+        return (ReservationRow(self, index) for index in range(len(self)))
+
+    def reservations(self) -> Iterator[ReservationFromServer]:
+        columns = zip(self.__ids.tolist(), self.__umbrella_ids.tolist(), self.__seats.tolist(),
+                      self.__start_dates.tolist(), self.__end_dates.tolist(), self.__price_cents.tolist())
+        return (_trusted_reservation(*row) for row in columns)
+
+    def reservation_at(self, index: int) -> ReservationFromServer:
+        return _trusted_reservation(int(self.__ids[index]), int(self.__umbrella_ids[index]),
+                                    int(self.__seats[index]), self.__start_dates[index].item(),
+                                    self.__end_dates[index].item(), int(self.__price_cents[index]))
+
+    def __columns(self) -> List[np.ndarray]:
+        return [self.__ids, self.__umbrella_ids, self.__seats, self.__start_dates, self.__end_dates,
+                self.__price_cents]
+
+    @staticmethod
+    def __parse_dates(values: List[Any]) -> np.ndarray:
+        try:
+            return np.array(values, dtype='datetime64[D]')
+        except ValueError:
+            return np.array([parse_date(value) for value in values], dtype='datetime64[D]')
+
+    @staticmethod
+    def __invalid_rows(ids: np.ndarray, umbrella_ids: np.ndarray, seats: np.ndarray, start_dates: np.ndarray,
+                       end_dates: np.ndarray, price_cents: np.ndarray) -> np.ndarray:
+        start_months = start_dates.astype('datetime64[M]')
+        last_months = start_months + domain_utils.MAX_DATE_DELTA_MONTHS_END_DATE
+        last_end_dates = np.minimum(last_months.astype('datetime64[D]') + (start_dates - start_months.astype(
+            'datetime64[D]')), (last_months + 1).astype('datetime64[D]') - 1)
+        return ((ids < 0)
+                | (umbrella_ids < domain_utils.MIN_NUMBER_UMBRELLA_ID)
+                | (umbrella_ids > domain_utils.MAX_NUMBER_UMBRELLA_ID)
+                | (seats < domain_utils.MIN_NUMBER_OF_SEATS) | (seats > domain_utils.MAX_NUMBER_OF_SEATS)
+                | (price_cents < 0) | (price_cents > domain_utils.MAX_PRICE_IN_CENTS)
+                | np.isnat(start_dates) | np.isnat(end_dates)
+                | (end_dates < start_dates) | (end_dates > last_end_dates))
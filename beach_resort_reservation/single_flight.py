@@ -0,0 +1,57 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+import typeguard
+
+T = TypeVar('T')
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class SingleFlightStatistics:
+    calls: int
+    executions: int
+
+    @property
+    def saved(self) -> int:
+        return self.calls - self.executions
+
+
+@typeguard.typechecked
+class SingleFlight:
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__in_flight: Dict[Hashable, Future] = {}
+        self.__calls = 0
+        self.__executions = 0
+
+    @property
+    def statistics(self) -> SingleFlightStatistics:
+        with self.__lock:
+            return SingleFlightStatistics(self.__calls, self.__executions)
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> Tuple[T, bool]:
+        with self.__lock:
+            self.__calls += 1
+            future = self.__in_flight.get(key)
+            is_shared = future is not None
+            if not is_shared:
+                future = Future()
+                self.__in_flight[key] = future
+                self.__executions += 1
+        if is_shared:
+            return future.result(), True
+        try:
+            result = function()
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self.__lock:
+                del self.__in_flight[key]
@@ -0,0 +1,81 @@
+import datetime
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import typeguard
+from valid8 import ValidationError
+
+from beach_resort_reservation.domain import ReservationFromServer, ReservationID, NumberOfSeats, ReservedUmbrellaID, \
+    Price
+
+_MAGIC = b'BRRS'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+_TEXT_LENGTH = struct.Struct('<H')
+_ROW = struct.Struct('<QBBIIQ')
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class ReservationSnapshot:
+    reservations: List[ReservationFromServer]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@typeguard.typechecked
+def encode_snapshot(snapshot: ReservationSnapshot) -> bytes:
+    parts = [_HEADER.pack(_MAGIC, _VERSION, len(snapshot.reservations))]
+    for text in (snapshot.etag, snapshot.last_modified):
+        encoded = (text or '').encode('utf-8')
+        parts.append(_TEXT_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    for reservation in snapshot.reservations:
+        parts.append(_ROW.pack(reservation.id.value, reservation.umbrella_id.value, reservation.number_of_seats.value,
+                               reservation.start_date.toordinal(), reservation.end_date.toordinal(),
+                               reservation.price.value_in_cents))
+    return b''.join(parts)
+
+
+@typeguard.typechecked
+def decode_snapshot(data: bytes) -> ReservationSnapshot:
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError('Unknown snapshot format')
+    offset = _HEADER.size
+    texts = []
+    for _ in range(2):
+        (length,) = _TEXT_LENGTH.unpack_from(data, offset)
+        offset += _TEXT_LENGTH.size
+        texts.append(data[offset:offset + length].decode('utf-8') or None)
+        offset += length
+    if len(data) != offset + count * _ROW.size:
+        raise ValueError('Truncated snapshot')
+    reservations = [ReservationFromServer(id=ReservationID(row[0]),
+                                          umbrella_id=ReservedUmbrellaID.of(row[1]),
+                                          number_of_seats=NumberOfSeats.of(row[2]),
+                                          start_date=datetime.date.fromordinal(row[3]),
+                                          end_date=datetime.date.fromordinal(row[4]),
+                                          price=Price.create_price(row[5] // 100, row[5] % 100))
+                    for row in _ROW.iter_unpack(data[offset:])]
+    return ReservationSnapshot(reservations, etag=texts[0], last_modified=texts[1])
+
+
+@typeguard.typechecked
+def write_snapshot(path: Path, snapshot: ReservationSnapshot) -> None:
+    temporary_path = path.with_name(path.name + '.tmp')
+    file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(file_descriptor, 'wb') as file:
+        file.write(encode_snapshot(snapshot))
+    os.replace(temporary_path, path)
+
+
+@typeguard.typechecked
+def read_snapshot(path: Path) -> Optional[ReservationSnapshot]:
+    try:
+        return decode_snapshot(path.read_bytes())
+    except (OSError, ValueError, struct.error, ValidationError):
+        return None
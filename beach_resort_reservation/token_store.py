@@ -0,0 +1,45 @@
+import json
+import os
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import typeguard
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class StoredToken:
+    account: str
+    key: str
+
+
+@typeguard.typechecked
+class TokenStore:
+
+    def __init__(self, path: Path):
+        self.__path = path
+
+    def load(self) -> Optional[StoredToken]:
+        try:
+            if stat.S_IMODE(self.__path.stat().st_mode) & 0o077:
+                return None
+            content = json.loads(self.__path.read_text(encoding='utf-8'))
+            return StoredToken(account=content['account'], key=content['key'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, token: StoredToken) -> None:
+        self.__path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temporary_path = self.__path.with_name(self.__path.name + '.tmp')
+        file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+            json.dump({'account': token.account, 'key': token.key}, file)
+        os.replace(temporary_path, self.__path)
+
+    def clear(self) -> None:
+        try:
+            self.__path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, TextIO
+
+import typeguard
+
+from beach_resort_reservation.transport import RequestTiming
+
+
+@typeguard.typechecked
+class Tracer:
+
+    def __init__(self, path: Optional[Path] = None):
+        self.__path = path
+        self.__lock = threading.Lock()
+        self.__file: Optional[TextIO] = None
+        self.__is_started = False
+        self.__named_threads: Set[int] = set()
+        self.__pid = os.getpid()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.__path is not None
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Optional[Dict[str, Any]] = None):
+        if self.__path is None:
+            yield {}
+            return
+        span_args = dict(args) if args is not None else {}
+        started_at = time.perf_counter()
+        try:
+            yield span_args
+        finally:
+            self.complete(name, category, started_at, time.perf_counter() - started_at, span_args)
+
+    def around(self, name: str, action: Callable[[], None]) -> None:
+        with self.span(name, 'menu'):
+            action()
+
+    def observe_request(self, timing: RequestTiming) -> None:
+        self.complete(f'{timing.method} {timing.route}', 'http', time.perf_counter() - timing.total_seconds,
+                      timing.total_seconds,
+                      {'status': timing.status_code, 'dns_ms': timing.dns_seconds * 1000,
+                       'connect_ms': timing.connect_seconds * 1000, 'ttfb_ms': timing.ttfb_seconds * 1000,
+                       'payload_bytes': timing.payload_bytes})
+
+    def complete(self, name: str, category: str, started_at: float, seconds: float,
+                 args: Optional[Dict[str, Any]] = None) -> None:
+        if self.__path is None:
+            return
+        thread = threading.current_thread()
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': started_at * 1_000_000, 'dur': seconds * 1_000_000,
+                 'pid': self.__pid, 'tid': thread.ident, 'args': args if args is not None else {}}
+        with self.__lock:
+            if thread.ident not in self.__named_threads:
+                self.__named_threads.add(thread.ident)
+                self.__write({'name': 'thread_name', 'ph': 'M', 'pid': self.__pid, 'tid': thread.ident,
+                              'args': {'name': thread.name}})
+            self.__write(event)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def __write(self, event: Dict[str, Any]) -> None:
+        if self.__file is None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            self.__file = open(self.__path, 'a' if self.__is_started else 'w', encoding='utf-8')
+            if not self.__is_started:
+                self.__file.write('[\n')
+                self.__is_started = True
+        self.__file.write(json.dumps(event, default=str) + ',\n')
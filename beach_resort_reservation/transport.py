@@ -0,0 +1,185 @@
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+import typeguard
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from beach_resort_reservation import app_utils
+
+_connection_phases = threading.local()
+
+
+@typeguard.typechecked
+@dataclass(frozen=True)
+class RequestTiming:
+    method: str
+    route: str
+    status_code: Optional[int]
+    dns_seconds: float
+    connect_seconds: float
+    ttfb_seconds: float
+    total_seconds: float
+    payload_bytes: Optional[int]
+
+
+class _TimedConnectionMixin:
+
+    def _new_conn(self):
+        phases = getattr(_connection_phases, 'current', None)
+        if phases is None:
+            return super()._new_conn()
+        host = self._dns_host
+        started_at = time.perf_counter()
+        try:
+            addresses = list(dict.fromkeys(info[4][0] for info in socket.getaddrinfo(
+                host, self.port, allowed_gai_family(), socket.SOCK_STREAM)))
+        except OSError:
+            addresses = [host]
+        phases['dns'] += time.perf_counter() - started_at
+        try:
+            for address in addresses[:-1]:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError):
+                    continue
+            self._dns_host = addresses[-1]
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        phases = getattr(_connection_phases, 'current', None)
+        dns_seconds = phases['dns'] if phases is not None else 0.0
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            if phases is not None:
+                phases['connect'] += time.perf_counter() - started_at - (phases['dns'] - dns_seconds)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool,
+                                                   'https': _TimedHTTPSConnectionPool}
+
+
+@typeguard.typechecked
+def request_route(end_point: str) -> str:
+    return re.sub(r'/\d+(?=/|$)', '/{id}', end_point)
+
+
+@typeguard.typechecked
+class Transport:
+
+    def __init__(self, base_url: str = app_utils.API_SERVER, pool_connections: int = app_utils.POOL_CONNECTIONS,
+                 pool_maxsize: int = app_utils.POOL_MAXSIZE, keep_alive: bool = True, timeout: Optional[float] = None):
+        self.__base_url = base_url
+        self.__timeout = timeout
+        self.__observers: List[Callable[[RequestTiming], None]] = []
+        self.__session = requests.Session()
+        adapter = _TimedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+        self.__session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+
+    @property
+    def headers(self):
+        return self.__session.headers
+
+    def authorize(self, api_key: str) -> None:
+        self.__session.headers['Authorization'] = f'Token {api_key}'
+
+    def deauthorize(self) -> None:
+        self.__session.headers.pop('Authorization', None)
+
+    def add_observer(self, observer: Callable[[RequestTiming], None]) -> None:
+        self.__observers.append(observer)
+
+    def get(self, end_point: str, **kwargs: Any) -> Response:
+        return self.__timed('GET', end_point, kwargs, self.__session.get)
+
+    def head(self, end_point: str, **kwargs: Any) -> Response:
+        return self.__timed('HEAD', end_point, kwargs, self.__session.head)
+
+    def post(self, end_point: str, **kwargs: Any) -> Response:
+        return self.__timed('POST', end_point, kwargs, self.__session.post)
+
+    def delete(self, end_point: str, **kwargs: Any) -> Response:
+        return self.__timed('DELETE', end_point, kwargs, self.__session.delete)
+
+    def close(self) -> None:
+        self.__session.close()
+
+    def __timed(self, method: str, end_point: str, kwargs: Dict[str, Any], send: Callable[..., Response]) -> Response:
+        if not self.__observers:
+            return send(url=f'{self.__base_url}{end_point}', **self.__with_timeout(kwargs))
+        phases = _connection_phases.current = {'dns': 0.0, 'connect': 0.0}
+        is_stream = kwargs.get('stream', False)
+        started_at = time.perf_counter()
+        response: Optional[Response] = None
+        try:
+            response = send(url=f'{self.__base_url}{end_point}', **self.__with_timeout(kwargs))
+            return response
+        finally:
+            total_seconds = time.perf_counter() - started_at
+            _connection_phases.current = None
+            timing = RequestTiming(method=method, route=request_route(end_point),
+                                   status_code=response.status_code if response is not None else None,
+                                   dns_seconds=phases['dns'], connect_seconds=phases['connect'],
+                                   ttfb_seconds=response.elapsed.total_seconds() if response is not None else 0.0,
+                                   total_seconds=total_seconds,
+                                   payload_bytes=self.__payload_bytes(response, is_stream))
+            for observer in self.__observers:
+                observer(timing)
+
+    @staticmethod
+    def __payload_bytes(response: Optional[Response], is_stream: bool) -> Optional[int]:
+        if response is None:
+            return None
+        content_length = response.headers.get('Content-Length')
+        if content_length is not None and content_length.isdigit():
+            return int(content_length)
+        if is_stream or response.content is None:
+            return None
+        return len(response.content)
+
+    def __with_timeout(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.__timeout is not None:
+            kwargs.setdefault('timeout', self.__timeout)
+        return kwargs
+
+
+@typeguard.typechecked
+def release_response(response: Response) -> None:
+    _ = response.content
+    response.close()
@@ -0,0 +1,85 @@
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from beach_resort_reservation.decoding import ValidationLevel, reservation_decoder
+from beach_resort_reservation.domain import NumberOfSeats, ReservedUmbrellaID, ReservationFromServer, \
+    construct_trusted
+from benchmarks.micro import reservation_rows
+
+MODES = ('interned', 'fresh')
+
+
+def decoder(level: ValidationLevel, mode: str) -> Callable[[Dict[str, Any]], ReservationFromServer]:
+    decode = reservation_decoder(level)
+    if mode == 'interned':
+        return decode
+
+    def decode_with_fresh_value_objects(row: Dict[str, Any]) -> ReservationFromServer:
+        reservation = decode(row)
+        object.__setattr__(reservation, 'number_of_seats', construct_trusted(NumberOfSeats,
+                                                                             value=row['number_of_seats']))
+        object.__setattr__(reservation, 'umbrella_id', construct_trusted(ReservedUmbrellaID,
+                                                                         value=row['reserved_umbrella_id']))
+        return reservation
+
+    return decode_with_fresh_value_objects
+
+
+def measure(level: ValidationLevel, mode: str, size: int) -> Dict[str, float]:
+    rows = reservation_rows(size)
+    decode = decoder(level, mode)
+    gc.collect()
+    resident_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    reservations = [decode(row) for row in rows]
+    resident_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    blocks = sys.getallocatedblocks()
+    del reservations
+    gc.collect()
+    blocks -= sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        reservations = [decode(row) for row in rows]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del reservations
+    return {'retained_bytes_per_row': retained / size,
+            'blocks_per_row': blocks / size,
+            'resident_bytes_per_row': (resident_after - resident_before) * 1024 / size}
+
+
+def measure_in_subprocess(level: ValidationLevel, mode: str, size: int) -> Dict[str, float]:
+    output = subprocess.run([sys.executable, '-m', 'benchmarks.bench_memory', '--level', level.value, '--rows',
+                             str(size), '--child', mode], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory held by a decoded reservation list, with the seats and '
+                                                 'umbrella ids interned or allocated for every row')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--level', choices=[level.value for level in ValidationLevel],
+                        default=ValidationLevel.BOUNDARY.value)
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    level = ValidationLevel(args.level)
+    if args.child:
+        print(json.dumps(measure(level, args.child, args.rows)))
+        return
+    results: List[Dict[str, Any]] = [{'mode': mode, **measure_in_subprocess(level, mode, args.rows)}
+                                     for mode in MODES]
+    print('%-10s %-22s %-15s %-22s' % ('Mode', 'Retained B per row', 'Blocks per row', 'Resident B per row'))
+    for result in results:
+        print('%-10s %-22.1f %-15.2f %-22.1f' % (result['mode'], result['retained_bytes_per_row'],
+                                                 result['blocks_per_row'], result['resident_bytes_per_row']))
+
+
+if __name__ == '__main__':
+    main()
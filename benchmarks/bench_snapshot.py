@@ -0,0 +1,52 @@
+import argparse
+import io
+import statistics
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.app import App
+from beach_resort_reservation.instrumentation import Instrumentation
+from beach_resort_reservation.transport import Transport
+from benchmarks.stand_in_server import running_stand_in_server
+
+
+def time_to_first_table(base_url: str, snapshot_directory: Optional[Path]) -> float:
+    instrumentation = Instrumentation()
+    transport = Transport(base_url=base_url)
+    app = App(transport=transport, instrumentation=instrumentation, snapshot_directory=snapshot_directory)
+    with patch('builtins.input', side_effect=['1', 'bench', '0']), \
+            patch('getpass.getpass', return_value='password'), redirect_stdout(io.StringIO()):
+        app.run()
+    transport.close()
+    return instrumentation.summary()['timings'][app_utils.METRIC_TIME_TO_FIRST_TABLE]['last_seconds']
+
+
+def run_sessions(base_url: str, snapshot_directory: Optional[Path], sessions: int) -> List[float]:
+    return [time_to_first_table(base_url, snapshot_directory) for _ in range(sessions)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Time to first table with and without the reservation snapshot')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--sessions', type=int, default=10)
+    args = parser.parse_args()
+
+    with running_stand_in_server(dataset_size=args.rows) as server, tempfile.TemporaryDirectory() as directory:
+        cold = run_sessions(server.base_url, None, args.sessions)
+        time_to_first_table(server.base_url, Path(directory))
+        warm = run_sessions(server.base_url, Path(directory), args.sessions)
+
+    cold_median = statistics.median(cold) * 1000
+    warm_median = statistics.median(warm) * 1000
+    print('%-10s %-25s' % ('Start', 'Time to first table p50 (ms)'))
+    print('%-10s %-25.3f' % ('cold', cold_median))
+    print('%-10s %-25.3f' % ('warm', warm_median))
+    print(f'Speedup: {cold_median / warm_median:.2f}x with {args.rows} reservations')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List
+
+from requests import Response
+
+from beach_resort_reservation.app import App
+from beach_resort_reservation.domain import NewReservation, NumberOfSeats, ReservedUmbrellaID, ReservationID
+from beach_resort_reservation.transport import Transport
+from benchmarks.stand_in_server import running_stand_in_server
+
+ACTIONS = ('login', 'list', 'create', 'delete', 'logout')
+
+
+def timed(timings: Dict[str, List[float]], action: str, request: Callable[[], Response]) -> Response:
+    start = time.perf_counter()
+    response = request()
+    timings[action].append(time.perf_counter() - start)
+    return response
+
+
+def run_actions(base_url: str, keep_alive: bool, rounds: int) -> Dict[str, List[float]]:
+    transport = Transport(base_url=base_url, keep_alive=keep_alive)
+    app = App(transport=transport)
+    new_reservation = NewReservation(NumberOfSeats(2), ReservedUmbrellaID(1), date.today(),
+                                     date.today() + timedelta(days=1))
+    timings: Dict[str, List[float]] = {action: [] for action in ACTIONS}
+    for _ in range(rounds):
+        login_response = timed(timings, 'login', lambda: app.do_login_request('bench', 'password'))
+        transport.authorize(login_response.json()['key'])
+        timed(timings, 'list', app.do_retrieve_reservation_list_request)
+        created = timed(timings, 'create', lambda: app.do_new_reservation_request(new_reservation)).json()
+        timed(timings, 'delete', lambda: app.do_reservation_delete_request(ReservationID(created['id'])))
+        timed(timings, 'logout', app.do_logout_request)
+        transport.deauthorize()
+    transport.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-action latency with and without connection pooling')
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    with running_stand_in_server() as server:
+        pooled = run_actions(server.base_url, keep_alive=True, rounds=args.rounds)
+        unpooled = run_actions(server.base_url, keep_alive=False, rounds=args.rounds)
+
+    print('%-10s %-20s %-20s %-10s' % ('Action', 'Unpooled p50 (ms)', 'Pooled p50 (ms)', 'Speedup'))
+    for action in ACTIONS:
+        unpooled_median = statistics.median(unpooled[action]) * 1000
+        pooled_median = statistics.median(pooled[action]) * 1000
+        print('%-10s %-20.3f %-20.3f %-10.2f' % (action, unpooled_median, pooled_median,
+                                                 unpooled_median / pooled_median))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from beach_resort_reservation.decoding import ValidationLevel, reservation_decoder
+from benchmarks.micro import reservation_rows
+
+
+def microseconds_per_row(level: ValidationLevel, rows: List[Dict], repeats: int) -> float:
+    decode = reservation_decoder(level)
+    samples = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        for row in rows:
+            decode(row)
+        samples.append((time.perf_counter() - started_at) / len(rows) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-row decoding time of the server reservations at every '
+                                                 'validation level')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = reservation_rows(args.rows)
+    results = {level: microseconds_per_row(level, rows, args.repeats) for level in ValidationLevel}
+    print('%-10s %-15s %-10s' % ('Level', 'us per row', 'Speedup'))
+    for level, microseconds in results.items():
+        print('%-10s %-15.2f %-10.2f' % (level.value, microseconds, results[ValidationLevel.STRICT] / microseconds))
+
+
+if __name__ == '__main__':
+    main()
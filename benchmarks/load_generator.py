@@ -0,0 +1,214 @@
+import argparse
+import getpass
+import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+from requests import RequestException, Response
+
+from beach_resort_reservation import domain_utils
+from beach_resort_reservation.app import App
+from beach_resort_reservation.domain import NewReservation, NumberOfSeats, ReservedUmbrellaID, ReservationID
+from beach_resort_reservation.transport import Transport, release_response
+from benchmarks.stand_in_server import running_stand_in_server
+
+ENDPOINTS = ('login', 'list', 'create', 'delete', 'logout')
+DEFAULT_MIX = 'list=6,create=2,delete=2'
+DEFAULT_USERNAME = 'load'
+DEFAULT_PASSWORD = 'password'
+LOGIN_BACKOFF_SECONDS = 0.5
+LOGIN_BACKOFF_MAX_SECONDS = 8.0
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = {}
+    for part in mix.split(','):
+        action, weight = part.split('=')
+        if action not in ('list', 'create', 'delete'):
+            raise ValueError(f'Unknown action in the mix: {action}')
+        weights[action] = int(weight)
+    return weights
+
+
+def percentile(samples: List[float], rank: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(rank / 100 * len(ordered)) - 1)]
+
+
+class LoadReport:
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {endpoint: [] for endpoint in ENDPOINTS}
+        self.errors: Dict[str, int] = {endpoint: 0 for endpoint in ENDPOINTS}
+        self.elapsed_seconds = 0.0
+
+    def record(self, endpoint: str, seconds: float, is_error: bool) -> None:
+        with self.__lock:
+            self.latencies[endpoint].append(seconds)
+            self.errors[endpoint] += is_error
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for endpoint in ENDPOINTS:
+            samples = self.latencies[endpoint]
+            if not samples:
+                continue
+            summary[endpoint] = {'requests': len(samples), 'errors': self.errors[endpoint],
+                                 'throughput_per_second': len(samples) / self.elapsed_seconds,
+                                 'p50_ms': percentile(samples, 50) * 1000,
+                                 'p95_ms': percentile(samples, 95) * 1000,
+                                 'p99_ms': percentile(samples, 99) * 1000}
+        return summary
+
+
+class SimulatedUser:
+
+    def __init__(self, base_url: str, report: LoadReport, weights: Dict[str, int], think_seconds: float,
+                 actions_per_session: int, seed: int, username: str = DEFAULT_USERNAME,
+                 password: str = DEFAULT_PASSWORD):
+        self.__username = username
+        self.__password = password
+        self.__failed_logins = 0
+        self.__transport = Transport(base_url=base_url)
+        self.__app = App(transport=self.__transport)
+        self.__report = report
+        self.__weights = weights
+        self.__think_seconds = think_seconds
+        self.__actions_per_session = actions_per_session
+        self.__random = random.Random(seed)
+        self.__created: List[int] = []
+
+    def __timed(self, endpoint: str, request: Callable[[], Response], ok_status_codes: tuple) -> Optional[Response]:
+        started_at = time.perf_counter()
+        try:
+            response = request()
+            _ = response.content
+        except RequestException:
+            self.__report.record(endpoint, time.perf_counter() - started_at, True)
+            return None
+        self.__report.record(endpoint, time.perf_counter() - started_at, response.status_code not in ok_status_codes)
+        release_response(response)
+        return response
+
+    def __think(self) -> None:
+        if self.__think_seconds > 0:
+            time.sleep(self.__random.expovariate(1 / self.__think_seconds))
+
+    def __new_reservation(self) -> NewReservation:
+        start_date = date.today() + timedelta(days=self.__random.randrange(90))
+        return NewReservation(NumberOfSeats(self.__random.randint(domain_utils.MIN_NUMBER_OF_SEATS,
+                                                                  domain_utils.MAX_NUMBER_OF_SEATS)),
+                              ReservedUmbrellaID(self.__random.randint(domain_utils.MIN_NUMBER_UMBRELLA_ID,
+                                                                       domain_utils.MAX_NUMBER_UMBRELLA_ID)),
+                              start_date, start_date + timedelta(days=self.__random.randrange(7)))
+
+    def __run_action(self, action: str) -> None:
+        if action == 'list':
+            self.__timed('list', self.__app.do_retrieve_reservation_list_request, (200,))
+        elif action == 'delete' and self.__created:
+            reservation_id = self.__created.pop(self.__random.randrange(len(self.__created)))
+            self.__timed('delete', lambda: self.__app.do_reservation_delete_request(ReservationID(reservation_id)),
+                         (200, 202, 204))
+        else:
+            new_reservation = self.__new_reservation()
+            response = self.__timed('create', lambda: self.__app.do_new_reservation_request(new_reservation), (201,))
+            if response is not None and response.status_code == 201:
+                self.__created.append(response.json()['id'])
+
+    def run_session(self) -> bool:
+        response = self.__timed('login', lambda: self.__app.do_login_request(self.__username, self.__password),
+                                (200,))
+        if response is None or response.status_code != 200:
+            self.__failed_logins += 1
+            return False
+        self.__failed_logins = 0
+        self.__transport.authorize(response.json()['key'])
+        actions = list(self.__weights)
+        weights = [self.__weights[action] for action in actions]
+        for _ in range(self.__actions_per_session):
+            self.__think()
+            self.__run_action(self.__random.choices(actions, weights)[0])
+        self.__think()
+        self.__timed('logout', self.__app.do_logout_request, (200,))
+        self.__transport.deauthorize()
+        return True
+
+    def run_until(self, deadline: float) -> None:
+        try:
+            while time.perf_counter() < deadline:
+                if not self.run_session():
+                    backoff = min(LOGIN_BACKOFF_MAX_SECONDS, LOGIN_BACKOFF_SECONDS * 2 ** (self.__failed_logins - 1))
+                    time.sleep(max(0.0, min(backoff, deadline - time.perf_counter())))
+        finally:
+            self.__transport.close()
+
+
+def generate_load(base_url: str, users: int, duration_seconds: float, mix: str = DEFAULT_MIX,
+                  think_seconds: float = 0.0, actions_per_session: int = 10, seed: int = 0,
+                  username: str = DEFAULT_USERNAME, password: str = DEFAULT_PASSWORD) -> LoadReport:
+    report = LoadReport()
+    weights = parse_mix(mix)
+    simulated_users = [SimulatedUser(base_url, report, weights, think_seconds, actions_per_session, seed + index,
+                                     username, password) for index in range(users)]
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        for future in [executor.submit(user.run_until, started_at + duration_seconds) for user in simulated_users]:
+            future.result()
+    report.elapsed_seconds = time.perf_counter() - started_at
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Concurrent simulated users doing login, list, create, delete and '
+                                                 'logout cycles')
+    parser.add_argument('--base-url', default=None, help='API to load; a stand-in server is started when omitted')
+    parser.add_argument('--username', default=DEFAULT_USERNAME, help='account every simulated user logs in with')
+    parser.add_argument('--password', default=None,
+                        help='password of the account; asked on the terminal when --base-url is given without it')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds of load')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='relative weights of list, create and delete')
+    parser.add_argument('--think-ms', type=float, default=100.0, help='mean think time between two actions')
+    parser.add_argument('--actions-per-session', type=int, default=10)
+    parser.add_argument('--reservations', type=int, default=1_000, help='dataset size of the stand-in server')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='latency of the stand-in server')
+    parser.add_argument('--json', default=None, help='also write the report as JSON to this file')
+    args = parser.parse_args()
+    password = args.password
+    if password is None:
+        password = getpass.getpass(f'Password of {args.username}: ') if args.base_url is not None \
+            else DEFAULT_PASSWORD
+
+    with ExitStack() as stack:
+        base_url = args.base_url
+        if base_url is None:
+            server = stack.enter_context(running_stand_in_server(dataset_size=args.reservations,
+                                                                 latency_seconds=args.latency_ms / 1000))
+            base_url = server.base_url
+        report = generate_load(base_url, args.users, args.duration, args.mix, args.think_ms / 1000,
+                               args.actions_per_session, username=args.username, password=password)
+
+    summary = report.summary()
+    print('%-10s %-10s %-8s %-12s %-10s %-10s %-10s' % ('Endpoint', 'Requests', 'Errors', 'Req/s', 'p50 (ms)',
+                                                         'p95 (ms)', 'p99 (ms)'))
+    for endpoint, row in summary.items():
+        print('%-10s %-10d %-8d %-12.1f %-10.2f %-10.2f %-10.2f' % (endpoint, row['requests'], row['errors'],
+                                                                    row['throughput_per_second'], row['p50_ms'],
+                                                                    row['p95_ms'], row['p99_ms']))
+    total = sum(row['requests'] for row in summary.values())
+    print(f'Total: {total} requests in {report.elapsed_seconds:.1f} s ({total / report.elapsed_seconds:.1f} req/s) '
+          f'from {args.users} users')
+    if args.json is not None:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
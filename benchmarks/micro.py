@@ -0,0 +1,209 @@
+import argparse
+import gc
+import io
+import json
+import sys
+import timeit
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+from dateutil.parser import parse
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.decoding import ValidationLevel, parse_date, parse_iso_date, reservation_decoder, \
+    reservation_from_json, reservation_from_server_json
+from beach_resort_reservation.domain import Price
+from beach_resort_reservation.interval_index import ReservationIntervalIndex
+from beach_resort_reservation.menu import Menu, Description, Entry
+from beach_resort_reservation.reservation_cache import ReservationCache
+from beach_resort_reservation.reservation_table import ReservationTable, prices_in_cents
+
+SIZES = (10, 1_000, 100_000, 1_000_000)
+ALLOCATION_SAMPLE = 10_000
+REPEATS = 5
+MAX_REPEAT_SECONDS = 5.0
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+
+
+def reservation_rows(size: int) -> List[Dict[str, Any]]:
+    return [{'id': index, 'number_of_seats': 2 + index % 3, 'reservation_start_date': f'2023-07-{1 + index % 28:02}',
+             'reservation_end_date': f'2023-07-{1 + index % 28:02}', 'reserved_umbrella_id': index % 51,
+             'reservation_price': 10.5 * (1 + index % 40)} for index in range(size)]
+
+
+def decode_reservations(size: int, level: ValidationLevel = ValidationLevel.STRICT) -> Callable[[], Any]:
+    rows = reservation_rows(size)
+    decode = reservation_decoder(level)
+    return lambda: [decode(row) for row in rows]
+
+
+def build_reservation_table(size: int) -> Callable[[], Any]:
+    rows = reservation_rows(size)
+    return lambda: ReservationTable.from_json(rows)
+
+
+def parse_prices(size: int) -> Callable[[], Any]:
+    prices = ['{0:.2f}'.format(row['reservation_price']) for row in reservation_rows(size)]
+    return lambda: [Price.parse(price) for price in prices]
+
+
+def decode_prices(size: int, mode: str) -> Callable[[], Any]:
+    prices = [row['reservation_price'] for row in reservation_rows(size)]
+    if mode == 'batch':
+        return lambda: prices_in_cents(prices)
+    if mode == 'exact':
+        return lambda: [Price.from_json(price) for price in prices]
+    return lambda: [Price.parse('{0:.2f}'.format(price)) for price in prices]
+
+
+def parse_dates(size: int) -> Callable[[], Any]:
+    dates = [row['reservation_start_date'] for row in reservation_rows(size)]
+    return lambda: [parse(date).date() for date in dates]
+
+
+def parse_iso_dates(size: int, cached: bool = True) -> Callable[[], Any]:
+    dates = [row['reservation_start_date'] for row in reservation_rows(size)]
+    decode = parse_date if cached else parse_iso_date
+    return lambda: [decode(date) for date in dates]
+
+
+def print_menus(size: int) -> Callable[[], Any]:
+    builder = Menu.Builder(Description(app_utils.APP_NAME_MENU))
+    for key in range(1, 8):
+        builder.with_entry(Entry.create(str(key), f'Entry {key}'))
+    menu = builder.with_entry(Entry.create('0', 'Exit', is_exit=True)).build()
+
+    def print_all() -> str:
+        keys = iter(['1'] * (size - 1) + ['0'])
+        output = io.StringIO()
+        with redirect_stdout(output), patch('builtins.input', new=lambda prompt: next(keys)):
+            menu.run()
+        return output.getvalue()
+
+    return print_all
+
+
+def format_rows(size: int) -> Callable[[], Any]:
+    reservations = [reservation_from_json(row) for row in reservation_rows(min(size, ALLOCATION_SAMPLE))]
+    rows = [reservations[index % len(reservations)] for index in range(size)]
+    return lambda: [app_utils.RESERVATION_FORMATTER % (
+        reservation.id.value, reservation.umbrella_id.value, reservation.number_of_seats.value,
+        reservation.start_date, reservation.end_date, reservation.price) for reservation in rows]
+
+
+def store_reservations(size: int) -> Callable[[], Any]:
+    reservations = [reservation_from_server_json(row) for row in reservation_rows(size)]
+    return lambda: ReservationCache().store(reservations)
+
+
+def rebuild_interval_index(size: int) -> Callable[[], Any]:
+    reservations = [reservation_from_server_json(row) for row in reservation_rows(size)]
+    return lambda: ReservationIntervalIndex().rebuild(reservations)
+
+
+CASES: Dict[str, Callable[[int], Callable[[], Any]]] = {
+    'reservation_from_json': decode_reservations,
+    'reservation_from_json_boundary': lambda size: decode_reservations(size, ValidationLevel.BOUNDARY),
+    'reservation_from_json_off': lambda size: decode_reservations(size, ValidationLevel.OFF),
+    'reservation_table_from_json': build_reservation_table,
+    'price_parse': parse_prices,
+    'price_format_and_parse': lambda size: decode_prices(size, 'format'),
+    'price_from_json': lambda size: decode_prices(size, 'exact'),
+    'price_from_json_batch': lambda size: decode_prices(size, 'batch'),
+    'dateutil_parse': parse_dates,
+    'iso_date_parse': parse_iso_dates,
+    'iso_date_parse_uncached': lambda size: parse_iso_dates(size, cached=False),
+    'menu_print': print_menus,
+    'reservation_formatter': format_rows,
+    'reservation_cache_store': store_reservations,
+    'interval_index_rebuild': rebuild_interval_index,
+}
+
+
+def measure_time(case: Callable[[int], Callable[[], Any]], size: int, repeats: int = REPEATS) -> float:
+    case(min(size, ALLOCATION_SAMPLE))()
+    timer = timeit.Timer(case(size))
+    gc.collect()
+    number, elapsed = timer.autorange()
+    timings = [elapsed / number]
+    while len(timings) < repeats and sum(timings) * number < MAX_REPEAT_SECONDS:
+        timings.append(timer.timeit(number) / number)
+    return size / min(timings)
+
+
+def measure_allocations(case: Callable[[int], Callable[[], Any]], size: int) -> Dict[str, float]:
+    sample = min(size, ALLOCATION_SAMPLE)
+    run = case(sample)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = run()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return {'blocks_per_op': blocks / sample, 'peak_bytes_per_op': peak / sample}
+
+
+def run_suite(cases: List[str], sizes: List[int], repeats: int = REPEATS) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in cases:
+        for size in sizes:
+            measurement = {'ops_per_second': measure_time(CASES[name], size, repeats)}
+            measurement.update(measure_allocations(CASES[name], size))
+            results.setdefault(name, {})[str(size)] = measurement
+            print(f'{name:<32} {size:>9} {measurement["ops_per_second"]:>14.0f} ops/s '
+                  f'{measurement["blocks_per_op"]:>8.1f} blocks/op {measurement["peak_bytes_per_op"]:>9.0f} B/op',
+                  flush=True)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Dict[str, float]]], baseline: Dict[str, Dict[str, Dict[str, float]]],
+            tolerance: float) -> List[str]:
+    regressions = []
+    for name, by_size in results.items():
+        for size, measurement in by_size.items():
+            reference = baseline.get(name, {}).get(size)
+            if reference is None:
+                continue
+            speed = measurement['ops_per_second'] / reference['ops_per_second']
+            blocks = (measurement['blocks_per_op'] + 1) / (reference['blocks_per_op'] + 1)
+            print(f'{name:<32} {size:>9} speed x{speed:.2f} blocks x{blocks:.2f}')
+            if speed < 1 - tolerance or blocks > 1 + tolerance:
+                regressions.append(f'{name}[{size}]')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of parsing, domain construction and rendering')
+    parser.add_argument('--cases', default=','.join(CASES), help='comma separated subset of: ' + ', '.join(CASES))
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)))
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown before failing')
+    parser.add_argument('--repeats', type=int, default=REPEATS,
+                        help='timed runs per case after the warm-up, the fastest one is kept')
+    args = parser.parse_args()
+
+    results = run_suite(args.cases.split(','), [int(size) for size in args.sizes.split(',')], args.repeats)
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        for name, by_size in results.items():
+            baseline.setdefault(name, {}).update(by_size)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+        return
+    if args.baseline.exists():
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print('Regressions: ' + ', '.join(regressions))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, Optional, Set
+from urllib.parse import parse_qs, urlsplit
+
+from beach_resort_reservation import app_utils, domain_utils
+
+API_PREFIX = '/api/v1'
+TOKEN = 'stand-in-token'
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, dataset_size: int = 0, latency_seconds: float = 0.0):
+        super().__init__(('127.0.0.1', port), StandInRequestHandler)
+        self.lock = threading.Lock()
+        self.reservations: Dict[int, Dict[str, Any]] = {}
+        self.usernames: Set[str] = set()
+        self.next_id = 1
+        self.version = 0
+        self.latency_seconds = latency_seconds
+        self.populate(dataset_size)
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}{API_PREFIX}'
+
+    def add_reservation(self, umbrella_id: int, number_of_seats: int, start_date: str, end_date: str) -> Dict:
+        with self.lock:
+            reservation = {'id': self.next_id, 'number_of_seats': number_of_seats,
+                           'reservation_start_date': start_date, 'reservation_end_date': end_date,
+                           'reserved_umbrella_id': umbrella_id,
+                           'reservation_price': 10.5 * number_of_seats * (
+                                   (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1)}
+            self.reservations[self.next_id] = reservation
+            self.next_id += 1
+            self.version += 1
+            return reservation
+
+    def populate(self, count: int, first_date: date = date(2023, 6, 1)) -> None:
+        umbrellas = domain_utils.MAX_NUMBER_UMBRELLA_ID - domain_utils.MIN_NUMBER_UMBRELLA_ID + 1
+        seats = domain_utils.MAX_NUMBER_OF_SEATS - domain_utils.MIN_NUMBER_OF_SEATS + 1
+        for index in range(count):
+            start_date = first_date + timedelta(days=index // umbrellas % 90)
+            self.add_reservation(domain_utils.MIN_NUMBER_UMBRELLA_ID + index % umbrellas,
+                                 domain_utils.MIN_NUMBER_OF_SEATS + index % seats,
+                                 start_date.isoformat(), (start_date + timedelta(days=index % 7)).isoformat())
+
+    def register(self, form: Dict[str, str]) -> Dict[str, list]:
+        errors: Dict[str, list] = {}
+        if not form.get('username'):
+            errors['username'] = ['This field may not be blank.']
+        if not form.get('password1'):
+            errors['password1'] = ['This field may not be blank.']
+        if form.get('password1') != form.get('password2'):
+            errors['non_field_errors'] = ["The two password fields didn't match."]
+        with self.lock:
+            if form.get('username') in self.usernames:
+                errors['username'] = ['A user with that username already exists.']
+            if not errors:
+                self.usernames.add(form['username'])
+        return errors
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: StandInServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def __path(self) -> str:
+        path = urlsplit(self.path).path
+        return path[len(API_PREFIX):] if path.startswith(API_PREFIX) else path
+
+    def __read_form(self) -> Dict[str, str]:
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length).decode() if length else ''
+        return {key: values[0] for key, values in parse_qs(body).items()}
+
+    def __is_authorized(self) -> bool:
+        return self.headers.get('Authorization') == f'Token {TOKEN}'
+
+    def __reply(self, status: int, payload: Optional[Any] = None, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def __wait_latency(self) -> None:
+        if self.server.latency_seconds > 0:
+            time.sleep(self.server.latency_seconds)
+
+    def __new_reservation_errors(self, form: Dict[str, str]) -> Dict[str, list]:
+        errors: Dict[str, list] = {}
+        limits = {'number_of_seats': (domain_utils.MIN_NUMBER_OF_SEATS, domain_utils.MAX_NUMBER_OF_SEATS),
+                  'reserved_umbrella_id': (domain_utils.MIN_NUMBER_UMBRELLA_ID, domain_utils.MAX_NUMBER_UMBRELLA_ID)}
+        for field, (min_value, max_value) in limits.items():
+            if not form.get(field, '').isdigit() or not min_value <= int(form[field]) <= max_value:
+                errors[field] = [f'Ensure this value is between {min_value} and {max_value}.']
+        for field in ('reservation_start_date', 'reservation_end_date'):
+            try:
+                date.fromisoformat(form.get(field, ''))
+            except ValueError:
+                errors[field] = ['Date has wrong format. Use one of these formats instead: YYYY-MM-DD.']
+        if not errors and form['reservation_end_date'] < form['reservation_start_date']:
+            errors['non_field_errors'] = ['The end date must not be before the start date.']
+        return errors
+
+    def do_POST(self) -> None:
+        self.__wait_latency()
+        path = self.__path()
+        form = self.__read_form()
+        if path == app_utils.LOGIN_END_POINT:
+            self.__reply(200, {'key': TOKEN})
+        elif path == app_utils.REGISTRATION_END_POINT:
+            errors = self.server.register(form)
+            if errors:
+                self.__reply(400, errors)
+            else:
+                self.__reply(201, {'key': TOKEN})
+        elif path == app_utils.LOGOUT_END_POINT:
+            self.__reply(200, {'detail': 'Successfully logged out.'})
+        elif path == app_utils.RESERVATIONS_END_POINT and self.__is_authorized():
+            errors = self.__new_reservation_errors(form)
+            if errors:
+                self.__reply(400, errors)
+                return
+            self.__reply(201, self.server.add_reservation(int(form['reserved_umbrella_id']),
+                                                          int(form['number_of_seats']),
+                                                          form['reservation_start_date'],
+                                                          form['reservation_end_date']))
+        else:
+            self.__reply(401, {'detail': 'Invalid token.'})
+
+    def do_GET(self) -> None:
+        self.__wait_latency()
+        if self.__path() == app_utils.RESERVATIONS_END_POINT and self.__is_authorized():
+            query = {key: int(values[0]) for key, values in parse_qs(urlsplit(self.path).query).items()}
+            with self.server.lock:
+                etag = f'"{self.server.version}"'
+                reservations = list(self.server.reservations.values())
+            if 'limit' in query:
+                offset, limit = query.get('offset', 0), query['limit']
+                self.__reply(200, {'count': len(reservations),
+                                   'next': 'next' if offset + limit < len(reservations) else None,
+                                   'previous': 'previous' if offset > 0 else None,
+                                   'results': reservations[offset:offset + limit]})
+            elif self.headers.get('If-None-Match') == etag:
+                self.__reply(304, headers={'ETag': etag})
+            else:
+                self.__reply(200, reservations, headers={'ETag': etag})
+        else:
+            self.__reply(401, {'detail': 'Invalid token.'})
+
+    def do_HEAD(self) -> None:
+        self.__wait_latency()
+        status = 200 if self.__path() == app_utils.RESERVATIONS_END_POINT and self.__is_authorized() else 401
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+
+    def do_DELETE(self) -> None:
+        self.__wait_latency()
+        path = self.__path()
+        if path.startswith(app_utils.RESERVATIONS_END_POINT) and self.__is_authorized():
+            reservation_id = int(path[len(app_utils.RESERVATIONS_END_POINT):].strip('/'))
+            with self.server.lock:
+                deleted = self.server.reservations.pop(reservation_id, None)
+                self.server.version += deleted is not None
+            self.__reply(204 if deleted is not None else 404)
+        else:
+            self.__reply(401, {'detail': 'Invalid token.'})
+
+
+@contextmanager
+def running_stand_in_server(port: int = 0, dataset_size: int = 0,
+                            latency_seconds: float = 0.0) -> Iterator[StandInServer]:
+    server = StandInServer(port, dataset_size=dataset_size, latency_seconds=latency_seconds)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Local stand-in of the Beach Resort Reservation API')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--reservations', type=int, default=0, help='number of reservations to create at start')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='delay added before every response')
+    args = parser.parse_args()
+
+    server = StandInServer(args.port, dataset_size=args.reservations, latency_seconds=args.latency_ms / 1000)
+    print(f'Serving {len(server.reservations)} reservations at {server.base_url} (token: {TOKEN})')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import datetime
+from typing import Any, Dict
+
+from requests import Response
+
+from beach_resort_reservation.domain import ReservationFromServer, NewReservation, NumberOfSeats, \
+    ReservedUmbrellaID, Price, ReservationID
+
+
+def response_with(status_code: int, content: bytes = b'') -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+def reservation(reservation_id: int, umbrella_id: int = 1, start_date: datetime.date = datetime.date(2023, 3, 26),
+                end_date: datetime.date = datetime.date(2023, 3, 27), number_of_seats: int = 2,
+                price: str = '10.00') -> ReservationFromServer:
+    return ReservationFromServer(number_of_seats=NumberOfSeats(number_of_seats),
+                                 umbrella_id=ReservedUmbrellaID(umbrella_id), start_date=start_date,
+                                 end_date=end_date, price=Price.parse(price), id=ReservationID(reservation_id))
+
+
+def new_reservation(umbrella_id: int = 1, start_date: datetime.date = datetime.date(2023, 3, 26),
+                    end_date: datetime.date = datetime.date(2023, 3, 27), number_of_seats: int = 2) -> NewReservation:
+    return NewReservation(number_of_seats=NumberOfSeats(number_of_seats), umbrella_id=ReservedUmbrellaID(umbrella_id),
+                          start_date=start_date, end_date=end_date)
+
+
+def reservation_json(reservation_id: int = 27, **values: Any) -> Dict[str, Any]:
+    elem = {'id': reservation_id, 'number_of_seats': 2, 'reservation_start_date': '2023-03-26',
+            'reservation_end_date': '2023-03-27', 'reserved_umbrella_id': 1, 'reservation_price': 10.05}
+    elem.update(values)
+    return elem
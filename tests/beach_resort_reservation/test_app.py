@@ -1,22 +1,29 @@
 import datetime
 import getpass
-from unittest.mock import patch, Mock
+import json
+import threading
+from unittest.mock import patch, Mock, call
 
+import pytest
 import requests
 from requests import Response
 
 import beach_resort_reservation
 from beach_resort_reservation import app_utils, domain_utils
-from beach_resort_reservation.app import main, App
+from beach_resort_reservation.app import main, App, parse_arguments
 from beach_resort_reservation.domain import Price, ReservationID, Username, Password, Email, NewReservation, \
     NumberOfSeats, ReservedUmbrellaID
+from beach_resort_reservation.local_storage import account_file
+from beach_resort_reservation.reservation_cache import ReservationCache
+from beach_resort_reservation.snapshot import read_snapshot
+from beach_resort_reservation.token_store import TokenStore, StoredToken
 
 
 class TestApp:
     @patch('builtins.input', side_effect=['0'])
     @patch('builtins.print')
     def test_app_run_must_show_login_menu(self, mocked_print: Mock, mocked_input: Mock):
-        main('__main__')
+        main('__main__', [])
         mocked_print.assert_any_call('*** ' + app_utils.APP_NAME_LOGIN + ' ***')
         mocked_print.assert_any_call('0:\tExit')
         mocked_print.assert_any_call(app_utils.APP_EXIT_MESSAGE)
@@ -31,7 +38,7 @@ class TestApp:
         response_mock.status_code = 400
 
         with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock):
-            main('__main__')
+            main('__main__', [])
             mocked_print.assert_any_call(app_utils.LOGIN_FAILED)
             mocked_input.assert_called()
             mocked_getpass.assert_called()
@@ -45,7 +52,7 @@ class TestApp:
         response_mock.status_code = 200
         response_mock._content = b'{ "key" : "key value" }'
         with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock):
-            main('__main__')
+            main('__main__', [])
 
             mocked_print.assert_any_call(app_utils.LOGIN_OK_WELCOME)
             mocked_input.assert_called()
@@ -59,7 +66,7 @@ class TestApp:
                                                                                                         mocked_print:
                                                                                                         Mock,
                                                                                                         mocked_getpass):
-        main('__main__')
+        main('__main__', [])
         mocked_print.assert_any_call(app_utils.PASSWORDS_DIFFERENT_ON_REGISTRATION_ERROR_MESSAGE)
         mocked_input.assert_called()
         mocked_getpass.assert_called()
@@ -70,7 +77,7 @@ class TestApp:
     def test_app_do_registration_must_ask_another_time_for_password_the_password_is_not_well_formed(self, mocked_input,
                                                                                                     mocked_print,
                                                                                                     mocked_getpass):
-        main('__main__')
+        main('__main__', [])
         mocked_print.assert_any_call(domain_utils.PASSWORD_HELP_MESSAGE_ON_CREATION)
         mocked_input.assert_called()
         mocked_getpass.assert_called()
@@ -81,7 +88,7 @@ class TestApp:
     def test_app_do_registration_must_ask_another_time_for_email_if_the_email_is_not_well_formed(self, mocked_input,
                                                                                                  mocked_print,
                                                                                                  mocked_getpass):
-        main('__main__')
+        main('__main__', [])
         mocked_print.assert_any_call(domain_utils.EMAIL_HELP_MESSAGE_ON_CREATION)
         mocked_input.assert_called()
         mocked_getpass.assert_called()
@@ -93,7 +100,7 @@ class TestApp:
                                                                                                        mocked_input,
                                                                                                        mocked_print,
                                                                                                        mocked_getpass):
-        main('__main__')
+        main('__main__', [])
         mocked_print.assert_any_call(domain_utils.USERNAME_HELP_MESSAGE_ON_CREATION)
         mocked_input.assert_called()
         mocked_getpass.assert_called()
@@ -110,7 +117,7 @@ class TestApp:
                                  b'"email": ["email error"] }'
 
         with patch.object(beach_resort_reservation.app.App, 'do_registration_request', return_value=response_mock):
-            main('__main__')
+            main('__main__', [])
 
             mocked_print.assert_any_call(app_utils.REGISTRATION_FAILED)
             mocked_print.assert_any_call('\tnon field error')
@@ -130,7 +137,7 @@ class TestApp:
         response_mock.status_code = 201
         response_mock._content = b'{ "key" : "key value" }'
         with patch.object(beach_resort_reservation.app.App, 'do_registration_request', return_value=response_mock):
-            main('__main__')
+            main('__main__', [])
             mocked_print.assert_any_call(app_utils.REGISTRATION_OK_WELCOME)
             mocked_input.assert_called()
             mocked_getpass.assert_called()
@@ -151,7 +158,7 @@ class TestApp:
         with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock):
             with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
                               return_value=response_mock_retrieve):
-                main('__main__')
+                main('__main__', [])
                 mocked_print.assert_any_call(app_utils.LOGIN_OK_WELCOME)
                 mocked_print.assert_any_call('1:\tMake a new reservation')
                 mocked_print.assert_any_call('2:\tDelete a reservation')
@@ -176,7 +183,7 @@ class TestApp:
                               return_value=response_mock):
                 with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
                                   return_value=response_mock_retrieve):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.LOGGED_OUT_MESSAGE)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -203,7 +210,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_logout_request',
                                   return_value=response_mock_logout):
-                    main('__main__')
+                    main('__main__', [])
 
                     mocked_print.assert_any_call(app_utils.LOGOUT_FAILED)
                     mocked_input.assert_called()
@@ -227,7 +234,7 @@ class TestApp:
         with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
             with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
                               return_value=response_mock_retrieve):
-                main('__main__')
+                main('__main__', [])
                 mocked_print.assert_any_call(app_utils.RESERVATION_LIST_RETRIEVE_FAILED)
                 mocked_input.assert_called()
                 mocked_getpass.assert_called()
@@ -250,7 +257,7 @@ class TestApp:
         with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
             with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
                               return_value=response_mock_retrieve):
-                main('__main__')
+                main('__main__', [])
                 mocked_print.assert_any_call(app_utils.NO_RESERVATION_FOUND_FOR_USER)
                 mocked_input.assert_called()
                 mocked_getpass.assert_called()
@@ -276,7 +283,7 @@ class TestApp:
         with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
             with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
                               return_value=response_mock_retrieve):
-                main('__main__')
+                main('__main__', [])
                 expected_print_str = str(
                     app_utils.RESERVATION_FORMATTER % (json_response['id'], json_response['reserved_umbrella_id'],
                                                        json_response['number_of_seats'],
@@ -310,7 +317,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
                                   return_value=response_mock_delete):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.DELETE_FAILED_ID_NOT_FOUND)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -338,7 +345,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
                                   return_value=response_mock_delete):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(f'Reservation with id: 10{app_utils.DELETE_OK}')
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -366,7 +373,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
                                   return_value=response_mock_delete):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.DELETE_FAILED)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -395,7 +402,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
                                   return_value=response_mock_create):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.INT_FIELD_ERROR)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -425,7 +432,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
                                   return_value=response_mock_create):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.INT_FIELD_ERROR)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -456,7 +463,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
                                   return_value=response_mock_create):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.DATE_CREATION_ERROR)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -487,7 +494,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
                                   return_value=response_mock_create):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(app_utils.DATE_CREATION_ERROR)
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
@@ -523,7 +530,7 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
                                   return_value=response_mock_create):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call("\t\tEnsure this value is less than or equal to 4.")
                     mocked_print.assert_any_call(
                         "\t\tDate has wrong format. Use one of these formats instead: YYYY-MM-DD.")
@@ -556,16 +563,720 @@ class TestApp:
                               return_value=response_mock_retrieve):
                 with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
                                   return_value=response_mock_create):
-                    main('__main__')
+                    main('__main__', [])
                     mocked_print.assert_any_call(domain_utils.END_DATE_RESERVATION_ERROR)
 
                     mocked_input.assert_called()
                     mocked_getpass.assert_called()
 
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_import_reservations_must_print_a_report_for_every_row(self, mocked_getpass, mocked_print: Mock,
+                                                                       tmp_path):
+        path = tmp_path / 'reservations.csv'
+        path.write_text('reserved_umbrella_id,number_of_seats,reservation_start_date,reservation_end_date\n'
+                        '1,2,2023-03-26,2023-03-27\n'
+                        '1,9,2023-03-26,2023-03-27\n')
+
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        response_mock_create = Response()
+        response_mock_create.status_code = 201
+
+        with patch('builtins.input', side_effect=['1', 'cris', '3', str(path), '0']):
+            with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+                with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                                  return_value=response_mock_retrieve):
+                    with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
+                                      return_value=response_mock_create):
+                        main('__main__', [])
+                        mocked_print.assert_any_call(f'Row 1: {app_utils.BULK_IMPORT_ROW_CREATED}')
+                        mocked_print.assert_any_call(f'Row 2: {app_utils.NEW_RESERVATION_FAILED}')
+                        mocked_print.assert_any_call('\t\t' + domain_utils.NUMBER_OF_SEATS_HELP_MESSAGE)
+                        mocked_print.assert_any_call(app_utils.BULK_IMPORT_SUMMARY.format(created=1, total=2))
+
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_import_reservations_must_report_a_malformed_csv_without_stopping_the_app(self, mocked_getpass,
+                                                                                         mocked_print: Mock,
+                                                                                         tmp_path):
+        path = tmp_path / 'reservations.csv'
+        path.write_text('reserved_umbrella_id,number_of_seats,reservation_start_date,reservation_end_date\n'
+                        '1,2,2023-03-26,2023-03-27\n'
+                        '1,2,"2023-03-26' + 'x' * 200_000 + '\n')
+
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        response_mock_create = Response()
+        response_mock_create.status_code = 201
+
+        with patch('builtins.input', side_effect=['1', 'cris', '3', str(path), '0']) as mocked_input:
+            with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+                with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                                  return_value=response_mock_retrieve):
+                    with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
+                                      return_value=response_mock_create):
+                        main('__main__', [])
+                        mocked_print.assert_any_call(app_utils.BULK_IMPORT_MALFORMED_FILE.format(processed=1))
+                        mocked_print.assert_any_call(app_utils.BULK_IMPORT_SUMMARY.format(created=1, total=1))
+                        assert mocked_input.call_count == 5
+
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_import_reservations_must_report_the_rows_processed_before_the_file_became_unreadable(
+            self, mocked_getpass, mocked_print: Mock):
+        def rows_then_failure(path):
+            yield 1, {'reserved_umbrella_id': '1', 'number_of_seats': '2', 'reservation_start_date': '2023-03-26',
+                      'reservation_end_date': '2023-03-27'}
+            raise OSError('Input/output error')
+
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        response_mock_create = Response()
+        response_mock_create.status_code = 201
+
+        with patch('builtins.input', side_effect=['1', 'cris', '3', 'reservations.csv', '0']):
+            with patch.object(beach_resort_reservation.app, 'iter_reservation_rows', side_effect=rows_then_failure):
+                with patch.object(beach_resort_reservation.app.App, 'do_login_request',
+                                  return_value=response_mock_login):
+                    with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                                      return_value=response_mock_retrieve):
+                        with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
+                                          return_value=response_mock_create):
+                            main('__main__', [])
+                            mocked_print.assert_any_call(app_utils.BULK_IMPORT_INTERRUPTED.format(processed=1))
+                            mocked_print.assert_any_call(app_utils.BULK_IMPORT_SUMMARY.format(created=1, total=1))
+                            assert call(app_utils.BULK_IMPORT_FILE_NOT_FOUND) not in mocked_print.call_args_list
+
+    @patch('builtins.input', side_effect=['1', 'cris', '5', '1', '10, 11,12', 'y', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_bulk_delete_by_id_list_must_print_a_summary(self, mocked_getpass, mocked_print: Mock,
+                                                             mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        response_mock_delete = Response()
+        response_mock_delete.status_code = 204
+
+        response_mock_delete_not_found = Response()
+        response_mock_delete_not_found.status_code = 404
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve):
+                with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
+                                  side_effect=lambda reservation_id: response_mock_delete_not_found
+                                  if reservation_id.value == 11 else response_mock_delete):
+                    main('__main__', [])
+                    mocked_print.assert_any_call(app_utils.BULK_DELETE_SUMMARY.format(deleted=2, not_found=1,
+                                                                                      failed=0))
+                    mocked_print.assert_any_call(app_utils.BULK_DELETE_NOT_FOUND_IDS.format(ids='11'))
+                    mocked_input.assert_any_call(app_utils.BULK_DELETE_CONFIRMATION.format(count=3))
+
+    @patch('builtins.input', side_effect=['1', 'cris', '5', '1', '10, 11,12', 'n', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_bulk_delete_must_not_delete_anything_if_the_user_does_not_confirm(self, mocked_getpass,
+                                                                                  mocked_print: Mock,
+                                                                                  mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve):
+                with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request') as mocked_delete:
+                    main('__main__', [])
+                    mocked_input.assert_any_call(app_utils.BULK_DELETE_CONFIRMATION.format(count=3))
+                    mocked_print.assert_any_call(app_utils.BULK_DELETE_CANCELLED)
+                    mocked_delete.assert_not_called()
+
+    @patch('builtins.input', side_effect=['1', 'cris', '6', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_must_reuse_the_reservation_list_if_the_server_answers_not_modified(self, mocked_getpass,
+                                                                                    mocked_print: Mock,
+                                                                                    mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve.headers['ETag'] = '"1"'
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        response_mock_not_modified = Response()
+        response_mock_not_modified.status_code = 304
+        response_mock_not_modified.headers['ETag'] = '"1"'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(requests.Session, 'get',
+                              side_effect=[response_mock_retrieve, response_mock_not_modified]) as mocked_get:
+                main('__main__', [])
+                assert mocked_get.call_args_list[0].kwargs['headers'] == {}
+                assert mocked_get.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"1"'}
+                expected_print_str = app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26', '2023-03-27',
+                                                                        '100.00')
+                assert mocked_print.call_args_list.count(call(expected_print_str)) == 2
+
+    @patch('builtins.input', side_effect=['1', 'cris', '2', '27', '1', '1', '2', '2023-03-26', '2023-03-27', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_must_update_the_cached_reservation_list_after_delete_and_create(self, mocked_getpass,
+                                                                                 mocked_print: Mock,
+                                                                                 mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        response_mock_delete = Response()
+        response_mock_delete.status_code = 204
+
+        response_mock_create = Response()
+        response_mock_create.status_code = 201
+        response_mock_create._content = b'{"id": 28,"number_of_seats": 2,"reservation_start_date": "2023-03-26",' \
+                                        b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 1,' \
+                                        b' "reservation_price": 50.00}'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve) as mocked_retrieve:
+                with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
+                                  return_value=response_mock_delete):
+                    with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
+                                      return_value=response_mock_create):
+                        main('__main__', [])
+                        assert mocked_retrieve.call_count == 1
+                        deleted_print_str = app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26',
+                                                                               '2023-03-27', '100.00')
+                        created_print_str = app_utils.RESERVATION_FORMATTER % (28, 1, 2, '2023-03-26',
+                                                                               '2023-03-27', '50.00')
+                        assert mocked_print.call_args_list.count(call(deleted_print_str)) == 1
+                        mocked_print.assert_any_call(app_utils.NO_RESERVATION_FOUND_FOR_USER)
+                        mocked_print.assert_any_call(created_print_str)
+
+    @patch('builtins.input', side_effect=['1', 'cris', '7', '7', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_with_pages_must_show_the_first_page_and_fetch_more_on_demand(self, mocked_getpass,
+                                                                               mocked_print: Mock,
+                                                                               mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        def page_response(offset, limit):
+            response_mock_page = Response()
+            response_mock_page.status_code = 200
+            response_mock_page._content = json.dumps({
+                'count': 3, 'next': 'next' if offset + limit < 3 else None,
+                'results': [{'id': i, 'number_of_seats': 2, 'reservation_start_date': '2023-03-26',
+                             'reservation_end_date': '2023-03-27', 'reserved_umbrella_id': 1,
+                             'reservation_price': 10.0} for i in range(offset, min(offset + limit, 3))]}).encode()
+            return response_mock_page
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              side_effect=lambda offset, limit: page_response(offset, limit)):
+                App(page_size=2).run()
+                mocked_print.assert_any_call(app_utils.MORE_RESERVATIONS_AVAILABLE.format(shown=2, total=3))
+                mocked_print.assert_any_call(app_utils.RESERVATION_FORMATTER % (2, 1, 2, '2023-03-26', '2023-03-27',
+                                                                                '10.00'))
+                mocked_print.assert_any_call(app_utils.NO_MORE_RESERVATIONS)
+
+    @patch('builtins.input', side_effect=['0'])
+    @patch('builtins.print')
+    def test_app_with_pages_must_close_the_pager_on_exit(self, mocked_print: Mock, mocked_input: Mock):
+        with patch.object(beach_resort_reservation.pagination.ReservationPager, 'close') as mocked_close:
+            App(page_size=2).run()
+        mocked_close.assert_called_once_with()
+
+    @patch('builtins.input', side_effect=['1', 'cris', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_must_prefetch_the_reservation_list_on_login_and_report_time_to_first_table(self, mocked_getpass,
+                                                                                           mocked_print: Mock,
+                                                                                           mocked_input: Mock,
+                                                                                           tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        metrics_path = tmp_path / 'metrics.json'
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve) as mocked_retrieve:
+                main('__main__', ['--metrics-output', str(metrics_path)])
+                assert mocked_retrieve.call_count == 1
+                mocked_print.assert_any_call(app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26',
+                                                                                '2023-03-27', '100.00'))
+        metrics = json.loads(metrics_path.read_text())
+        assert metrics['timings'][app_utils.METRIC_TIME_TO_FIRST_TABLE]['count'] == 1
+        assert metrics['counters'][app_utils.METRIC_SINGLE_FLIGHT_CALLS] == 1
+
+    @patch('builtins.input', side_effect=['1', 'cris', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_must_count_the_failures_of_the_prefetch_and_fetch_the_list_again(self, mocked_getpass,
+                                                                                 mocked_print: Mock,
+                                                                                 mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        for failure, expected in ((requests.ConnectionError(), 'true'), (RuntimeError(), 'false')):
+            metrics_path = tmp_path / f'{expected}.json'
+            mocked_input.side_effect = ['1', 'cris', '0']
+            with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+                with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                                  side_effect=[failure, response_mock_retrieve]):
+                    main('__main__', ['--metrics-output', str(metrics_path)])
+                    mocked_print.assert_any_call(app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26',
+                                                                                    '2023-03-27', '100.00'))
+            metrics = json.loads(metrics_path.read_text())
+            assert metrics['labeled_counters'][app_utils.METRIC_WARM_UP_FAILURES] == [
+                {'labels': {'error': type(failure).__name__, 'expected': expected}, 'value': 1}]
+
+    @patch('builtins.input', side_effect=['1', 'cris', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_profile_mode_must_write_one_profile_per_menu_action(self, mocked_getpass, mocked_print: Mock,
+                                                                     mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve):
+                main('__main__', ['--profile', str(tmp_path)])
+        summary_path = tmp_path / app_utils.PROFILE_SUMMARY_FILE_NAME
+        mocked_print.assert_any_call(app_utils.PROFILE_WRITTEN.format(directory=tmp_path, summary=summary_path))
+        assert {path.name for path in tmp_path.glob('*.prof')} == {
+            'umbrella_reservation_login_auto_select.prof', 'umbrella_reservation_login_login.prof',
+            'umbrella_reservation_auto_select.prof', 'umbrella_reservation_exit.prof'}
+        assert f'== {app_utils.APP_NAME_MENU} - auto select: 1 calls' in summary_path.read_text()
+
+    def test_parse_arguments_must_profile_in_the_default_directory_when_no_directory_is_given(self):
+        assert parse_arguments(['--profile']).profile == app_utils.PROFILE_DEFAULT_DIRECTORY
+        assert parse_arguments([]).profile is None
+
+    @patch('builtins.input', side_effect=['1', 'cris', 'm', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_hidden_entry_must_export_the_request_metrics_as_prometheus_text(self, mocked_getpass,
+                                                                                 mocked_print: Mock,
+                                                                                 mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        metrics_path = tmp_path / 'metrics.prom'
+        with patch.object(requests.Session, 'post', return_value=response_mock_login):
+            with patch.object(requests.Session, 'get', return_value=response_mock_retrieve):
+                main('__main__', ['--metrics-output', str(metrics_path), '--metrics-format', 'prometheus'])
+        mocked_print.assert_any_call(app_utils.METRICS_EXPORTED.format(path=metrics_path))
+        assert call('m:\tExport metrics') not in mocked_print.mock_calls
+        lines = metrics_path.read_text().splitlines()
+        assert f'beach_resort_http_responses_total{{method="POST",route="{app_utils.LOGIN_END_POINT}",' \
+               f'status="200"}} 1' in lines
+        assert f'beach_resort_parse_seconds_count{{route="{app_utils.RESERVATIONS_END_POINT}"}} 1' in lines
+        assert any(line.startswith('beach_resort_http_request_seconds_bucket{method="GET",phase="ttfb"')
+                   for line in lines)
+
+    @patch('builtins.input', side_effect=['1', 'cris', '2', '27', '0', '1', 'cris', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_offline_must_queue_changes_and_show_the_stored_reservations(self, mocked_getpass,
+                                                                            mocked_print: Mock,
+                                                                            mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}, {"id": 28,"number_of_seats": 2,' \
+                                          b'"reservation_start_date": "2023-03-26","reservation_end_date": ' \
+                                          b'"2023-03-27","reserved_umbrella_id": 1, "reservation_price": 50.00}]'
+
+        response_mock_delete = Response()
+        response_mock_delete.status_code = 204
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              side_effect=[response_mock_retrieve, requests.ConnectionError()]):
+                with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
+                                  side_effect=[requests.ConnectionError(), requests.ConnectionError(),
+                                               response_mock_delete]) as mocked_delete:
+                    App(offline_directory=tmp_path).run()
+                    mocked_print.assert_any_call(app_utils.OFFLINE_CHANGE_QUEUED)
+                    mocked_print.assert_any_call(app_utils.OFFLINE_PENDING_CHANGES.format(pending=1))
+                    mocked_print.reset_mock()
+                    App(offline_directory=tmp_path).run()
+                    assert mocked_delete.call_count == 3
+                    mocked_print.assert_any_call(app_utils.OFFLINE_SYNC_SUMMARY.format(applied=1, conflicts=0))
+                    mocked_print.assert_any_call(app_utils.RESERVATION_FORMATTER % (28, 1, 2, '2023-03-26',
+                                                                                    '2023-03-27', '50.00'))
+                    assert call(app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26', '2023-03-27',
+                                                                   '100.00')) not in mocked_print.call_args_list
+
+    @patch('builtins.input', side_effect=['1', 'cris', '1', '1', '2', '2022-10-10', '2022-10-11', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_offline_must_not_queue_a_reservation_the_server_may_have_created(self, mocked_getpass,
+                                                                                 mocked_print: Mock,
+                                                                                 mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve):
+                with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request',
+                                  side_effect=requests.ReadTimeout()) as mocked_create:
+                    App(offline_directory=tmp_path).run()
+                    assert mocked_create.call_count == 1
+                    mocked_print.assert_any_call(app_utils.NEW_RESERVATION_OUTCOME_UNKNOWN)
+                    assert call(app_utils.OFFLINE_CHANGE_QUEUED) not in mocked_print.call_args_list
+
+    @patch('builtins.input', side_effect=['1', 'cris', '2', '27', '2', '28', '6', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_offline_must_wait_before_replaying_again_unless_refresh_is_chosen(self, mocked_getpass,
+                                                                                  mocked_print: Mock,
+                                                                                  mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}, {"id": 28,"number_of_seats": 2,' \
+                                          b'"reservation_start_date": "2023-03-26","reservation_end_date": ' \
+                                          b'"2023-03-27","reserved_umbrella_id": 1, "reservation_price": 50.00}]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              side_effect=[response_mock_retrieve] + [requests.ConnectionError()] * 3):
+                with patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
+                                  side_effect=requests.ConnectionError()) as mocked_delete:
+                    App(offline_directory=tmp_path).run()
+                    deleted = [entry.args[0] for entry in mocked_delete.call_args_list]
+                    assert deleted[:3] == [ReservationID(27), ReservationID(27), ReservationID(28)]
+                    assert sorted(deleted[3:], key=lambda reservation_id: reservation_id.value) == [
+                        ReservationID(27), ReservationID(28)]
+                    mocked_print.assert_any_call(app_utils.OFFLINE_PENDING_CHANGES.format(pending=2))
+
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_with_snapshot_must_show_the_last_list_at_once_and_revalidate_it(self, mocked_getpass,
+                                                                                mocked_print: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve.headers['ETag'] = '"1"'
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        response_mock_not_modified = Response()
+        response_mock_not_modified.status_code = 304
+        response_mock_not_modified.headers['ETag'] = '"1"'
+
+        revalidation_released = threading.Event()
+        inputs = iter(['1', 'cris', '0', '1', 'cris', '0'])
+
+        def next_input(prompt=''):
+            value = next(inputs)
+            if value == '0':
+                revalidation_released.set()
+            return value
+
+        def slow_not_modified(*args, **kwargs):
+            revalidation_released.wait(timeout=5)
+            return response_mock_not_modified
+
+        with patch('builtins.input', side_effect=next_input):
+            with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+                with patch.object(requests.Session, 'get', return_value=response_mock_retrieve):
+                    App(snapshot_directory=tmp_path).run()
+                revalidation_released.clear()
+                mocked_print.reset_mock()
+                with patch.object(requests.Session, 'get', side_effect=slow_not_modified) as mocked_get:
+                    App(snapshot_directory=tmp_path).run()
+                    assert mocked_get.call_args.kwargs['headers'] == {'If-None-Match': '"1"'}
+        mocked_print.assert_any_call(app_utils.STALE_RESERVATIONS)
+        mocked_print.assert_any_call(app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26', '2023-03-27',
+                                                                        '100.00'))
+
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_must_not_restore_a_reservation_deleted_while_a_background_refresh_runs(self, mocked_getpass,
+                                                                                      mocked_print: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        def list_response(content: bytes) -> Response:
+            response = Response()
+            response.status_code = 200
+            response._content = content
+            return response
+
+        old_list = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                   b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21, "reservation_price": 100.00}]'
+        response_mock_delete = Response()
+        response_mock_delete.status_code = 204
+
+        refresh_released = threading.Event()
+        background_stored = threading.Event()
+        original_store = ReservationCache.store
+
+        def tracking_store(cache, *args, **kwargs):
+            try:
+                return original_store(cache, *args, **kwargs)
+            finally:
+                if threading.current_thread() is not threading.main_thread():
+                    background_stored.set()
+
+        responses = iter([old_list, b'[]'])
+
+        def slow_list(*args, **kwargs):
+            content = next(responses)
+            if content == old_list:
+                refresh_released.wait(timeout=5)
+            return list_response(content)
+
+        inputs = iter(['1', 'cris', '2', '27', 'm', '0'])
+
+        def next_input(prompt=''):
+            value = next(inputs)
+            if value == 'm':
+                refresh_released.set()
+                background_stored.wait(timeout=5)
+            return value
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch('builtins.input', side_effect=['1', 'cris', '0']):
+                with patch.object(requests.Session, 'get', return_value=list_response(old_list)):
+                    App(snapshot_directory=tmp_path).run()
+            mocked_print.reset_mock()
+            with patch('builtins.input', side_effect=next_input), \
+                    patch.object(ReservationCache, 'store', tracking_store), \
+                    patch.object(requests.Session, 'get', side_effect=slow_list), \
+                    patch.object(beach_resort_reservation.app.App, 'do_reservation_delete_request',
+                                 return_value=response_mock_delete):
+                App(snapshot_directory=tmp_path, metrics_output=tmp_path / 'metrics.json').run()
+        assert background_stored.is_set()
+        row = call(app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26', '2023-03-27', '100.00'))
+        assert mocked_print.call_args_list.count(row) == 1
+        assert read_snapshot(account_file(tmp_path, 'cris', app_utils.SNAPSHOT_SUFFIX)).reservations == []
+
+    @patch('builtins.input', side_effect=['0'])
+    @patch('builtins.print')
+    def test_app_with_a_remembered_token_must_skip_the_login(self, mocked_print: Mock, mocked_input: Mock, tmp_path):
+        token_store = TokenStore(tmp_path / app_utils.TOKEN_FILE_NAME)
+        token_store.save(StoredToken(account='cris', key='key value'))
+
+        response_mock_validation = Response()
+        response_mock_validation.status_code = 200
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request') as mocked_login:
+            with patch.object(requests.Session, 'head', return_value=response_mock_validation) as mocked_head:
+                with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                                  return_value=response_mock_retrieve):
+                    App(token_store=token_store).run()
+                    mocked_login.assert_not_called()
+                    assert mocked_head.call_args.kwargs['url'].endswith(app_utils.RESERVATIONS_END_POINT)
+                    mocked_print.assert_any_call(app_utils.SESSION_RESUMED_WELCOME)
+                    mocked_print.assert_any_call('*** ' + app_utils.APP_NAME_MENU + ' ***')
+
+    @patch('builtins.input', side_effect=['0'])
+    @patch('builtins.print')
+    def test_app_with_an_expired_token_must_forget_it_and_show_the_login(self, mocked_print: Mock,
+                                                                        mocked_input: Mock, tmp_path):
+        token_store = TokenStore(tmp_path / app_utils.TOKEN_FILE_NAME)
+        token_store.save(StoredToken(account='cris', key='expired'))
+
+        response_mock_validation = Response()
+        response_mock_validation.status_code = 401
+
+        with patch.object(requests.Session, 'head', return_value=response_mock_validation):
+            App(token_store=token_store).run()
+            mocked_print.assert_any_call('*** ' + app_utils.APP_NAME_LOGIN + ' ***')
+            assert token_store.load() is None
+
+    @patch('builtins.input', side_effect=['1', 'cris', '1', '21', '2', '2023-03-27', '2023-03-28', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_make_new_reservation_must_refuse_an_overlap_without_calling_the_server(self, mocked_getpass,
+                                                                                       mocked_print: Mock,
+                                                                                       mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve):
+                with patch.object(beach_resort_reservation.app.App, 'do_new_reservation_request') as mocked_new:
+                    main('__main__', [])
+                    mocked_new.assert_not_called()
+                    mocked_print.assert_any_call(app_utils.NEW_RESERVATION_OVERLAPS.format(ids='27'))
+
+    @patch('builtins.input', side_effect=['1', 'cris', '1', '22', '2', '2023-03-27', '2023-03-28', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_trace_must_cover_the_new_reservation_flow_from_menu_to_render(self, mocked_getpass,
+                                                                              mocked_print: Mock,
+                                                                              mocked_input: Mock, tmp_path):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_created = Response()
+        response_mock_created.status_code = 201
+        response_mock_created._content = b'{"id": 28,"number_of_seats": 2,"reservation_start_date": "2023-03-27",' \
+                                         b'"reservation_end_date": "2023-03-28","reserved_umbrella_id": 22,' \
+                                         b' "reservation_price": 50.00}'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[]'
+
+        trace_path = tmp_path / 'trace.json'
+        with patch.object(requests.Session, 'post', side_effect=[response_mock_login, response_mock_created]):
+            with patch.object(requests.Session, 'get', return_value=response_mock_retrieve):
+                main('__main__', ['--trace', str(trace_path)])
+        mocked_print.assert_any_call(app_utils.NEW_RESERVATION_CORRECTLY_ADDED)
+        lines = trace_path.read_text().splitlines()
+        events = [json.loads(line.rstrip(',')) for line in lines[1:]]
+        spans = {event['name']: event for event in events if event['ph'] == 'X'}
+        menu_span = spans[f'{app_utils.APP_NAME_MENU} - Make a new reservation']
+        for name in ('read new reservation', 'check overlaps', f'POST {app_utils.RESERVATIONS_END_POINT}',
+                     'handle response', 'decode json', 'build reservation'):
+            assert menu_span['ts'] <= spans[name]['ts'] <= menu_span['ts'] + menu_span['dur']
+        assert spans['decode reservation list']['args']['rows'] == 0
+
+    @patch('builtins.input', side_effect=['1', 'cris', '0'])
+    @patch('builtins.print')
+    @patch.object(getpass, 'getpass', return_value='password')
+    def test_app_boundary_validation_must_show_the_same_table(self, mocked_getpass, mocked_print: Mock,
+                                                              mocked_input: Mock):
+        response_mock_login = Response()
+        response_mock_login.status_code = 200
+        response_mock_login._content = b'{ "key" : "key value" }'
+
+        response_mock_retrieve = Response()
+        response_mock_retrieve.status_code = 200
+        response_mock_retrieve._content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                                          b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21,' \
+                                          b' "reservation_price": 100.00}]'
+
+        with patch.object(beach_resort_reservation.app.App, 'do_login_request', return_value=response_mock_login):
+            with patch.object(beach_resort_reservation.app.App, 'do_retrieve_reservation_list_request',
+                              return_value=response_mock_retrieve):
+                main('__main__', ['--validation', 'boundary'])
+                mocked_print.assert_any_call(app_utils.RESERVATION_FORMATTER % (27, 21, 4, '2023-03-26',
+                                                                                '2023-03-27', '100.00'))
+
+    def test_app_arguments_must_default_to_strict_validation(self):
+        assert parse_arguments([]).validation == 'strict'
+        assert parse_arguments(['--validation', 'off']).validation == 'off'
+
+    @pytest.mark.parametrize('argv', [['--ofline'], ['--remember-tokn'], ['--page-size', '10', '-q', 'tests']])
+    def test_app_arguments_must_refuse_unknown_options(self, argv):
+        with pytest.raises(SystemExit):
+            parse_arguments(argv)
+        assert parse_arguments([]).page_size == app_utils.RESERVATION_PAGE_SIZE
+
     def test_app_do_reservation_delete_request_must_return_the_right_response(self):
         response_mock_delete = Response()
         response_mock_delete.status_code = 204
-        with patch.object(requests, 'delete', return_value=response_mock_delete):
+        with patch.object(requests.Session, 'delete', return_value=response_mock_delete):
             response: Response = App().do_reservation_delete_request(ReservationID(1))
             assert response.status_code == response_mock_delete.status_code
 
@@ -573,7 +1284,7 @@ class TestApp:
         response_mock_login = Response()
         response_mock_login.status_code = 200
         response_mock_login._content = b'{ "key" : "key value" }'
-        with patch.object(requests, 'post', return_value=response_mock_login):
+        with patch.object(requests.Session, 'post', return_value=response_mock_login):
             response: Response = App().do_login_request('username', 'pass')
             assert response.status_code == response_mock_login.status_code
 
@@ -581,7 +1292,7 @@ class TestApp:
         response_mock_registration = Response()
         response_mock_registration.status_code = 201
         response_mock_registration._content = b'{ }'
-        with patch.object(requests, 'post', return_value=response_mock_registration):
+        with patch.object(requests.Session, 'post', return_value=response_mock_registration):
             response: Response = App().do_registration_request(Username('username'), Password('password9000'),
                                                                Password('password9000'), Email('cris@lib.it'))
             assert response.status_code == response_mock_registration.status_code
@@ -589,7 +1300,7 @@ class TestApp:
     def test_app_do_nw_reservation_request_must_return_the_right_response(self):
         response_mock_create = Response()
         response_mock_create.status_code = 201
-        with patch.object(requests, 'post', return_value=response_mock_create):
+        with patch.object(requests.Session, 'post', return_value=response_mock_create):
             response: Response = App().do_new_reservation_request(NewReservation(NumberOfSeats(2),
                                                                                  ReservedUmbrellaID(10),
                                                                                  datetime.date.today(),
@@ -600,7 +1311,7 @@ class TestApp:
         response_mock_logout = Response()
         response_mock_logout.status_code = 200
 
-        with patch.object(requests, 'post', return_value=response_mock_logout):
+        with patch.object(requests.Session, 'post', return_value=response_mock_logout):
             response: Response = App().do_logout_request()
             assert response.status_code == response_mock_logout.status_code
 
@@ -608,6 +1319,6 @@ class TestApp:
         response_mock_logout = Response()
         response_mock_logout.status_code = 200
 
-        with patch.object(requests, 'get', return_value=response_mock_logout):
+        with patch.object(requests.Session, 'get', return_value=response_mock_logout):
             response: Response = App().do_retrieve_reservation_list_request()
             assert response.status_code == response_mock_logout.status_code
@@ -0,0 +1,103 @@
+import asyncio
+import datetime
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.async_client import AsyncReservationClient
+from beach_resort_reservation.domain import NewReservation, NumberOfSeats, ReservedUmbrellaID, ReservationID
+from beach_resort_reservation.exceptions import ServerResponseException
+from tests.beach_resort_reservation.helpers import response_with
+
+
+class TestAsyncReservationClient:
+    def test_login_must_raise_an_exception_if_credentials_are_invalid(self):
+        async def login():
+            async with AsyncReservationClient() as client:
+                await client.login('cris', 'password')
+
+        with patch.object(requests.Session, 'post', return_value=response_with(400, b'{}')):
+            with pytest.raises(ServerResponseException) as exception_info:
+                asyncio.run(login())
+            assert exception_info.value.help_msg == app_utils.LOGIN_FAILED
+
+    def test_list_reservations_must_return_the_domain_objects(self):
+        async def list_reservations():
+            async with AsyncReservationClient() as client:
+                return await client.list_reservations()
+
+        content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                  b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21, "reservation_price": 100.00}]'
+        with patch.object(requests.Session, 'get', return_value=response_with(200, content)):
+            reservations = asyncio.run(list_reservations())
+            assert len(reservations) == 1
+            assert reservations[0].id == ReservationID(27)
+            assert reservations[0].umbrella_id == ReservedUmbrellaID(21)
+
+    def test_create_reservation_must_carry_the_server_errors_in_the_exception(self):
+        async def create():
+            async with AsyncReservationClient() as client:
+                await client.create_reservation(NewReservation(NumberOfSeats(2), ReservedUmbrellaID(10),
+                                                               datetime.date.today(), datetime.date.today()))
+
+        with patch.object(requests.Session, 'post',
+                          return_value=response_with(400, b'{"reserved_umbrella_id": ["already taken"]}')):
+            with pytest.raises(ServerResponseException) as exception_info:
+                asyncio.run(create())
+            assert exception_info.value.response_json == {'reserved_umbrella_id': ['already taken']}
+
+    def test_delete_reservation_must_raise_an_exception_if_the_id_does_not_exist(self):
+        async def delete():
+            async with AsyncReservationClient() as client:
+                await client.delete_reservation(ReservationID(10))
+
+        with patch.object(requests.Session, 'delete', return_value=response_with(404)):
+            with pytest.raises(ServerResponseException) as exception_info:
+                asyncio.run(delete())
+            assert exception_info.value.help_msg == app_utils.DELETE_FAILED_ID_NOT_FOUND
+
+    def test_concurrent_operations_must_not_exceed_the_concurrency_limit(self):
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def slow_delete(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return response_with(204)
+
+        async def delete_many():
+            async with AsyncReservationClient(concurrency_limit=4) as client:
+                await asyncio.gather(*[client.delete_reservation(ReservationID(i)) for i in range(40)])
+
+        with patch.object(requests.Session, 'delete', side_effect=slow_delete):
+            asyncio.run(delete_many())
+            assert 1 < max_in_flight[0] <= 4
+
+    def test_concurrent_list_requests_must_share_one_http_call(self):
+        content = b'[{"id": 27,"number_of_seats": 4,"reservation_start_date": "2023-03-26",' \
+                  b'"reservation_end_date": "2023-03-27","reserved_umbrella_id": 21, "reservation_price": 100.00}]'
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return response_with(200, content)
+
+        async def list_concurrently():
+            async with AsyncReservationClient(concurrency_limit=4) as client:
+                results = await asyncio.gather(*[client.list_reservations() for _ in range(4)])
+                return results, client.single_flight_statistics
+
+        with patch.object(requests.Session, 'get', side_effect=slow_get) as get_mock:
+            results, statistics = asyncio.run(list_concurrently())
+            assert all(len(reservations) == 1 for reservations in results)
+            assert get_mock.call_count == statistics.executions
+            assert statistics.calls == 4
+            assert statistics.saved > 0
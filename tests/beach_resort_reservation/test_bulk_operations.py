@@ -0,0 +1,126 @@
+import datetime
+import threading
+import time
+
+import pytest
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.bulk_operations import iter_reservation_rows, new_reservation_from_row, \
+    import_reservations, ReservationFilter, select_reservation_ids, delete_reservations
+from beach_resort_reservation.domain import NumberOfSeats, ReservedUmbrellaID, ReservationID
+from tests.beach_resort_reservation.helpers import response_with, reservation
+
+
+def valid_row(umbrella_id: int = 1) -> dict:
+    return {'reserved_umbrella_id': str(umbrella_id), 'number_of_seats': '2',
+            'reservation_start_date': '2023-03-26', 'reservation_end_date': '2023-03-27'}
+
+
+def september_reservation(reservation_id: int, umbrella_id: int, start_day: int):
+    return reservation(reservation_id, umbrella_id, datetime.date(2023, 9, start_day),
+                       datetime.date(2023, 9, start_day + 1))
+
+
+class TestIterReservationRows:
+    def test_csv_rows_must_be_read_with_the_header_as_keys(self, tmp_path):
+        path = tmp_path / 'reservations.csv'
+        path.write_text('reserved_umbrella_id,number_of_seats,reservation_start_date,reservation_end_date\n'
+                        '1,2,2023-03-26,2023-03-27\n'
+                        '3,4,2023-04-01,2023-04-02\n')
+        rows = list(iter_reservation_rows(str(path)))
+        assert [row_number for row_number, _ in rows] == [1, 2]
+        assert rows[1][1]['reserved_umbrella_id'] == '3'
+
+    def test_jsonl_rows_must_skip_blank_lines_and_mark_malformed_ones(self, tmp_path):
+        path = tmp_path / 'reservations.jsonl'
+        path.write_text('{"reserved_umbrella_id": 1}\n\n{not json\n')
+        rows = list(iter_reservation_rows(str(path)))
+        assert rows == [(1, {'reserved_umbrella_id': 1}), (3, None)]
+
+    def test_missing_file_must_raise_before_the_rows_are_iterated(self, tmp_path):
+        with pytest.raises(OSError):
+            iter_reservation_rows(str(tmp_path / 'missing.csv'))
+
+
+class TestNewReservationFromRow:
+    def test_valid_row_must_create_the_reservation(self):
+        new_reservation, errors = new_reservation_from_row(valid_row(umbrella_id=7))
+        assert errors == {}
+        assert new_reservation.umbrella_id == ReservedUmbrellaID(7)
+        assert new_reservation.number_of_seats == NumberOfSeats(2)
+
+    def test_invalid_row_must_report_the_errors_by_field(self):
+        row = valid_row()
+        row['number_of_seats'] = '9'
+        row['reservation_start_date'] = '2023-13-01'
+        del row['reserved_umbrella_id']
+        new_reservation, errors = new_reservation_from_row(row)
+        assert new_reservation is None
+        assert errors['reserved_umbrella_id'] == [app_utils.BULK_IMPORT_MISSING_FIELD]
+        assert 'number_of_seats' in errors
+        assert errors['reservation_start_date'] == [app_utils.DATE_CREATION_ERROR]
+
+    def test_malformed_row_must_be_reported_as_non_field_error(self):
+        assert new_reservation_from_row(None) == (None, {'non_field_errors': [app_utils.BULK_IMPORT_MALFORMED_ROW]})
+
+
+class TestImportReservations:
+    def test_import_must_report_successes_local_errors_and_server_errors(self):
+        rows = iter([(1, valid_row(1)), (2, {}), (3, valid_row(3))])
+
+        def submit(new_reservation):
+            if new_reservation.umbrella_id.value == 3:
+                return response_with(400, b'{"reserved_umbrella_id": ["already taken"], "detail": "no"}')
+            return response_with(201)
+
+        results = sorted(import_reservations(rows, submit), key=lambda result: result.row_number)
+        assert [result.is_created for result in results] == [True, False, False]
+        assert results[1].status_code is None
+        assert results[2].status_code == 400
+        assert results[2].errors == {'reserved_umbrella_id': ['already taken'], 'non_field_errors': ['no']}
+
+    def test_import_must_not_exceed_the_maximum_number_of_requests_in_flight(self):
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def submit(new_reservation):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.005)
+            with lock:
+                in_flight[0] -= 1
+            return response_with(201)
+
+        rows = ((row_number, valid_row()) for row_number in range(50))
+        results = list(import_reservations(rows, submit, max_in_flight=3))
+        assert len(results) == 50
+        assert max_in_flight[0] <= 3
+
+
+class TestSelectReservationIds:
+    reservations = [september_reservation(1, 1, 1), september_reservation(2, 2, 10), september_reservation(3, 1, 20),
+                    september_reservation(4, 1, 25)]
+
+    def test_range_must_select_only_the_ids_between_first_and_last(self):
+        assert select_reservation_ids(self.reservations, first_id=ReservationID(2), last_id=ReservationID(3)) == \
+               [ReservationID(2), ReservationID(3)]
+
+    def test_filter_must_select_by_umbrella_and_date_window(self):
+        reservation_filter = ReservationFilter(umbrella_id=ReservedUmbrellaID(1),
+                                               from_date=datetime.date(2023, 9, 5),
+                                               to_date=datetime.date(2023, 9, 22))
+        assert select_reservation_ids(self.reservations, reservation_filter=reservation_filter) == [ReservationID(3)]
+
+
+class TestDeleteReservations:
+    def test_delete_must_aggregate_the_outcomes_in_one_summary(self):
+        status_codes = {1: 204, 2: 200, 3: 404, 4: 500, 5: 202}
+        summary = delete_reservations([ReservationID(i) for i in status_codes],
+                                      lambda reservation_id: response_with(status_codes[reservation_id.value]),
+                                      workers=3)
+        assert summary.deleted == [ReservationID(1), ReservationID(2), ReservationID(5)]
+        assert summary.not_found == [ReservationID(3)]
+        assert summary.failed == [ReservationID(4)]
+        assert summary.status_codes == {204: 1, 200: 1, 404: 1, 500: 1, 202: 1}
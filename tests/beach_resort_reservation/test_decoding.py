@@ -0,0 +1,68 @@
+import datetime
+
+import pytest
+from dateutil.parser import ParserError, parse
+from valid8 import ValidationError
+
+from beach_resort_reservation.decoding import ValidationLevel, parse_date, parse_iso_date, reservation_decoder, \
+    reservation_from_json, reservation_from_server_json, reservation_from_trusted_json
+from tests.beach_resort_reservation.helpers import reservation_json
+
+
+class TestDecoding:
+    @pytest.mark.parametrize('level', list(ValidationLevel))
+    def test_every_level_must_decode_the_same_reservation(self, level):
+        elem = reservation_json()
+        reservation = reservation_decoder(level)(elem)
+        assert reservation == reservation_from_json(elem)
+        assert hash(reservation) == hash(reservation_from_json(elem))
+        assert str(reservation.price) == '10.05'
+
+    @pytest.mark.parametrize('values', [{'number_of_seats': 1}, {'reserved_umbrella_id': 51}, {'id': -1},
+                                        {'reservation_price': -0.001},
+                                        {'reservation_end_date': '2023-03-25'},
+                                        {'reservation_end_date': '2023-05-26'}])
+    def test_boundary_level_must_refuse_what_the_strict_level_refuses(self, values):
+        with pytest.raises(ValidationError):
+            reservation_from_json(reservation_json(**values))
+        with pytest.raises(ValidationError):
+            reservation_from_server_json(reservation_json(**values))
+
+    def test_boundary_level_must_raise_the_strict_error_on_wrong_types(self):
+        with pytest.raises(TypeError):
+            reservation_from_json(reservation_json(number_of_seats='4'))
+        with pytest.raises(TypeError):
+            reservation_from_server_json(reservation_json(number_of_seats='4'))
+
+    def test_off_level_must_skip_the_range_checks(self):
+        assert reservation_from_trusted_json(reservation_json(number_of_seats=9)).number_of_seats.value == 9
+
+    def test_decoder_must_default_to_the_strict_level(self):
+        assert reservation_decoder(ValidationLevel.STRICT) is reservation_from_json
+
+    @pytest.mark.parametrize('level', list(ValidationLevel))
+    def test_every_level_must_share_the_seats_and_umbrella_instances(self, level):
+        first, second = (reservation_decoder(level)(reservation_json(id=index)) for index in range(2))
+        assert first.number_of_seats is second.number_of_seats
+        assert first.umbrella_id is second.umbrella_id
+
+
+class TestParseDate:
+    @pytest.mark.parametrize('value', ['2023-03-26', '2024-02-29', '26 March 2023', '2023/03/26', '20230326',
+                                       '2023-03-26T10:30:00'])
+    def test_date_must_match_the_general_parser(self, value):
+        assert parse_date(value) == parse(value).date()
+        assert parse_iso_date(value) == parse(value).date()
+
+    def test_iso_date_must_be_cached(self):
+        assert parse_date('2023-07-14') is parse_date('2023-07-14')
+        assert parse_date('2023-07-14') == datetime.date(2023, 7, 14)
+
+    @pytest.mark.parametrize('value', ['2023-02-30', '2023-13-01', ''])
+    def test_invalid_date_must_raise_the_parser_error(self, value):
+        with pytest.raises(ParserError):
+            parse_date(value)
+
+    def test_date_that_is_not_a_string_must_raise_type_error(self):
+        with pytest.raises(TypeError):
+            parse_date(20230326)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 
 import pytest
 from dateutil.relativedelta import *
@@ -7,7 +8,7 @@ from valid8 import ValidationError
 from beach_resort_reservation import domain_utils
 from beach_resort_reservation.domain import NumberOfSeats, ReservedUmbrellaID, NewReservation, Password, Username, \
     Email, \
-    ReservationID, Price, ReservationFromServer
+    ReservationID, Price, ReservationFromServer, construct_interned, construct_trusted
 
 
 class TestNumberOfSeats:
@@ -26,6 +27,16 @@ class TestNumberOfSeats:
         seats = NumberOfSeats(test_input)
         assert seats.value == test_input
 
+    @pytest.mark.parametrize("test_input", [2, 3, 4])
+    def test_number_of_seats_of_must_return_the_same_instance(self, test_input):
+        assert NumberOfSeats.of(test_input) is NumberOfSeats.of(test_input)
+        assert NumberOfSeats.of(test_input) == NumberOfSeats(test_input)
+
+    @pytest.mark.parametrize("test_input", [1, 5])
+    def test_number_of_seats_of_out_of_range_must_raise_a_validation_error(self, test_input):
+        with pytest.raises(ValidationError):
+            NumberOfSeats.of(test_input)
+
 
 class TestReservationUmbrellaID:
     @pytest.mark.parametrize("test_input", [51, 52, 1000, 100])
@@ -43,6 +54,16 @@ class TestReservationUmbrellaID:
         umbrella_id = ReservedUmbrellaID(test_input)
         assert umbrella_id.value == test_input
 
+    @pytest.mark.parametrize("test_input", [0, 25, 50])
+    def test_umbrella_id_of_must_return_the_same_instance(self, test_input):
+        assert ReservedUmbrellaID.of(test_input) is ReservedUmbrellaID.of(test_input)
+        assert ReservedUmbrellaID.of(test_input) == ReservedUmbrellaID(test_input)
+
+    @pytest.mark.parametrize("test_input", [-1, 51])
+    def test_umbrella_id_of_out_of_range_must_raise_a_validation_error(self, test_input):
+        with pytest.raises(ValidationError):
+            ReservedUmbrellaID.of(test_input)
+
 
 class TestReservationID:
     @pytest.mark.parametrize("test_input", [-1, -100, -1000])
@@ -91,6 +112,34 @@ class TestPrice:
             p = Price.parse(value)
             assert str(p) == value
 
+    @pytest.mark.parametrize("value, value_in_cents", [(100, 10000), (10.05, 1005), (1.005, 101), (2.675, 268),
+                                                       (0.125, 13), (Decimal('4.445'), 445), (99999999.99, 9999999999)])
+    def test_price_from_json_must_round_the_decimal_value_half_up(self, value, value_in_cents):
+        assert Price.from_json(value).value_in_cents == value_in_cents
+
+    @pytest.mark.parametrize("value", [-0.001, -1, float('nan'), float('inf'), Decimal('NaN'), 100000000.0])
+    def test_price_from_json_out_of_range_must_raise_a_validation_error(self, value):
+        with pytest.raises(ValidationError):
+            Price.from_json(value)
+
+    def test_price_from_json_must_refuse_strings(self):
+        with pytest.raises(TypeError):
+            Price.from_json('10.05')
+
+
+class TestConstructTrusted:
+    def test_value_objects_must_not_have_an_instance_dict(self):
+        assert not hasattr(NumberOfSeats(2), '__dict__')
+        assert not hasattr(Price.create_price(1, 0), '__dict__')
+
+    def test_trusted_construction_must_work_with_slots(self):
+        assert construct_trusted(ReservationID, value=4) == ReservationID(4)
+        assert construct_trusted(Price, value_in_cents=1005) == Price.from_json(10.05)
+
+    def test_interned_construction_must_reuse_the_pool_and_fall_back_for_other_values(self):
+        assert construct_interned(NumberOfSeats, 3) is NumberOfSeats.of(3)
+        assert construct_interned(NumberOfSeats, 9).value == 9
+
 
 class TestNewReservation:
     @pytest.mark.parametrize("reservation_input",
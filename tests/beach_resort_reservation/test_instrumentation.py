@@ -0,0 +1,79 @@
+import json
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.instrumentation import Instrumentation, RollingHistogram
+from beach_resort_reservation.transport import RequestTiming
+
+
+class TestInstrumentation:
+    def test_summary_must_aggregate_the_observed_timings(self):
+        instrumentation = Instrumentation()
+        instrumentation.observe('fetch', 0.5)
+        instrumentation.observe('fetch', 0.25)
+        timing = instrumentation.summary()['timings']['fetch']
+        assert timing == {'count': 2, 'total_seconds': 0.75, 'min_seconds': 0.25, 'max_seconds': 0.5,
+                          'last_seconds': 0.25}
+
+    def test_timer_must_observe_the_elapsed_time_even_if_the_block_fails(self):
+        instrumentation = Instrumentation()
+        try:
+            with instrumentation.timer('failing'):
+                raise ValueError()
+        except ValueError:
+            pass
+        assert instrumentation.summary()['timings']['failing']['count'] == 1
+
+    def test_write_json_must_export_timings_and_counters(self, tmp_path):
+        instrumentation = Instrumentation()
+        instrumentation.observe('fetch', 1.0)
+        instrumentation.set_counter('saved', 3)
+        path = tmp_path / 'metrics.json'
+        instrumentation.write_json(str(path))
+        assert json.loads(path.read_text()) == instrumentation.summary()
+        assert json.loads(path.read_text())['counters'] == {'saved': 3}
+
+    def test_histogram_must_count_cumulative_buckets_and_rolling_quantiles(self):
+        histogram = RollingHistogram(buckets=(0.1, 1.0), window=4)
+        for value in (0.05, 0.5, 2.0, 0.5, 0.5, 0.5):
+            histogram.observe(value)
+        summary = histogram.summary()
+        assert summary['count'] == 6
+        assert summary['buckets'] == {'0.1': 1, '1': 5, '+Inf': 6}
+        assert summary['p50'] == 0.5
+        assert summary['p99'] == 2.0
+
+    def test_bucket_bounds_must_be_written_without_rounding(self):
+        histogram = RollingHistogram(buckets=app_utils.HISTOGRAM_BYTES_BUCKETS)
+        histogram.observe(1048576)
+        bounds = [bound for bound, _ in histogram.cumulative_buckets()]
+        assert bounds[-4:] == ['1048576', '4194304', '16777216', '+Inf']
+        assert [bound for bound, _ in RollingHistogram().cumulative_buckets()][:3] == ['0.001', '0.005', '0.01']
+
+    def test_observe_request_must_record_every_phase_and_the_status(self):
+        instrumentation = Instrumentation()
+        instrumentation.observe_request(RequestTiming(method='GET', route='/beachreservation/', status_code=200,
+                                                      dns_seconds=0.001, connect_seconds=0.002, ttfb_seconds=0.01,
+                                                      total_seconds=0.02, payload_bytes=2048))
+        summary = instrumentation.summary()
+        phases = {entry['labels']['phase'] for entry in summary['histograms'][app_utils.METRIC_HTTP_REQUEST_SECONDS]}
+        assert phases == {'dns', 'connect', 'ttfb', 'total'}
+        assert summary['histograms'][app_utils.METRIC_HTTP_RESPONSE_BYTES][0]['sum'] == 2048
+        assert summary['labeled_counters'][app_utils.METRIC_HTTP_RESPONSES] == [
+            {'labels': {'method': 'GET', 'route': '/beachreservation/', 'status': '200'}, 'value': 1}]
+
+    def test_write_prometheus_must_export_the_text_exposition_format(self, tmp_path):
+        instrumentation = Instrumentation()
+        instrumentation.observe('fetch', 1.0)
+        instrumentation.set_counter('saved', 3)
+        instrumentation.observe_histogram('parse_seconds', 0.2, {'route': '/a"b/'})
+        instrumentation.increment('http_responses', {'status': '200'}, 2)
+        path = tmp_path / 'metrics.prom'
+        instrumentation.write(str(path), 'prometheus')
+        lines = path.read_text().splitlines()
+        assert 'beach_resort_fetch_seconds_count 1' in lines
+        assert 'beach_resort_saved 3' in lines
+        assert 'beach_resort_http_responses_total{status="200"} 2' in lines
+        assert '# TYPE beach_resort_parse_seconds histogram' in lines
+        assert 'beach_resort_parse_seconds_bucket{route="/a\\"b/",le="0.1"} 0' in lines
+        assert 'beach_resort_parse_seconds_bucket{route="/a\\"b/",le="+Inf"} 1' in lines
+        assert 'beach_resort_parse_seconds_count{route="/a\\"b/"} 1' in lines
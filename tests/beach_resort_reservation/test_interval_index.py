@@ -0,0 +1,58 @@
+import datetime
+import time
+
+from beach_resort_reservation import domain_utils
+from beach_resort_reservation.domain import ReservedUmbrellaID, ReservationID
+from beach_resort_reservation.decoding import reservation_from_server_json
+from beach_resort_reservation.interval_index import ReservationIntervalIndex
+from benchmarks.micro import reservation_rows
+from tests.beach_resort_reservation.helpers import reservation
+
+
+def july(day: int) -> datetime.date:
+    return datetime.date(2023, 7, day)
+
+
+def overlapping(index: ReservationIntervalIndex, umbrella_id: int, start_day: int, end_day: int):
+    return index.overlapping(ReservedUmbrellaID(umbrella_id), july(start_day), july(end_day))
+
+
+class TestReservationIntervalIndex:
+    def test_overlapping_must_find_intervals_sharing_at_least_one_day(self):
+        index = ReservationIntervalIndex([reservation(1, 10, july(5), july(10)),
+                                          reservation(2, 10, july(20), july(25))])
+        assert overlapping(index, 10, 1, 4) == []
+        assert overlapping(index, 10, 1, 5) == [ReservationID(1)]
+        assert overlapping(index, 10, 10, 20) == [ReservationID(1), ReservationID(2)]
+        assert overlapping(index, 10, 11, 19) == []
+        assert overlapping(index, 10, 26, 30) == []
+
+    def test_overlapping_must_only_consider_the_same_umbrella(self):
+        index = ReservationIntervalIndex([reservation(1, domain_utils.MIN_NUMBER_UMBRELLA_ID, july(5), july(10)),
+                                          reservation(2, domain_utils.MAX_NUMBER_UMBRELLA_ID, july(5), july(10))])
+        assert overlapping(index, domain_utils.MAX_NUMBER_UMBRELLA_ID, 6, 6) == [ReservationID(2)]
+        assert overlapping(index, 11, 6, 6) == []
+
+    def test_overlapping_must_find_a_long_interval_starting_before_shorter_ones(self):
+        index = ReservationIntervalIndex([reservation(1, 10, july(1), july(31)), reservation(2, 10, july(2), july(3)),
+                                          reservation(3, 10, july(4), july(5))])
+        assert overlapping(index, 10, 20, 21) == [ReservationID(1)]
+
+    def test_index_must_follow_additions_and_removals(self):
+        index = ReservationIntervalIndex()
+        index.add(reservation(1, 10, july(5), july(10)))
+        assert overlapping(index, 10, 7, 7) == [ReservationID(1)]
+        index.add(reservation(1, 11, july(5), july(10)))
+        assert overlapping(index, 10, 7, 7) == []
+        index.remove(ReservationID(1))
+        index.remove(ReservationID(1))
+        assert overlapping(index, 11, 7, 7) == []
+
+    def test_rebuild_of_a_realistic_list_must_take_linear_time(self):
+        reservations = [reservation_from_server_json(row) for row in reservation_rows(10_000)]
+        started_at = time.perf_counter()
+        index = ReservationIntervalIndex(reservations)
+        assert time.perf_counter() - started_at < 1
+        expected = [ReservationID(row.id.value) for row in reservations
+                    if row.umbrella_id.value == 7 and row.start_date <= datetime.date(2023, 7, 3) <= row.end_date]
+        assert sorted(overlapping(index, 7, 3, 3)) == sorted(expected)
@@ -0,0 +1,52 @@
+import io
+import json
+
+import pytest
+from requests import Response
+
+from beach_resort_reservation.json_stream import iter_json_array, iter_response_chunks
+
+
+def split_in_chunks(raw: bytes, size: int):
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+class TestIterJsonArray:
+    items = [{'id': i, 'text': 'àé€😀', 'values': [1, 2.5, None, True]} for i in range(20)] + [1, 22, 'x', [], {}]
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 100_000])
+    def test_items_must_be_decoded_whatever_the_chunk_boundaries(self, chunk_size):
+        raw = json.dumps(self.items, ensure_ascii=False, indent=1).encode()
+        assert list(iter_json_array(split_in_chunks(raw, chunk_size))) == self.items
+
+    def test_numbers_split_across_chunks_must_not_be_truncated(self):
+        assert list(iter_json_array([b'[1', b'23', b']'])) == [123]
+        assert list(iter_json_array([b'[100.', b'00]'])) == [100.0]
+        assert list(iter_json_array([b'[1e', b'5]'])) == [1e5]
+        assert list(iter_json_array([b'[2.5E', b'-', b'1, 3]'])) == [0.25, 3]
+
+    def test_items_must_be_yielded_before_the_whole_array_is_received(self):
+        items = iter_json_array(iter([b'[{"id": 1}, ', b'{"id": 2}', b']']))
+        assert next(items) == {'id': 1}
+
+    def test_empty_array_must_yield_nothing(self):
+        assert list(iter_json_array([b' [ ', b'] '])) == []
+
+    @pytest.mark.parametrize('raw', [b'{}', b'[1,]', b'[1 2]', b'[1', b'[1]x', b'[1.]', b''])
+    def test_malformed_array_must_raise_a_value_error(self, raw):
+        with pytest.raises(ValueError):
+            list(iter_json_array([raw]))
+
+
+class TestIterResponseChunks:
+    def test_streamed_response_must_be_read_in_chunks(self):
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b'[1, 2, 3]')
+        assert list(iter_response_chunks(response, chunk_size=4)) == [b'[1, ', b'2, 3', b']']
+
+    def test_already_loaded_response_must_be_returned_as_one_chunk(self):
+        response = Response()
+        response.status_code = 200
+        response._content = b'[1, 2, 3]'
+        assert list(iter_response_chunks(response)) == [b'[1, 2, 3]']
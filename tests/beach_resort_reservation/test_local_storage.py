@@ -0,0 +1,16 @@
+from pathlib import Path
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.local_storage import user_cache_directory, account_file
+
+
+class TestLocalStorage:
+    def test_user_cache_directory_must_follow_xdg_cache_home(self):
+        assert user_cache_directory({'XDG_CACHE_HOME': '/cache'}) == Path('/cache') / app_utils.CACHE_DIRECTORY_NAME
+
+    def test_account_file_must_not_expose_the_account_name(self, tmp_path):
+        path = account_file(tmp_path / 'cache', 'cris', '.sqlite3')
+        assert path == account_file(tmp_path / 'cache', 'cris', '.sqlite3')
+        assert path != account_file(tmp_path / 'cache', 'other', '.sqlite3')
+        assert 'cris' not in path.name
+        assert path.parent.is_dir()
@@ -92,3 +92,35 @@ class TestMenu:
 
 
 
+
+    @patch('builtins.input', side_effect=['x', '0'])
+    @patch('builtins.print')
+    def test_hidden_entry_must_be_selectable_but_not_printed(self, mocked_print: Mock, mocked_input: Mock):
+        menu = Menu.Builder(Description('menu')) \
+            .with_entry(Entry.create('x', 'hidden entry', on_selected=lambda: print('hidden'), is_hidden=True)) \
+            .with_entry(Entry.create('0', 'entry with exit', on_selected=lambda: print('exit'), is_exit=True)) \
+            .build()
+
+        menu.run()
+        mocked_print.assert_any_call('hidden')
+        assert call('x:\thidden entry') not in mocked_print.mock_calls
+        mocked_print.assert_any_call('0:\tentry with exit')
+
+    @patch('builtins.input', side_effect=['1', '0'])
+    @patch('builtins.print')
+    def test_around_action_must_wrap_every_selection_and_auto_select(self, mocked_print: Mock, mocked_input: Mock):
+        actions = []
+
+        def around_action(name, action):
+            actions.append(name)
+            action()
+
+        menu = Menu.Builder(Description('menu'), auto_select=lambda: print('auto'), around_action=around_action) \
+            .with_entry(Entry.create('1', 'entry with not exit', on_selected=lambda: print('test1'))) \
+            .with_entry(Entry.create('0', 'entry with exit', on_selected=lambda: print('exit'), is_exit=True)) \
+            .build()
+
+        menu.run()
+        assert actions == ['menu - auto select', 'menu - entry with not exit', 'menu - auto select',
+                           'menu - entry with exit']
+        mocked_print.assert_any_call('test1')
@@ -0,0 +1,76 @@
+import pytest
+import requests
+
+from beach_resort_reservation.domain import ReservationID
+from beach_resort_reservation.offline_store import OfflineStore, replay_pending_mutations, CREATE_MUTATION, \
+    DELETE_MUTATION
+from tests.beach_resort_reservation.helpers import response_with, reservation, new_reservation
+
+
+@pytest.fixture
+def store(tmp_path):
+    offline_store = OfflineStore(str(tmp_path / 'store.sqlite3'))
+    yield offline_store
+    offline_store.close()
+
+
+class TestOfflineStore:
+    def test_reservations_must_survive_reopening_the_store(self, tmp_path):
+        path = str(tmp_path / 'store.sqlite3')
+        first_store = OfflineStore(path)
+        first_store.replace_reservations([reservation(1), reservation(2)])
+        first_store.remove_reservation(ReservationID(1))
+        first_store.add_reservation(reservation(3))
+        first_store.close()
+        second_store = OfflineStore(path)
+        assert second_store.reservations() == [reservation(2), reservation(3)]
+        second_store.close()
+
+    def test_enqueue_delete_must_remove_the_reservation_and_queue_the_mutation(self, store):
+        store.replace_reservations([reservation(1)])
+        store.enqueue_create(new_reservation())
+        store.enqueue_delete(ReservationID(1))
+        assert store.reservations() == []
+        pending = store.pending_mutations()
+        assert [mutation.kind for mutation in pending] == [CREATE_MUTATION, DELETE_MUTATION]
+        assert pending[0].new_reservation == new_reservation()
+        assert pending[1].reservation_id == ReservationID(1)
+
+    def test_replay_must_send_every_mutation_and_report_the_conflicts(self, store):
+        store.enqueue_create(new_reservation())
+        for reservation_id in range(1, 4):
+            store.enqueue_delete(ReservationID(reservation_id))
+        report = replay_pending_mutations(store, lambda _: response_with(201),
+                                          lambda reservation_id: response_with(404 if reservation_id.value == 2
+                                                                               else 204), batch_size=2)
+        assert report.is_complete
+        assert len(report.applied) == 3
+        assert [mutation.reservation_id for mutation, _ in report.conflicts] == [ReservationID(2)]
+        assert store.pending_mutations() == []
+
+    def test_replay_must_keep_the_mutations_that_could_not_be_sent(self, store):
+        store.enqueue_delete(ReservationID(1))
+        store.enqueue_delete(ReservationID(2))
+
+        def delete(reservation_id):
+            if reservation_id.value == 2:
+                raise requests.ConnectionError()
+            return response_with(204)
+
+        report = replay_pending_mutations(store, lambda _: response_with(201), delete)
+        assert not report.is_complete
+        assert [mutation.reservation_id for mutation in store.pending_mutations()] == [ReservationID(2)]
+
+    def test_replay_must_report_a_create_without_answer_instead_of_sending_it_again(self, store):
+        store.enqueue_create(new_reservation(umbrella_id=1))
+        store.enqueue_create(new_reservation(umbrella_id=2))
+
+        def create(new_reservation_to_send):
+            if new_reservation_to_send.umbrella_id.value == 1:
+                raise requests.ReadTimeout()
+            raise requests.ConnectTimeout()
+
+        report = replay_pending_mutations(store, create, lambda _: response_with(204))
+        assert not report.is_complete
+        assert [mutation.new_reservation.umbrella_id.value for mutation in report.unknown] == [1]
+        assert [mutation.new_reservation.umbrella_id.value for mutation in store.pending_mutations()] == [2]
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from beach_resort_reservation.domain import ReservationID
+from beach_resort_reservation.pagination import ReservationPage, ReservationPager, decode_reservation_page
+from tests.beach_resort_reservation.helpers import reservation_json
+
+
+class FakeServer:
+    def __init__(self, size: int):
+        self.size = size
+        self.requested_offsets = []
+        self.lock = threading.Lock()
+
+    def fetch_page(self, offset: int, limit: int) -> ReservationPage:
+        with self.lock:
+            self.requested_offsets.append(offset)
+        ids = range(offset, min(offset + limit, self.size))
+        return decode_reservation_page({'count': self.size, 'next': 'next' if offset + limit < self.size else None,
+                                        'results': [reservation_json(i) for i in ids]}, offset)
+
+
+class TestDecodeReservationPage:
+    def test_paginated_envelope_must_be_decoded(self):
+        page = decode_reservation_page({'count': 10, 'next': 'url', 'results': [reservation_json(1)]}, 0)
+        assert page.reservations[0].id == ReservationID(1)
+        assert page.total == 10
+        assert page.has_next
+
+    def test_plain_list_must_be_decoded_as_the_last_page(self):
+        page = decode_reservation_page([reservation_json(1), reservation_json(2)], 0)
+        assert len(page.reservations) == 2
+        assert page.total == 2
+        assert not page.has_next
+
+
+class TestReservationPager:
+    def test_pager_must_return_the_pages_in_order_until_the_end(self):
+        pager = ReservationPager(FakeServer(5).fetch_page, page_size=2)
+        pages = []
+        while pager.has_next:
+            pages.append([reservation.id.value for reservation in pager.next_page().reservations])
+        assert pages == [[0, 1], [2, 3], [4]]
+        assert pager.next_page() is None
+        assert pager.total == 5
+        pager.close()
+
+    def test_pager_must_prefetch_only_the_following_page(self):
+        server = FakeServer(100)
+        pager = ReservationPager(server.fetch_page, page_size=10)
+        pager.next_page()
+        pager.next_page()
+        pager.close()
+        assert {0, 10} <= set(server.requested_offsets) <= {0, 10, 20}
+        assert len(server.requested_offsets) == len(set(server.requested_offsets))
+
+    def test_pager_reset_must_start_again_from_the_first_page(self):
+        pager = ReservationPager(FakeServer(100).fetch_page, page_size=10)
+        pager.next_page()
+        pager.next_page()
+        pager.reset()
+        assert pager.next_page().offset == 0
+        pager.close()
+
+    def test_a_hung_prefetch_must_not_keep_the_interpreter_alive(self):
+        script = '''
+import threading
+from beach_resort_reservation.pagination import ReservationPager, decode_reservation_page
+
+def fetch_page(offset, limit):
+    if offset > 0:
+        threading.Event().wait()
+    return decode_reservation_page({'count': None, 'next': 'next', 'results': [%r]}, offset)
+
+pager = ReservationPager(fetch_page, page_size=10)
+pager.next_page()
+pager.close()
+'''
+        subprocess.run([sys.executable, '-c', script % reservation_json(1)], check=True, timeout=30,
+                       cwd=Path(__file__).parents[2])
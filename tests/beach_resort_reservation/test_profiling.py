@@ -0,0 +1,57 @@
+import pstats
+import re
+import time
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.profiling import ActionProfiler, action_file_name
+
+
+def busy_inner():
+    time.sleep(0.01)
+
+
+def busy_outer():
+    sum(range(1000))
+
+
+class TestActionProfiler:
+    def test_nested_actions_must_be_profiled_separately(self, tmp_path):
+        profiler = ActionProfiler(tmp_path)
+        profiler.around('outer', lambda: (busy_outer(), profiler.around('inner', busy_inner)))
+        profiler.write()
+        outer = {function for _, _, function in pstats.Stats(str(tmp_path / 'outer.prof')).stats}
+        inner = {function for _, _, function in pstats.Stats(str(tmp_path / 'inner.prof')).stats}
+        assert 'busy_outer' in outer and 'busy_inner' not in outer
+        assert 'busy_inner' in inner
+
+    def test_summary_must_leave_the_time_of_nested_actions_out_of_the_outer_one(self, tmp_path):
+        profiler = ActionProfiler(tmp_path)
+        profiler.around('outer', lambda: profiler.around('inner', lambda: time.sleep(0.2)))
+        summary = profiler.summary()
+        outer_seconds = float(re.search(r'== outer: 1 calls, ([0-9.]+) s', summary).group(1))
+        inner_seconds = float(re.search(r'== inner: 1 calls, ([0-9.]+) s', summary).group(1))
+        assert inner_seconds >= 0.2
+        assert outer_seconds < 0.1
+
+    def test_write_must_summarize_every_action_with_its_number_of_calls(self, tmp_path):
+        profiler = ActionProfiler(tmp_path, top=3)
+        for _ in range(2):
+            profiler.around('Umbrella Reservation - Delete a reservation', busy_outer)
+        summary_path = profiler.write()
+        assert summary_path == tmp_path / app_utils.PROFILE_SUMMARY_FILE_NAME
+        summary = summary_path.read_text()
+        assert '== Umbrella Reservation - Delete a reservation: 2 calls' in summary
+        assert 'busy_outer' in summary
+        assert (tmp_path / 'umbrella_reservation_delete_a_reservation.prof').exists()
+
+    def test_action_must_be_profiled_even_if_it_fails(self, tmp_path):
+        profiler = ActionProfiler(tmp_path)
+        try:
+            profiler.around('failing', lambda: int('x'))
+        except ValueError:
+            pass
+        profiler.write()
+        assert (tmp_path / 'failing.prof').exists()
+
+    def test_action_file_name_must_keep_only_lowercase_letters_and_digits(self):
+        assert action_file_name('Umbrella Reservation - auto select') == 'umbrella_reservation_auto_select'
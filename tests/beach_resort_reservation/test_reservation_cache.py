@@ -0,0 +1,64 @@
+import datetime
+
+from beach_resort_reservation.domain import ReservationID
+from beach_resort_reservation.offline_store import OfflineStore
+from beach_resort_reservation.reservation_cache import ReservationCache
+from tests.beach_resort_reservation.helpers import reservation, new_reservation
+
+
+class TestReservationCache:
+    def test_empty_cache_must_not_send_validators(self):
+        assert ReservationCache().validators() == {}
+
+    def test_cache_must_send_the_validators_of_the_stored_list(self):
+        cache = ReservationCache()
+        cache.store([reservation(1)], etag='"1"', last_modified='Sun, 26 Mar 2023 10:00:00 GMT')
+        assert cache.validators() == {'If-None-Match': '"1"', 'If-Modified-Since': 'Sun, 26 Mar 2023 10:00:00 GMT'}
+        assert cache.reservations == [reservation(1)]
+
+    def test_cleared_cache_must_forget_list_and_validators(self):
+        cache = ReservationCache()
+        cache.store([reservation(1)], etag='"1"')
+        cache.clear()
+        assert cache.reservations is None
+        assert cache.validators() == {}
+
+    def test_cache_must_expire_after_the_ttl(self):
+        now = [100.0]
+        cache = ReservationCache(ttl_seconds=10, clock=lambda: now[0])
+        assert not cache.is_fresh()
+        cache.store([reservation(1)])
+        assert cache.is_fresh()
+        now[0] = 110.0
+        assert not cache.is_fresh()
+        cache.revalidated()
+        assert cache.is_fresh()
+
+    def test_cache_must_be_updated_in_place_by_mutations(self):
+        cache = ReservationCache()
+        cache.store([reservation(1), reservation(2)])
+        cache.remove(ReservationID(1))
+        cache.add(reservation(3))
+        assert cache.reservations == [reservation(2), reservation(3)]
+        assert cache.is_fresh()
+
+    def test_invalidated_cache_must_keep_the_validators_for_the_next_fetch(self):
+        cache = ReservationCache()
+        cache.store([reservation(1)], etag='"1"')
+        cache.invalidate()
+        assert not cache.is_fresh()
+        assert cache.validators() == {'If-None-Match': '"1"'}
+
+    def test_store_of_a_list_fetched_before_a_local_change_must_be_dropped(self, tmp_path):
+        offline_store = OfflineStore(str(tmp_path / 'offline.sqlite3'))
+        cache = ReservationCache()
+        cache.persist_to(offline_store)
+        cache.store([reservation(1), reservation(2)])
+        generation = cache.generation
+        cache.remove(ReservationID(2))
+        assert not cache.store([reservation(1), reservation(2)], generation=generation)
+        assert cache.reservations == [reservation(1)]
+        assert offline_store.reservations() == [reservation(1)]
+        assert cache.overlapping(new_reservation(end_date=datetime.date(2023, 3, 26))) == [ReservationID(1)]
+        assert cache.store([reservation(1)], generation=cache.generation)
+        offline_store.close()
@@ -0,0 +1,97 @@
+import datetime
+
+import numpy as np
+import pytest
+from valid8 import ValidationError
+
+from beach_resort_reservation.decoding import reservation_from_json
+from beach_resort_reservation.domain import Price
+from beach_resort_reservation.reservation_table import ReservationTable, prices_in_cents
+from tests.beach_resort_reservation.helpers import reservation_json
+
+
+def indexed_reservation_json(index, **values):
+    return reservation_json(index, **{'number_of_seats': 2 + index % 3, 'reserved_umbrella_id': index % 51, **values})
+
+
+class TestReservationTable:
+    def test_table_must_materialize_the_same_reservations_as_the_strict_decoder(self):
+        rows = [indexed_reservation_json(index) for index in range(20)]
+        table = ReservationTable.from_json(rows)
+        assert len(table) == 20
+        assert list(table.reservations()) == [reservation_from_json(row) for row in rows]
+        assert table[3].to_reservation() == reservation_from_json(rows[3])
+        assert table[-1].id == 19
+
+    def test_row_view_must_read_the_columns(self):
+        table = ReservationTable.from_json([indexed_reservation_json(7)])
+        row = table[0]
+        assert (row.id, row.umbrella_id, row.number_of_seats, row.price_in_cents) == (7, 7, 3, 1005)
+        assert row.start_date == datetime.date(2023, 3, 26)
+        assert row.end_date == datetime.date(2023, 3, 27)
+        with pytest.raises(IndexError):
+            _ = table[1]
+
+    @pytest.mark.parametrize('values', [{'number_of_seats': 1}, {'number_of_seats': 5},
+                                        {'reserved_umbrella_id': 51}, {'reserved_umbrella_id': -1},
+                                        {'id': -1}, {'reservation_price': -1.0}, {'reserved_umbrella_id': True},
+                                        {'reservation_end_date': '2023-03-25'},
+                                        {'reservation_end_date': '2023-04-27'}])
+    def test_table_must_refuse_the_rows_outside_the_domain_limits(self, values):
+        with pytest.raises(ValidationError):
+            ReservationTable.from_json([indexed_reservation_json(0), indexed_reservation_json(1, **values)])
+
+    @pytest.mark.parametrize('values', [{'id': 3.7}, {'number_of_seats': 2.9}, {'number_of_seats': 3.0},
+                                        {'id': '3'}])
+    def test_table_must_refuse_the_values_that_are_not_integers_like_the_strict_decoder(self, values):
+        with pytest.raises(TypeError):
+            reservation_from_json(indexed_reservation_json(1, **values))
+        with pytest.raises(ValidationError):
+            ReservationTable.from_json([indexed_reservation_json(0), indexed_reservation_json(1, **values)])
+
+    @pytest.mark.parametrize('end_date, is_valid', [('2023-02-28', True), ('2023-03-01', False)])
+    def test_end_date_limit_must_follow_the_month_arithmetic_of_the_domain(self, end_date, is_valid):
+        row = indexed_reservation_json(0, reservation_start_date='2023-01-31', reservation_end_date=end_date)
+        if is_valid:
+            assert list(ReservationTable.from_json([row]).reservations()) == [reservation_from_json(row)]
+        else:
+            with pytest.raises(ValidationError):
+                reservation_from_json(row)
+            with pytest.raises(ValidationError):
+                ReservationTable.from_json([row])
+
+    def test_selection_must_return_a_table_with_the_selected_rows(self):
+        table = ReservationTable.from_json([indexed_reservation_json(index) for index in range(102)])
+        selected = table[table.umbrella_ids == 3]
+        assert selected.ids.tolist() == [3, 54]
+        assert table[10:12].ids.tolist() == [10, 11]
+
+    def test_columns_must_be_read_only(self):
+        table = ReservationTable.from_json([indexed_reservation_json(0)])
+        with pytest.raises(ValueError):
+            table.ids[0] = 3
+
+    def test_table_must_round_trip_the_domain_objects(self):
+        reservations = [reservation_from_json(indexed_reservation_json(index)) for index in range(5)]
+        assert list(ReservationTable.from_reservations(reservations).reservations()) == reservations
+
+    def test_dates_not_in_iso_format_must_fall_back_to_the_date_parser(self):
+        table = ReservationTable.from_json([indexed_reservation_json(0, reservation_start_date='26 March 2023',
+                                                                     reservation_end_date='2023/03/27')])
+        assert table.start_dates.tolist() == [datetime.date(2023, 3, 26)]
+        assert table.end_dates.dtype == np.dtype('datetime64[D]')
+
+    def test_table_must_use_far_less_memory_than_the_domain_objects(self):
+        table = ReservationTable.from_json([indexed_reservation_json(index) for index in range(1000)])
+        assert table.nbytes == 1000 * (8 + 1 + 1 + 8 + 8 + 8)
+
+
+class TestPricesInCents:
+    def test_batch_must_match_the_exact_price_decoding(self):
+        values = [10.05, 1.005, 2.675, 0.125, 3, 99999999.99] + [0.01 * index for index in range(1000)]
+        assert prices_in_cents(values).tolist() == [Price.from_json(value).value_in_cents for value in values]
+
+    @pytest.mark.parametrize('value', [-0.001, float('nan'), float('inf'), '10.05', 'ten', None, True])
+    def test_batch_must_refuse_the_values_that_are_not_prices(self, value):
+        with pytest.raises(ValidationError):
+            prices_in_cents([1.0, value])
@@ -0,0 +1,69 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from beach_resort_reservation.single_flight import SingleFlight
+
+
+def start_blocked_leader(single_flight: SingleFlight, executor: ThreadPoolExecutor, key, result):
+    started = threading.Event()
+    release = threading.Event()
+
+    def leader_function():
+        started.set()
+        release.wait(timeout=5)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    leader = executor.submit(single_flight.do, key, leader_function)
+    started.wait(timeout=5)
+    return leader, release
+
+
+class TestSingleFlight:
+    def test_sequential_calls_must_each_execute_the_function(self):
+        single_flight = SingleFlight()
+        assert single_flight.do('key', lambda: 1) == (1, False)
+        assert single_flight.do('key', lambda: 2) == (2, False)
+        assert single_flight.statistics.executions == 2
+        assert single_flight.statistics.saved == 0
+
+    def test_concurrent_callers_with_the_same_key_must_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader, release = start_blocked_leader(single_flight, executor, 'key', 'result')
+            followers = [executor.submit(single_flight.do, 'key', lambda: calls.append(1)) for _ in range(3)]
+            while single_flight.statistics.calls < 4:
+                pass
+            release.set()
+            assert leader.result() == ('result', False)
+            assert [follower.result() for follower in followers] == [('result', True)] * 3
+        assert calls == []
+        assert single_flight.statistics.executions == 1
+        assert single_flight.statistics.saved == 3
+
+    def test_concurrent_callers_with_different_keys_must_not_be_coalesced(self):
+        single_flight = SingleFlight()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader, release = start_blocked_leader(single_flight, executor, 'first', 1)
+            assert single_flight.do('second', lambda: 2) == (2, False)
+            release.set()
+            assert leader.result() == (1, False)
+        assert single_flight.statistics.saved == 0
+
+    def test_an_exception_must_be_raised_to_every_waiting_caller(self):
+        single_flight = SingleFlight()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader, release = start_blocked_leader(single_flight, executor, 'key', ValueError('failed'))
+            follower = executor.submit(single_flight.do, 'key', lambda: 1)
+            while single_flight.statistics.calls < 2:
+                pass
+            release.set()
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                follower.result()
+        assert single_flight.do('key', lambda: 1) == (1, False)
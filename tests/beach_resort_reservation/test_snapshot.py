@@ -0,0 +1,34 @@
+import datetime
+import stat
+
+from beach_resort_reservation.snapshot import ReservationSnapshot, encode_snapshot, decode_snapshot, \
+    write_snapshot, read_snapshot
+from tests.beach_resort_reservation.helpers import reservation
+
+
+class TestSnapshot:
+    def test_decode_must_return_what_was_encoded(self):
+        snapshot = ReservationSnapshot([reservation(1, umbrella_id=50, end_date=datetime.date(2023, 4, 2),
+                                                    number_of_seats=3, price='1234.05'), reservation(2 ** 40)],
+                                       etag='"7"',
+                                       last_modified='Sun, 26 Mar 2023 10:00:00 GMT')
+        assert decode_snapshot(encode_snapshot(snapshot)) == snapshot
+
+    def test_empty_validators_must_be_decoded_as_none(self):
+        snapshot = decode_snapshot(encode_snapshot(ReservationSnapshot([])))
+        assert snapshot.etag is None
+        assert snapshot.last_modified is None
+
+    def test_write_snapshot_must_create_a_file_readable_only_by_the_owner(self, tmp_path):
+        path = tmp_path / 'account.snapshot'
+        write_snapshot(path, ReservationSnapshot([reservation(1)]))
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert read_snapshot(path).reservations == [reservation(1)]
+
+    def test_read_snapshot_must_ignore_missing_or_damaged_files(self, tmp_path):
+        path = tmp_path / 'account.snapshot'
+        assert read_snapshot(path) is None
+        path.write_bytes(encode_snapshot(ReservationSnapshot([reservation(1)]))[:-1])
+        assert read_snapshot(path) is None
+        path.write_bytes(b'not a snapshot')
+        assert read_snapshot(path) is None
@@ -0,0 +1,35 @@
+import os
+import stat
+
+from beach_resort_reservation.token_store import TokenStore, StoredToken
+
+
+class TestTokenStore:
+    def test_saved_token_must_be_loaded_back_from_a_private_file(self, tmp_path):
+        path = tmp_path / 'cache' / 'token.json'
+        token_store = TokenStore(path)
+        token_store.save(StoredToken(account='cris', key='key value'))
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert TokenStore(path).load() == StoredToken(account='cris', key='key value')
+
+    def test_load_must_ignore_a_token_readable_by_other_users(self, tmp_path):
+        path = tmp_path / 'token.json'
+        token_store = TokenStore(path)
+        token_store.save(StoredToken(account='cris', key='key value'))
+        os.chmod(path, 0o644)
+        assert token_store.load() is None
+
+    def test_load_must_ignore_missing_or_damaged_files(self, tmp_path):
+        path = tmp_path / 'token.json'
+        token_store = TokenStore(path)
+        assert token_store.load() is None
+        token_store.save(StoredToken(account='cris', key='key value'))
+        path.write_text('{"account": "cris"}')
+        assert token_store.load() is None
+
+    def test_clear_must_remove_the_token(self, tmp_path):
+        token_store = TokenStore(tmp_path / 'token.json')
+        token_store.save(StoredToken(account='cris', key='key value'))
+        token_store.clear()
+        token_store.clear()
+        assert token_store.load() is None
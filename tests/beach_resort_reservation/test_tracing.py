@@ -0,0 +1,56 @@
+import json
+import threading
+
+from beach_resort_reservation.tracing import Tracer
+from beach_resort_reservation.transport import RequestTiming
+
+
+def read_events(path):
+    lines = path.read_text().splitlines()
+    assert lines[0] == '['
+    return [json.loads(line.rstrip(',')) for line in lines[1:]]
+
+
+class TestTracer:
+    def test_nested_spans_must_be_written_as_complete_events_inside_their_parent(self, tmp_path):
+        tracer = Tracer(tmp_path / 'trace.json')
+        with tracer.span('parent', 'menu'):
+            with tracer.span('child', 'decode', {'rows': 1}) as span_args:
+                span_args['built'] = True
+        tracer.close()
+        events = {event['name']: event for event in read_events(tmp_path / 'trace.json') if event['ph'] == 'X'}
+        parent, child = events['parent'], events['child']
+        assert child['args'] == {'rows': 1, 'built': True}
+        assert parent['ts'] <= child['ts'] and child['ts'] + child['dur'] <= parent['ts'] + parent['dur']
+        assert parent['tid'] == child['tid'] == threading.get_ident()
+
+    def test_every_thread_must_be_named_once(self, tmp_path):
+        tracer = Tracer(tmp_path / 'trace.json')
+        tracer.around('first', lambda: None)
+        worker = threading.Thread(target=lambda: tracer.around('second', lambda: None), name='warm-up')
+        worker.start()
+        worker.join()
+        tracer.around('third', lambda: None)
+        tracer.close()
+        names = [event['args']['name'] for event in read_events(tmp_path / 'trace.json') if event['ph'] == 'M']
+        assert names == [threading.current_thread().name, 'warm-up']
+
+    def test_request_timing_must_become_an_http_span_ending_now(self, tmp_path):
+        tracer = Tracer(tmp_path / 'trace.json')
+        tracer.observe_request(RequestTiming(method='POST', route='/beachreservation/', status_code=201,
+                                             dns_seconds=0.0, connect_seconds=0.0, ttfb_seconds=0.01,
+                                             total_seconds=0.02, payload_bytes=120))
+        tracer.close()
+        event = read_events(tmp_path / 'trace.json')[-1]
+        assert event['name'] == 'POST /beachreservation/'
+        assert event['cat'] == 'http'
+        assert event['dur'] == 20000
+        assert event['args']['status'] == 201
+
+    def test_disabled_tracer_must_not_write_anything(self, tmp_path):
+        tracer = Tracer()
+        with tracer.span('ignored', 'menu') as span_args:
+            span_args['rows'] = 1
+        tracer.close()
+        assert not tracer.is_enabled
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,87 @@
+import socket
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests import Response
+
+from beach_resort_reservation import app_utils
+from beach_resort_reservation.transport import Transport, request_route
+from benchmarks.stand_in_server import running_stand_in_server
+
+
+class TestTransport:
+    def test_transport_must_send_the_authorization_header_once_authorized(self):
+        transport = Transport()
+        transport.authorize('key value')
+        assert transport.headers['Authorization'] == 'Token key value'
+
+    def test_transport_must_not_send_the_authorization_header_after_deauthorize(self):
+        transport = Transport()
+        transport.authorize('key value')
+        transport.deauthorize()
+        assert 'Authorization' not in transport.headers
+
+    def test_transport_must_ask_to_keep_the_connection_alive_by_default(self):
+        assert Transport().headers['Connection'] == 'keep-alive'
+        assert Transport(keep_alive=False).headers['Connection'] == 'close'
+
+    def test_transport_must_prefix_the_end_point_with_the_base_url(self):
+        response_mock = Response()
+        response_mock.status_code = 200
+        with patch.object(requests.Session, 'get', return_value=response_mock) as mocked_get:
+            response: Response = Transport(base_url='http://localhost:1').get(app_utils.RESERVATIONS_END_POINT)
+            assert response.status_code == 200
+            mocked_get.assert_called_once_with(url=f'http://localhost:1{app_utils.RESERVATIONS_END_POINT}')
+
+    def test_transport_must_reuse_the_same_session_for_every_request(self):
+        response_mock = Response()
+        response_mock.status_code = 200
+        transport = Transport()
+        with patch.object(requests.Session, 'post', autospec=True, return_value=response_mock) as mocked_post:
+            transport.post(app_utils.LOGIN_END_POINT)
+            transport.post(app_utils.LOGOUT_END_POINT)
+            sessions = {id(mock_call.args[0]) for mock_call in mocked_post.mock_calls}
+            assert mocked_post.call_count == 2
+            assert len(sessions) == 1
+
+    def test_transport_must_report_the_timing_of_each_request_to_the_observers(self):
+        response_mock = Response()
+        response_mock.status_code = 204
+        response_mock._content = b''
+        timings = []
+        transport = Transport(base_url='http://localhost:1')
+        transport.add_observer(timings.append)
+        with patch.object(requests.Session, 'delete', return_value=response_mock):
+            transport.delete(f'{app_utils.RESERVATIONS_END_POINT}27/')
+        with patch.object(requests.Session, 'get', side_effect=requests.ConnectionError()):
+            with pytest.raises(requests.ConnectionError):
+                transport.get(app_utils.RESERVATIONS_END_POINT)
+        assert [(timing.method, timing.route, timing.status_code, timing.payload_bytes) for timing in timings] == [
+            ('DELETE', f'{app_utils.RESERVATIONS_END_POINT}{{id}}/', 204, 0),
+            ('GET', app_utils.RESERVATIONS_END_POINT, None, None)]
+        assert all(timing.total_seconds >= 0 for timing in timings)
+
+    def test_timed_connection_must_fall_back_to_the_next_resolved_address(self):
+        real_getaddrinfo = socket.getaddrinfo
+
+        def resolve(host, port, *args, **kwargs):
+            if host != 'reservations.test':
+                return real_getaddrinfo(host, port, *args, **kwargs)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port)) for address in ('127.0.0.2',
+                                                                                               '127.0.0.1')]
+
+        with running_stand_in_server() as server:
+            timings = []
+            transport = Transport(base_url=server.base_url.replace('127.0.0.1', 'reservations.test'))
+            transport.add_observer(timings.append)
+            with patch.object(socket, 'getaddrinfo', side_effect=resolve):
+                response = transport.get(app_utils.RESERVATIONS_END_POINT)
+            transport.close()
+        assert response.status_code == 401
+        assert timings[0].dns_seconds >= 0 and timings[0].connect_seconds >= 0
+
+    def test_request_route_must_hide_the_numeric_ids(self):
+        assert request_route('/beachreservation/27/') == '/beachreservation/{id}/'
+        assert request_route('/beachreservation/27') == '/beachreservation/{id}'
+        assert request_route('/auth/login/') == '/auth/login/'
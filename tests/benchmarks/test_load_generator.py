@@ -0,0 +1,48 @@
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from beach_resort_reservation.app import App
+from benchmarks.load_generator import generate_load, parse_mix, percentile
+from benchmarks.stand_in_server import running_stand_in_server
+
+
+class TestLoadGenerator:
+    def test_percentile_must_use_the_nearest_rank(self):
+        samples = [float(value) for value in range(1, 101)]
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99) == 99
+        assert percentile([3.0], 99) == 3
+
+    def test_mix_must_refuse_unknown_actions(self):
+        assert parse_mix('list=6,create=2,delete=2') == {'list': 6, 'create': 2, 'delete': 2}
+        with pytest.raises(ValueError):
+            parse_mix('list=1,update=1')
+
+    def test_users_must_cycle_through_every_endpoint_without_errors(self):
+        with running_stand_in_server(dataset_size=50) as server:
+            report = generate_load(server.base_url, users=4, duration_seconds=0.5, actions_per_session=6)
+        summary = report.summary()
+        assert set(summary) == {'login', 'list', 'create', 'delete', 'logout'}
+        assert all(row['errors'] == 0 for row in summary.values())
+        assert summary['login']['requests'] >= 4
+        assert summary['list']['p50_ms'] <= summary['list']['p99_ms']
+
+    def test_users_must_log_in_with_the_given_credentials(self):
+        with running_stand_in_server() as server:
+            with patch.object(App, 'do_login_request', autospec=True,
+                              side_effect=App.do_login_request) as mocked_login:
+                generate_load(server.base_url, users=1, duration_seconds=0.1, actions_per_session=1,
+                              username='cris', password='secret')
+        assert mocked_login.call_args.args[1:] == ('cris', 'secret')
+
+    def test_users_must_back_off_after_a_failed_login(self):
+        with socket.socket() as unused:
+            unused.bind(('127.0.0.1', 0))
+            base_url = f'http://127.0.0.1:{unused.getsockname()[1]}'
+        report = generate_load(base_url, users=2, duration_seconds=0.4)
+        summary = report.summary()
+        assert summary['login']['requests'] == 2
+        assert summary['login']['errors'] == 2
@@ -0,0 +1,19 @@
+from benchmarks.micro import CASES, run_suite, compare
+
+
+class TestMicroBenchmarks:
+    def test_every_case_must_report_speed_and_allocations(self):
+        results = run_suite(list(CASES), [10], repeats=1)
+        for name in CASES:
+            measurement = results[name]['10']
+            assert measurement['ops_per_second'] > 0
+            assert measurement['blocks_per_op'] >= 0
+            assert measurement['peak_bytes_per_op'] > 0
+
+    def test_compare_must_report_only_the_cases_slower_than_the_tolerance(self):
+        baseline = {'fast': {'10': {'ops_per_second': 100.0, 'blocks_per_op': 1.0}},
+                    'slow': {'10': {'ops_per_second': 100.0, 'blocks_per_op': 1.0}}}
+        results = {'fast': {'10': {'ops_per_second': 90.0, 'blocks_per_op': 1.0}},
+                   'slow': {'10': {'ops_per_second': 50.0, 'blocks_per_op': 1.0}},
+                   'new': {'10': {'ops_per_second': 1.0, 'blocks_per_op': 1.0}}}
+        assert compare(results, baseline, tolerance=0.25) == ['slow[10]']
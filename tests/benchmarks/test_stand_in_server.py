@@ -0,0 +1,60 @@
+import datetime
+import time
+
+import pytest
+
+from beach_resort_reservation.app import App
+from beach_resort_reservation.decoding import reservation_from_json
+from beach_resort_reservation.domain import Username, Password, Email, NewReservation, NumberOfSeats, \
+    ReservedUmbrellaID, ReservationID
+from beach_resort_reservation.transport import Transport
+from benchmarks.stand_in_server import running_stand_in_server, TOKEN
+
+
+@pytest.fixture
+def server():
+    with running_stand_in_server(dataset_size=120) as stand_in_server:
+        yield stand_in_server
+
+
+@pytest.fixture
+def app(server):
+    transport = Transport(base_url=server.base_url)
+    transport.authorize(TOKEN)
+    yield App(transport=transport)
+    transport.close()
+
+
+class TestStandInServer:
+    def test_generated_dataset_must_be_decodable_by_the_app(self, app):
+        response = app.do_retrieve_reservation_list_request()
+        reservations = [reservation_from_json(elem) for elem in response.json()]
+        assert len(reservations) == 120
+        assert len({reservation.umbrella_id for reservation in reservations}) == 51
+
+    def test_registration_must_refuse_a_username_already_taken(self, app):
+        def register():
+            return app.do_registration_request(Username('cris'), Password('Password1!'), Password('Password1!'),
+                                               Email('cris@example.com'))
+
+        assert register().json() == {'key': TOKEN}
+        response = register()
+        assert response.status_code == 400
+        assert 'username' in response.json()
+
+    def test_create_and_delete_must_answer_like_the_api(self, app):
+        today = datetime.date.today()
+        response = app.do_new_reservation_request(NewReservation(NumberOfSeats(2), ReservedUmbrellaID(1), today,
+                                                                 today))
+        assert response.status_code == 201
+        created = reservation_from_json(response.json())
+        assert app.do_reservation_delete_request(created.id).status_code == 204
+        assert app.do_reservation_delete_request(ReservationID(created.id.value)).status_code == 404
+
+    def test_every_response_must_be_delayed_by_the_injected_latency(self):
+        with running_stand_in_server(latency_seconds=0.05) as server:
+            transport = Transport(base_url=server.base_url)
+            started_at = time.perf_counter()
+            App(transport=transport).do_login_request('cris', 'password')
+            assert time.perf_counter() - started_at >= 0.05
+            transport.close()